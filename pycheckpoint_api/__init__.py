@@ -4,3 +4,6 @@ __contributors__ = []
 __version__ = "1.1.4"
 
 from pycheckpoint_api.management import Management  # noqa
+from pycheckpoint_api.management.async_management import ThreadPoolManagement  # noqa
+from pycheckpoint_api.management.session_pool import SessionPool  # noqa
+from pycheckpoint_api.snapshot import Snapshot  # noqa
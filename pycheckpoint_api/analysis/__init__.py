@@ -0,0 +1,7 @@
+from pycheckpoint_api.analysis.address_index import AddressIndex  # noqa
+from pycheckpoint_api.analysis.duplicates import DuplicateDetector  # noqa
+from pycheckpoint_api.analysis.group_resolver import GroupResolver  # noqa
+from pycheckpoint_api.analysis.nat_simulator import NatSimulator, Translation  # noqa
+from pycheckpoint_api.analysis.rule_match import Flow, RuleMatcher  # noqa
+from pycheckpoint_api.analysis.service_index import ServicePortIndex  # noqa
+from pycheckpoint_api.analysis.where_used import Usage, WhereUsedIndex  # noqa
@@ -0,0 +1,403 @@
+import bisect
+import ipaddress
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+
+class Interval(NamedTuple):
+    """IP addresses covered by an object, as integers of an address family"""
+
+    version: int
+    first: int
+    last: int
+    # Bits of the address ignored by a wildcard object: the interval is then only a bounding range
+    wildcard: Optional[int] = None
+
+    def contains(self, value: int) -> bool:
+        if not self.first <= value <= self.last:
+            return False
+        return self.wildcard is None or (value & ~self.wildcard) == self.first
+
+    def first_from(self, value: int) -> Optional[int]:
+        """Returns the first address of the interval from a value, None if there is none"""
+        if value <= self.first:
+            return self.first
+        if self.contains(value):
+            return value
+        if self.wildcard is None or value > self.last:
+            return None
+        # The lowest bit which can be raised above the value gives the next matching address
+        for i in range(32 if self.version == 4 else 128):
+            bit = 1 << i
+            if value & bit or not (self.wildcard & bit or self.first & bit):
+                continue
+            above = ~((bit << 1) - 1)
+            if value & ~self.wildcard & above != self.first & above:
+                continue
+            return (value & above) | bit | (self.first & (bit - 1))
+        return None
+
+    def overlaps(self, first: int, last: int) -> bool:
+        match = self.first_from(first)
+        return match is not None and match <= last
+
+
+def to_address(
+    version: int, value: int
+) -> Union[ipaddress.IPv4Address, ipaddress.IPv6Address]:
+    """This function is used to get back the address of an integer of an address family
+
+    Args:
+        version (int): Address family, 4 or 6
+        value (int): The address as an integer
+
+    Returns:
+        Union[IPv4Address, IPv6Address]: the address
+
+    Examples:
+        >>> str(to_address(4, 3221225985))
+        "192.0.2.1"
+    """
+    return (
+        ipaddress.IPv4Address(value) if version == 4 else ipaddress.IPv6Address(value)
+    )
+
+
+def field(obj: Any, key: str) -> Any:
+    """This function is used to read a field of an object, whatever its shape: a dictionary or a Box with the keys\
+    of the server, or a record with attribute names
+
+    Args:
+        obj (Any): The object
+        key (str): Key of the field, as returned by the server
+
+    Returns:
+        Any: the value of the field, or None if it's missing
+
+    Examples:
+        >>> field(HostRecord(ipv4_address="192.0.2.1"), "ipv4-address")
+        "192.0.2.1"
+    """
+    if isinstance(obj, dict):
+        return dict.get(obj, key)
+    return getattr(obj, key.replace("-", "_"), None)
+
+
+def address_intervals(obj: Any) -> List[Interval]:
+    """This function is used to get the IP addresses covered by a host, a network, an address range, a multicast\
+    address range or a wildcard
+
+    Args:
+        obj (Any): The object, as returned by the server or as a record
+
+    Returns:
+        List[Interval]: one interval per address family. Empty for the other objects
+
+    Examples:
+        >>> address_intervals({"subnet4": "192.0.2.0", "mask-length4": 24})
+        [Interval(version=4, first=3221225984, last=3221226239, wildcard=None)]
+    """
+    intervals = []
+    for version in ("4", "6"):
+        address = field(obj, "ipv" + version + "-address")
+        wildcard = field(obj, "ipv" + version + "-mask-wildcard")
+        if address and wildcard:
+            base = ipaddress.ip_address(address)
+            mask = int(ipaddress.ip_address(wildcard))
+            intervals.append(
+                Interval(base.version, int(base) & ~mask, int(base) | mask, mask)
+            )
+        elif address:
+            ip = ipaddress.ip_address(address)
+            intervals.append(Interval(ip.version, int(ip), int(ip)))
+
+        subnet = field(obj, "subnet" + version)
+        if subnet:
+            network = ipaddress.ip_network(
+                subnet + "/" + str(field(obj, "mask-length" + version)), strict=False
+            )
+            intervals.append(
+                Interval(
+                    network.version,
+                    int(network.network_address),
+                    int(network.broadcast_address),
+                )
+            )
+
+        first = field(obj, "ipv" + version + "-address-first")
+        if first:
+            last = field(obj, "ipv" + version + "-address-last") or first
+            first, last = ipaddress.ip_address(first), ipaddress.ip_address(last)
+            intervals.append(Interval(first.version, int(first), int(last)))
+    return intervals
+
+
+def parse_interval(value: str) -> Interval:
+    """This function is used to read an address, a network or a range of addresses
+
+    Args:
+        value (str): An address ("192.0.2.1"), a network ("192.0.2.0/24") or a range ("192.0.2.1-192.0.2.9")
+
+    Returns:
+        Interval: the addresses
+
+    Examples:
+        >>> parse_interval("192.0.2.0/31")
+        Interval(version=4, first=3221225984, last=3221225985, wildcard=None)
+    """
+    if "-" in value:
+        first, last = (ipaddress.ip_address(v.strip()) for v in value.split("-", 1))
+        if first.version != last.version:
+            raise ValueError(
+                "Both ends of a range must be of the same family: " + value
+            )
+        return Interval(first.version, int(first), int(last))
+    if "/" in value:
+        network = ipaddress.ip_network(value, strict=False)
+        return Interval(
+            network.version,
+            int(network.network_address),
+            int(network.broadcast_address),
+        )
+    ip = ipaddress.ip_address(value)
+    return Interval(ip.version, int(ip), int(ip))
+
+
+class _Segments:
+    """Sorted arrays of the elementary segments of one address family (or of the ports of one protocol). The\
+    boundaries of every interval cut the space into segments: each segment is covered by the same entries from its\
+    first to its last value, so a lookup is a single binary search."""
+
+    __slots__ = ("starts", "covers")
+
+    def __init__(self, entries: List[Tuple[Tuple[Any, int, int], Any]]):
+        events = {}
+        for i, (interval, _) in enumerate(entries):
+            # (key, first, last) tuples, as Interval
+            events.setdefault(interval[1], ([], []))[0].append(i)
+            events.setdefault(interval[2] + 1, ([], []))[1].append(i)
+
+        self.starts = []
+        self.covers = []
+        active = set()
+        shared = {}
+        for boundary in sorted(events):
+            added, removed = events[boundary]
+            active.difference_update(removed)
+            active.update(added)
+            cover = tuple(sorted(active))
+            # Consecutive segments often have the same entries: the tuples are shared
+            cover = shared.setdefault(cover, cover)
+            if self.covers and self.covers[-1] == cover:
+                continue
+            self.starts.append(boundary)
+            self.covers.append(cover)
+
+    def at(self, value: int) -> Tuple[int, ...]:
+        i = bisect.bisect_right(self.starts, value) - 1
+        return self.covers[i] if i >= 0 else ()
+
+    def between(self, first: int, last: int) -> set:
+        i = max(bisect.bisect_right(self.starts, first) - 1, 0)
+        j = bisect.bisect_right(self.starts, last)
+        result = set()
+        for cover in self.covers[i:j]:
+            result.update(cover)
+        return result
+
+
+class AddressIndex:
+    """This class is a local index of the objects holding IP addresses: hosts, networks, address ranges, multicast\
+    address ranges and wildcards. It finds the objects containing an address, overlapping or inside a range, or\
+    matching it exactly, without any request to the management server.
+
+    The intervals of each address family are kept in sorted arrays: a lookup is a binary search, and a batch of\
+    addresses is answered in a single pass over the sorted addresses.
+    """
+
+    def __init__(self, objects: Iterable[Any] = ()):
+        """Constructor of the class
+
+        Args:
+            objects (Iterable[Any], optional): Objects to index, as returned by the server (dictionaries or Box) or\
+            as records. Objects without any address are ignored. Defaults to ()
+
+        Examples:
+            >>> index = AddressIndex(firewall.network_objects.host.iter_hosts(raw=True))
+            >>> index.add_all(firewall.network_objects.network.iter_networks(raw=True))
+        """
+        self._entries = {4: [], 6: []}
+        self._exact = {}
+        self._segments = None
+        self.add_all(objects)
+
+    def __len__(self) -> int:
+        return len(self._entries[4]) + len(self._entries[6])
+
+    def add(self, obj: Any) -> int:
+        """Adds an object to the index
+
+        Args:
+            obj (Any): The object
+
+        Returns:
+            int: the number of intervals added (one per address family, 0 for an object without address)
+
+        Examples:
+            >>> index.add({"uid": "196e93a9", "name": "host1", "ipv4-address": "192.0.2.1"})
+            1
+        """
+        intervals = address_intervals(obj)
+        for interval in intervals:
+            self._entries[interval.version].append((interval, obj))
+            self._exact.setdefault(interval[:3], []).append(obj)
+        if len(intervals) > 0:
+            self._segments = None
+        return len(intervals)
+
+    def add_all(self, objects: Iterable[Any]) -> int:
+        """Adds objects to the index
+
+        Args:
+            objects (Iterable[Any]): The objects
+
+        Returns:
+            int: the number of intervals added
+
+        Examples:
+            >>> index.add_all(snapshot.objects("address_ranges"))
+
+        """
+        return sum(self.add(obj) for obj in objects)
+
+    def contains(self, address: str) -> List[Any]:
+        """Returns the objects containing an address
+
+        Args:
+            address (str): IPv4 or IPv6 address
+
+        Returns:
+            List[Any]: the objects, in the order they were added
+
+        Examples:
+            >>> [o["name"] for o in index.contains("192.0.2.1")]
+            ["host1", "net_192.0.2.0_24"]
+        """
+        ip = ipaddress.ip_address(address)
+        return self._containing(ip.version, int(ip))
+
+    def lookup(self, addresses: Iterable[str]) -> Dict[str, List[Any]]:
+        """Returns the objects containing each address of a batch. The addresses are sorted and the segments are\
+        walked once, instead of a binary search per address.
+
+        Args:
+            addresses (Iterable[str]): IPv4 or IPv6 addresses
+
+        Returns:
+            Dict[str, List[Any]]: the objects containing each address
+
+        Examples:
+            >>> index.lookup(["192.0.2.1", "198.51.100.7"])
+            {"192.0.2.1": [...], "198.51.100.7": []}
+        """
+        segments = self._build()
+        result = {}
+        parsed = sorted(
+            (ip.version, int(ip), address)
+            for address, ip in ((a, ipaddress.ip_address(a)) for a in addresses)
+        )
+        for version in (4, 6):
+            family = segments[version]
+            entries = self._entries[version]
+            i = 0
+            for _, value, address in (p for p in parsed if p[0] == version):
+                while i + 1 < len(family.starts) and family.starts[i + 1] <= value:
+                    i += 1
+                covers = (
+                    family.covers[i]
+                    if len(family.starts) > 0 and family.starts[i] <= value
+                    else ()
+                )
+                result[address] = [
+                    entries[k][1] for k in covers if entries[k][0].contains(value)
+                ]
+        return result
+
+    def overlapping(self, value: str) -> List[Any]:
+        """Returns the objects sharing at least an address with an address, a network or a range
+
+        Args:
+            value (str): An address ("192.0.2.1"), a network ("192.0.2.0/24") or a range ("192.0.2.1-192.0.2.9")
+
+        Returns:
+            List[Any]: the objects, in the order they were added
+
+        Examples:
+            >>> index.overlapping("192.0.2.0/24")
+
+        """
+        interval = parse_interval(value)
+        entries = self._entries[interval.version]
+        return [
+            entries[k][1]
+            for k in sorted(
+                self._build()[interval.version].between(interval.first, interval.last)
+            )
+            if entries[k][0].overlaps(interval.first, interval.last)
+        ]
+
+    def within(self, value: str) -> List[Any]:
+        """Returns the objects whose addresses are all inside a network or a range
+
+        Args:
+            value (str): An address ("192.0.2.1"), a network ("192.0.2.0/24") or a range ("192.0.2.1-192.0.2.9")
+
+        Returns:
+            List[Any]: the objects, in the order they were added
+
+        Examples:
+            >>> index.within("10.0.0.0/8")
+
+        """
+        interval = parse_interval(value)
+        entries = self._entries[interval.version]
+        return [
+            entries[k][1]
+            for k in sorted(
+                self._build()[interval.version].between(interval.first, interval.last)
+            )
+            if interval.first <= entries[k][0].first
+            and entries[k][0].last <= interval.last
+        ]
+
+    def exact(self, value: str) -> List[Any]:
+        """Returns the objects covering exactly an address, a network or a range
+
+        Args:
+            value (str): An address ("192.0.2.1"), a network ("192.0.2.0/24") or a range ("192.0.2.1-192.0.2.9")
+
+        Returns:
+            List[Any]: the objects, in the order they were added
+
+        Examples:
+            >>> index.exact("192.0.2.0/24")
+
+        """
+        interval = parse_interval(value)
+        return list(self._exact.get(interval[:3], []))
+
+    def _containing(self, version: int, value: int) -> List[Any]:
+        entries = self._entries[version]
+        return [
+            entries[k][1]
+            for k in self._build()[version].at(value)
+            if entries[k][0].contains(value)
+        ]
+
+    def _build(self) -> Dict[int, _Segments]:
+        """Builds the segments after the last addition"""
+        if self._segments is None:
+            self._segments = {
+                version: _Segments(entries)
+                for version, entries in self._entries.items()
+            }
+        return self._segments
@@ -0,0 +1,144 @@
+from typing import Any, Iterable, List, NamedTuple, Tuple
+
+from pycheckpoint_api.analysis.address_index import address_intervals, field
+from pycheckpoint_api.analysis.intervals import service_ports
+
+
+class Containment(NamedTuple):
+    """An object whose addresses (or ports) are inside the addresses of another object"""
+
+    object: Any
+    container: Any
+    # The (version or protocol, first, last) values of the object
+    interval: Tuple[Any, int, int]
+
+
+class DuplicateDetector:
+    """This class finds the redundant objects of a domain: hosts, networks, address ranges, wildcards and services.
+
+    * Duplicates are objects covering exactly the same addresses, or the same ports. The objects are hashed on their\
+      addresses (or ports), so they are found in a single pass.
+    * Contained objects are objects whose addresses (or ports) are inside another object, like a host in a network.\
+      The intervals are sorted once and swept with a stack of nested intervals, each of them pushed and popped at\
+      most once: the innermost container of each interval is found in O(n log n), without comparing the objects\
+      pairwise.
+
+    Objects are streamed: only their keys and intervals are kept along with the objects.
+    """
+
+    def __init__(self, objects: Iterable[Any] = (), by_type: bool = False):
+        """Constructor of the class
+
+        Args:
+            objects (Iterable[Any], optional): Objects, as returned by the server (dictionaries or Box) or as\
+            records. Objects without addresses nor ports are ignored. Defaults to ()
+            by_type (bool, optional): Only objects of the same type are duplicates (a host and an address range of\
+            a single address are then not reported). Defaults to False
+
+        Examples:
+            >>> detector = DuplicateDetector(firewall.network_objects.host.iter_hosts(raw=True))
+            >>> detector.add_all(firewall.network_objects.network.iter_networks(raw=True))
+        """
+        self.by_type = by_type
+        self._count = 0
+        self._keys = {}
+        self._intervals = {}
+        self.add_all(objects)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, obj: Any) -> bool:
+        """Adds an object
+
+        Args:
+            obj (Any): The object
+
+        Returns:
+            bool: True if the object holds addresses or ports, False if it's ignored
+
+        Examples:
+            >>> detector.add({"uid": "196e93a9", "name": "host1", "ipv4-address": "192.0.2.1"})
+            True
+        """
+        addresses = address_intervals(obj)
+        if len(addresses) > 0:
+            intervals = tuple(sorted(tuple(i) for i in addresses))
+            ranges = [i[:3] for i in addresses if i.wildcard is None]
+            category = "address"
+        else:
+            intervals = tuple(sorted(service_ports(obj)))
+            ranges = list(intervals)
+            category = "service"
+        if len(intervals) == 0:
+            return False
+
+        key = (category, field(obj, "type") if self.by_type else None, intervals)
+        self._keys.setdefault(key, []).append(obj)
+        for interval in ranges:
+            self._intervals.setdefault((category,) + interval, []).append(obj)
+        self._count += 1
+        return True
+
+    def add_all(self, objects: Iterable[Any]) -> int:
+        """Adds objects
+
+        Args:
+            objects (Iterable[Any]): The objects
+
+        Returns:
+            int: the number of objects holding addresses or ports
+
+        Examples:
+            >>> detector.add_all(snapshot.objects("address_ranges"))
+
+        """
+        return sum(self.add(obj) for obj in objects)
+
+    def duplicates(self) -> List[List[Any]]:
+        """Returns the groups of objects covering exactly the same addresses, or the same ports
+
+        Returns:
+            List[List[Any]]: the groups of at least two objects, in the order they were added
+
+        Examples:
+            >>> [[o["name"] for o in group] for group in detector.duplicates()]
+            [["host1", "server1"], ["net_10", "lan"]]
+        """
+        return [list(objects) for objects in self._keys.values() if len(objects) > 1]
+
+    def contained(self) -> List[Containment]:
+        """Returns the objects whose addresses (or ports) are inside another object. Each interval of an object is\
+        reported with its innermost container: a host inside a /24 network inside a /16 network is reported inside\
+        the /24 network only. Duplicates are not reported as contained in each other.
+
+        Returns:
+            List[Containment]: the objects, with their container and the contained interval
+
+        Examples:
+            >>> [(c.object["name"], c.container["name"]) for c in detector.contained()]
+            [("host1", "lan"), ("lan", "site")]
+        """
+        result = []
+        # Sorted by key, then first value, the widest interval first: containers come before what they contain
+        ordered = sorted(
+            self._intervals,
+            key=lambda i: (i[0], str(i[1]), i[2], -i[3]),
+        )
+        # Each interval of the stack contains the ones above it
+        stack = []
+        for interval in ordered:
+            # Intervals ending before the current one are closed. Those partially overlapping it are dropped too:
+            # what they contain from now on is also inside the current interval, which is innermost
+            while len(stack) > 0 and (
+                stack[-1][:2] != interval[:2] or stack[-1][3] < interval[3]
+            ):
+                stack.pop()
+            if len(stack) > 0:
+                container = self._intervals[stack[-1]][0]
+                result.extend(
+                    Containment(obj, container, interval[1:])
+                    for obj in self._intervals[interval]
+                )
+            stack.append(interval)
+        return result
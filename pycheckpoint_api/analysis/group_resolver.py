@@ -0,0 +1,370 @@
+import logging
+from typing import Any, Callable, FrozenSet, Iterable, List, Optional
+
+from pycheckpoint_api.analysis.address_index import field
+from pycheckpoint_api.analysis.intervals import (
+    IntervalSet,
+    merge_intervals,
+    object_addresses,
+    service_ports,
+    subtract_intervals,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _uid(value: Any) -> Optional[str]:
+    return field(value, "uid") if not isinstance(value, str) else value
+
+
+class _Kind:
+    """How the value of a group is computed from the values of its members"""
+
+    def __init__(
+        self,
+        leaf: Callable[[str], Any],
+        union: Callable[[Iterable[Any]], Any],
+        subtract: Callable[[Any, Any], Any],
+        group: Callable[[str], Any] = None,
+    ):
+        self.leaf = leaf
+        self.union = union
+        self.subtract = subtract
+        # Value added by a nested group itself, on top of the values of its members
+        self.group = group
+
+
+class GroupResolver:
+    """This class flattens nested groups: groups, groups with exclusion, service groups, application site groups and\
+    time groups. The groups are loaded once from the exports, then the transitive members of each group are computed\
+    on the first query and memoized, so the following queries don't need any request nor any recursion.
+
+    * Cycles are supported: the groups of a cycle have the same members
+    * Groups with exclusion hold the members of their ``include`` group which are not members of their ``except``\
+      group. Their addresses are computed by removing the addresses of the ``except`` group.
+    """
+
+    def __init__(self, objects: Iterable[Any] = ()):
+        """Constructor of the class
+
+        Args:
+            objects (Iterable[Any], optional): Groups and any other objects, as returned by the server (dictionaries\
+            or Box) with ``details_level`` "standard" or "full", or as records. Defaults to ()
+
+        Examples:
+            >>> resolver = GroupResolver(firewall.network_objects.group.iter_groups(raw=True, details_level="full"))
+            >>> resolver.add_all(firewall.network_objects.host.iter_hosts(raw=True))
+        """
+        self._objects = {}
+        self._names = {}
+        self._memo = {}
+        self._resolving = set()
+        self._kinds = {
+            "members": _Kind(
+                leaf=lambda uid: frozenset((uid,)),
+                union=lambda values: frozenset().union(*values),
+                subtract=lambda value, removed: value - removed,
+            ),
+            "groups": _Kind(
+                leaf=lambda uid: frozenset(),
+                union=lambda values: frozenset().union(*values),
+                subtract=lambda value, removed: value - removed,
+                group=lambda uid: frozenset((uid,)),
+            ),
+            "addresses": _Kind(
+                leaf=lambda uid: object_addresses(self._objects[uid])
+                if uid in self._objects
+                else (),
+                union=lambda values: merge_intervals(i for v in values for i in v),
+                subtract=subtract_intervals,
+            ),
+            "ports": _Kind(
+                leaf=lambda uid: merge_intervals(service_ports(self._objects[uid]))
+                if uid in self._objects
+                else (),
+                union=lambda values: merge_intervals(i for v in values for i in v),
+                subtract=subtract_intervals,
+            ),
+        }
+        self.add_all(objects)
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def __contains__(self, value: str) -> bool:
+        return self._find(value) is not None
+
+    def add(self, obj: Any):
+        """Adds an object. The memoized results are dropped.
+
+        Args:
+            obj (Any): The object, a uid only being ignored
+
+        Examples:
+            >>> resolver.add({"uid": "196e93a9", "name": "group1", "members": ["host-uid"]})
+
+        """
+        uid = _uid(obj)
+        if uid is None or isinstance(obj, str):
+            return
+        self._objects[uid] = obj
+        name = field(obj, "name")
+        if name is not None:
+            self._names[name] = uid
+        self._memo.clear()
+
+    def add_all(self, objects: Iterable[Any]):
+        """Adds objects. The memoized results are dropped.
+
+        Args:
+            objects (Iterable[Any]): The objects
+
+        Examples:
+            >>> resolver.add_all(snapshot.objects("groups"))
+
+        """
+        for obj in objects:
+            self.add(obj)
+
+    def get(self, value: str) -> Any:
+        """Returns an object by uid or name
+
+        Args:
+            value (str): Uid or name of the object
+
+        Returns:
+            Any: the object, or None if it's unknown
+
+        Examples:
+            >>> resolver.get("group1")
+
+        """
+        uid = self._find(value)
+        return self._objects[uid] if uid is not None else None
+
+    def is_group(self, value: str) -> bool:
+        """Tells if an object is a group (including a group with exclusion)
+
+        Args:
+            value (str): Uid or name of the object
+
+        Returns:
+            bool: True for a group
+
+        Examples:
+            >>> resolver.is_group("group1")
+            True
+        """
+        uid = self._find(value)
+        return uid is not None and (self._is_group(uid) or self._is_exclusion(uid))
+
+    def members(self, group: str) -> FrozenSet[str]:
+        """Returns the uids of the members of a group, nested groups being replaced by their own members
+
+        Args:
+            group (str): Uid or name of the group
+
+        Returns:
+            FrozenSet[str]: the uids of the members which are not groups, including the members not loaded
+
+        Examples:
+            >>> resolver.members("group1")
+            frozenset({"host-uid", "network-uid"})
+        """
+        return self._resolve(self._require(group), "members")
+
+    def member_objects(self, group: str) -> List[Any]:
+        """Returns the members of a group, nested groups being replaced by their own members
+
+        Args:
+            group (str): Uid or name of the group
+
+        Returns:
+            List[Any]: the loaded members which are not groups, sorted by name
+
+        Examples:
+            >>> [o["name"] for o in resolver.member_objects("group1")]
+            ["host1", "net1"]
+        """
+        objects = [
+            self._objects[uid] for uid in self.members(group) if uid in self._objects
+        ]
+        return sorted(objects, key=lambda o: str(field(o, "name")))
+
+    def nested_groups(self, group: str) -> FrozenSet[str]:
+        """Returns the uids of the groups nested in a group, directly or through other nested groups
+
+        Args:
+            group (str): Uid or name of the group
+
+        Returns:
+            FrozenSet[str]: the uids of the nested groups. A group is nested in itself only when it's part of a\
+            cycle. The nested groups of the ``except`` group of a group with exclusion are removed
+
+        Examples:
+            >>> resolver.nested_groups("group1")
+            frozenset({"group2-uid", "group3-uid"})
+        """
+        return self._resolve(self._require(group), "groups")
+
+    def contains(self, group: str, member: str) -> bool:
+        """Tells if an object is a member of a group, directly or through nested groups
+
+        Args:
+            group (str): Uid or name of the group
+            member (str): Uid or name of the member, which may be a nested group
+
+        Returns:
+            bool: True if it's a member
+
+        Examples:
+            >>> resolver.contains("group1", "host1")
+            True
+        """
+        uid = self._find(member)
+        uid = uid if uid is not None else member
+        return uid in self.members(group) or uid in self.nested_groups(group)
+
+    def addresses(self, group: str) -> IntervalSet:
+        """Returns the addresses of the members of a group, as merged intervals
+
+        Args:
+            group (str): Uid or name of the group
+
+        Returns:
+            IntervalSet: the (version, first, last) addresses, as integers
+
+        Examples:
+            >>> resolver.addresses("group1")
+            ((4, 3221225984, 3221226239),)
+        """
+        return self._resolve(self._require(group), "addresses")
+
+    def ports(self, group: str) -> IntervalSet:
+        """Returns the ports of the TCP, UDP and SCTP services of a service group, as merged intervals
+
+        Args:
+            group (str): Uid or name of the service group
+
+        Returns:
+            IntervalSet: the (protocol, first, last) ports
+
+        Examples:
+            >>> resolver.ports("web")
+            (("tcp", 80, 80), ("tcp", 443, 443))
+        """
+        return self._resolve(self._require(group), "ports")
+
+    def _find(self, value: str) -> Optional[str]:
+        if value in self._objects:
+            return value
+        return self._names.get(value)
+
+    def _require(self, value: str) -> str:
+        uid = self._find(value)
+        if uid is None:
+            raise KeyError("Unknown object: " + str(value))
+        return uid
+
+    def _is_group(self, uid: str) -> bool:
+        obj = self._objects.get(uid)
+        return obj is not None and field(obj, "members") is not None
+
+    def _is_exclusion(self, uid: str) -> bool:
+        obj = self._objects.get(uid)
+        return obj is not None and field(obj, "include") is not None
+
+    def _members(self, uid: str) -> List[str]:
+        return [_uid(m) for m in field(self._objects[uid], "members") or []]
+
+    def _value(self, uid: str, kind: str) -> Any:
+        """Value of a member which is not part of the cycles being resolved"""
+        if not self._is_group(uid) and not self._is_exclusion(uid):
+            return self._kinds[kind].leaf(uid)
+        value = self._resolve(uid, kind)
+        if self._kinds[kind].group is not None:
+            value = self._kinds[kind].union([value, self._kinds[kind].group(uid)])
+        return value
+
+    def _resolve(self, uid: str, kind: str) -> Any:
+        memo = self._memo.setdefault(kind, {})
+        if uid in memo:
+            return memo[uid]
+        if self._is_exclusion(uid):
+            return self._resolve_exclusion(uid, kind)
+        if not self._is_group(uid):
+            memo[uid] = self._kinds[kind].leaf(uid)
+            return memo[uid]
+
+        # Tarjan's algorithm: the groups of a cycle are resolved together
+        index, low, stack, on_stack = {}, {}, [], set()
+        work = [(uid, iter(self._members(uid)))]
+        index[uid] = low[uid] = 0
+        stack.append(uid)
+        on_stack.add(uid)
+        while work:
+            node, children = work[-1]
+            child = next(children, None)
+            if child is not None:
+                if not self._is_group(child) or child in memo:
+                    continue
+                if child not in index:
+                    index[child] = low[child] = len(index)
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(self._members(child))))
+                elif child in on_stack:
+                    low[node] = min(low[node], index[child])
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[node])
+            if low[node] != index[node]:
+                continue
+
+            component = set()
+            while True:
+                member = stack.pop()
+                on_stack.discard(member)
+                component.add(member)
+                if member == node:
+                    break
+            values = [
+                self._value(m, kind)
+                for group in component
+                for m in self._members(group)
+                if m not in component
+            ]
+            if self._kinds[kind].group is not None:
+                values.extend(
+                    self._kinds[kind].group(m)
+                    for group in component
+                    for m in self._members(group)
+                    if m in component
+                )
+            value = self._kinds[kind].union(values)
+            for group in component:
+                memo[group] = value
+        return memo[uid]
+
+    def _resolve_exclusion(self, uid: str, kind: str) -> Any:
+        if uid in self._resolving:
+            logger.warning(
+                "Group with exclusion " + uid + " is part of a cycle, ignored"
+            )
+            return self._kinds[kind].union([])
+        self._resolving.add(uid)
+        try:
+            obj = self._objects[uid]
+            include = self._value(_uid(field(obj, "include")), kind)
+            excluded = field(obj, "except")
+            if excluded is not None:
+                include = self._kinds[kind].subtract(
+                    include, self._value(_uid(excluded), kind)
+                )
+        finally:
+            self._resolving.discard(uid)
+        self._memo[kind][uid] = include
+        return include
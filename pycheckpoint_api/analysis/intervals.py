@@ -0,0 +1,160 @@
+from typing import Any, Iterable, List, Optional, Tuple
+
+from pycheckpoint_api.analysis.address_index import address_intervals, field
+
+# Protocol of the services holding ports, by object type
+PORT_PROTOCOLS = {
+    "service-tcp": "tcp",
+    "service-udp": "udp",
+    "service-sctp": "sctp",
+}
+
+# Protocol of the ICMP services, whose ICMP type is used as the port
+ICMP_PROTOCOLS = {
+    "service-icmp": "icmp",
+    "service-icmp6": "icmp6",
+}
+
+# Name of the IP protocols of the other services
+PROTOCOL_NAMES = {1: "icmp", 6: "tcp", 17: "udp", 58: "icmp6", 132: "sctp"}
+
+MAX_PORT = 65535
+
+# A set of intervals: sorted and merged (key, first, last) tuples, the key being an address family or a protocol
+IntervalSet = Tuple[Tuple[Any, int, int], ...]
+
+
+def merge_intervals(intervals: Iterable[Tuple[Any, int, int]]) -> IntervalSet:
+    """This function is used to merge overlapping and adjacent intervals
+
+    Args:
+        intervals (Iterable[Tuple[Any, int, int]]): (key, first, last) intervals, only merged with the intervals\
+        of the same key
+
+    Returns:
+        IntervalSet: the sorted and merged intervals
+
+    Examples:
+        >>> merge_intervals([("tcp", 80, 80), ("tcp", 81, 90), ("udp", 53, 53)])
+        (("tcp", 80, 90), ("udp", 53, 53))
+    """
+    merged = []
+    for key, first, last in sorted(intervals, key=lambda i: (str(i[0]), i[1], i[2])):
+        if merged and merged[-1][0] == key and first <= merged[-1][2] + 1:
+            if last > merged[-1][2]:
+                merged[-1] = (key, merged[-1][1], last)
+        else:
+            merged.append((key, first, last))
+    return tuple(merged)
+
+
+def subtract_intervals(
+    intervals: IntervalSet, removed: Iterable[Tuple[Any, int, int]]
+) -> IntervalSet:
+    """This function is used to remove intervals from a set of intervals
+
+    Args:
+        intervals (IntervalSet): The sorted and merged intervals
+        removed (Iterable[Tuple[Any, int, int]]): The intervals to remove
+
+    Returns:
+        IntervalSet: the remaining intervals
+
+    Examples:
+        >>> subtract_intervals(((4, 0, 255),), [(4, 10, 19)])
+        ((4, 0, 9), (4, 20, 255))
+    """
+    result = []
+    removed = merge_intervals(removed)
+    for key, first, last in intervals:
+        for other_key, other_first, other_last in removed:
+            if other_key != key or other_last < first or other_first > last:
+                continue
+            if other_first > first:
+                result.append((key, first, other_first - 1))
+            first = other_last + 1
+            if first > last:
+                break
+        if first <= last:
+            result.append((key, first, last))
+    return tuple(result)
+
+
+def parse_ports(value: Any) -> Optional[Tuple[int, int]]:
+    """This function is used to read the ports of a service
+
+    Args:
+        value (Any): The ``port`` field: "80", "1000-2000", ">1023" or "<1024"
+
+    Returns:
+        Optional[Tuple[int, int]]: the first and last ports, None if there is no port
+
+    Examples:
+        >>> parse_ports(">1023")
+        (1024, 65535)
+    """
+    if value is None or str(value).strip() == "":
+        return None
+    value = str(value).strip()
+    if value.startswith(">="):
+        return int(value[2:]), MAX_PORT
+    if value.startswith("<="):
+        return 0, int(value[2:])
+    if value.startswith(">"):
+        return int(value[1:]) + 1, MAX_PORT
+    if value.startswith("<"):
+        return 0, int(value[1:]) - 1
+    first, _, last = value.partition("-")
+    return int(first), int(last or first)
+
+
+def service_ports(obj: Any) -> List[Tuple[str, int, int]]:
+    """This function is used to get the ports of a TCP, UDP or SCTP service. The ICMP type of an ICMP service is\
+    used as its port, and an other service covers every port of its IP protocol.
+
+    Args:
+        obj (Any): The service, as returned by the server or as a record
+
+    Returns:
+        List[Tuple[str, int, int]]: the (protocol, first, last) ports. Empty for the other objects
+
+    Examples:
+        >>> service_ports({"type": "service-tcp", "port": "8080-8090"})
+        [("tcp", 8080, 8090)]
+    """
+    kind = field(obj, "type")
+    if kind == "service-other":
+        number = field(obj, "ip-protocol")
+        if number is None or str(number) == "":
+            return []
+        return [(PROTOCOL_NAMES.get(int(number), str(number)), 0, MAX_PORT)]
+    if kind in ICMP_PROTOCOLS:
+        icmp_type = field(obj, "icmp-type")
+        return (
+            [(ICMP_PROTOCOLS[kind], icmp_type, icmp_type)]
+            if icmp_type is not None
+            else []
+        )
+    protocol = PORT_PROTOCOLS.get(kind)
+    ports = parse_ports(field(obj, "port")) if protocol is not None else None
+    return [(protocol, ports[0], ports[1])] if ports is not None else []
+
+
+def object_addresses(obj: Any) -> IntervalSet:
+    """This function is used to get the addresses of an object as a set of intervals
+
+    Args:
+        obj (Any): The object, as returned by the server or as a record
+
+    Returns:
+        IntervalSet: the (version, first, last) addresses. Wildcards, which don't cover a range, are left out
+
+    Examples:
+        >>> object_addresses({"subnet4": "192.0.2.0", "mask-length4": 24})
+        ((4, 3221225984, 3221226239),)
+    """
+    return merge_intervals(
+        (i.version, i.first, i.last)
+        for i in address_intervals(obj)
+        if i.wildcard is None
+    )
@@ -0,0 +1,393 @@
+import ipaddress
+from typing import Any, Iterable, List, NamedTuple, Optional, Tuple
+
+from pycheckpoint_api.analysis.address_index import field, to_address
+from pycheckpoint_api.analysis.group_resolver import GroupResolver
+from pycheckpoint_api.analysis.intervals import IntervalSet, object_addresses
+from pycheckpoint_api.analysis.rule_match import (
+    ANY_OBJECT,
+    Flow,
+    RuleMatcher,
+    flatten_rulebase,
+)
+
+# Object used by the automatic rules, added like ANY_OBJECT unless the objects dictionary already holds them
+ORIGINAL_OBJECT = {
+    "uid": "85c0f50f-6d8a-4528-88ab-5fb11d8fe16c",
+    "name": "Original",
+    "type": "Global",
+}
+POLICY_TARGETS = "Policy Targets"
+
+# Order of the automatic rules of each kind of object
+AUTO_RULE_ORDER = {"host": 0, "address-range": 1, "network": 2}
+
+
+class Translation(NamedTuple):
+    """A connection after the NAT rules"""
+
+    # Matched rules: the first matching rule, and an automatic rule translating the other side with bidirectional NAT.
+    # Empty if no rule matches
+    rules: Tuple[dict, ...]
+    # Translated addresses. The source is None when hidden behind a gateway whose address is unknown
+    source: Optional[str]
+    destination: Optional[str]
+    port: Optional[int]
+    protocol: str
+
+
+class _Target(NamedTuple):
+    """Translation of a rule: the translated and original addresses of each translated side, and the port"""
+
+    automatic: bool
+    static: bool
+    sides: Tuple[str, ...]
+    source: Optional[Tuple[IntervalSet, IntervalSet]]
+    destination: Optional[Tuple[IntervalSet, IntervalSet]]
+    port: Optional[int]
+
+
+class _NatMatcher(RuleMatcher):
+    """Rule matcher on the original fields of the NAT rules"""
+
+    _fields = ("original-source", "original-destination", "original-service")
+
+
+def _uid(value: Any) -> Optional[str]:
+    return value if value is None or isinstance(value, str) else field(value, "uid")
+
+
+class NatSimulator:
+    """This class evaluates a NAT rulebase locally: it returns the rule matching each connection, and the translated\
+    addresses and port.
+
+    The manual rules come from the exported rulebase. The automatic rules are generated from the ``nat-settings`` of\
+    the hosts, networks and address ranges: static rules (source, then destination) before hide rules, hosts before\
+    address ranges before networks. They replace the automatic rules of the export, at the same position, or follow\
+    the manual rules if the export holds none.
+
+    The rules are compiled like the access rules of ``RuleMatcher``, so a batch of connections is matched with a few\
+    binary searches each. Static NAT keeps the offset of an address in its network or range; hide NAT gives the\
+    translated address. Only the destination port is translated: the source port chosen by hide NAT is not simulated.
+    """
+
+    def __init__(
+        self,
+        rulebase: Any,
+        objects: Iterable[Any] = (),
+        gateway: str = None,
+        bidirectional: bool = True,
+    ):
+        """Constructor of the class
+
+        Args:
+            rulebase (Any): The NAT rulebase, as returned by ``show_nat_rulebase(show_all=True)`` with its\
+            ``objects-dictionary``, or the list of its rules
+            objects (Iterable[Any], optional): The hosts, networks and address ranges with their ``nat-settings``\
+            (``details_level="full"``), the groups and the gateways. Defaults to ()
+            gateway (str, optional): Uid or name of the gateway the connections go through. Rules not installed on it\
+            are ignored, and its address is used by the rules hiding behind the gateway. Defaults to None
+            bidirectional (bool, optional): When an automatic rule translates only one side of a connection, an\
+            automatic rule translating the other side applies as well. Defaults to True
+
+        Examples:
+            >>> rulebase = firewall.access_control_nat.nat_rule.show_nat_rulebase(package="standard", show_all=True)
+            >>> hosts = firewall.network_objects.host.iter_hosts(details_level="full")
+            >>> simulator = NatSimulator(rulebase, hosts, gateway="gw1")
+            >>> simulator.translate("10.0.0.5", "203.0.113.10", 443).source
+            "198.51.100.5"
+        """
+        if isinstance(rulebase, dict):
+            rules = list(flatten_rulebase(rulebase.get("rulebase", [])))
+            dictionary = rulebase.get("objects-dictionary", [])
+        else:
+            rules = list(flatten_rulebase(rulebase))
+            dictionary = []
+
+        self._resolver = GroupResolver([ANY_OBJECT, ORIGINAL_OBJECT])
+        self._resolver.add_all(dictionary)
+        objects = list(objects)
+        self._resolver.add_all(objects)
+        self.bidirectional = bidirectional
+        self._gateway = self._resolver.get(gateway) if gateway is not None else None
+        if gateway is not None and self._gateway is None:
+            raise KeyError("Unknown gateway: " + str(gateway))
+
+        automatic = self._auto_rules(objects)
+        if len(automatic) > 0:
+            position = next(
+                (i for i, r in enumerate(rules) if field(r, "auto-generated")),
+                len(rules),
+            )
+            manual = [r for r in rules if not field(r, "auto-generated")]
+            rules = manual[:position] + automatic + manual[position:]
+
+        self._matcher = _NatMatcher(
+            [r for r in rules if self._installed(r)], resolver=self._resolver
+        )
+        self.rules = self._matcher.rules
+        self._targets = [self._target(r) for r in self.rules]
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def translate(
+        self, source: str, destination: str, port: int = None, protocol: str = "tcp"
+    ) -> Translation:
+        """Returns a connection after the NAT rules
+
+        Args:
+            source (str): Source address
+            destination (str): Destination address
+            port (int, optional): Destination port. None to ignore the services. Defaults to None
+            protocol (str, optional): "tcp", "udp", "sctp", "icmp" or "icmp6". Defaults to "tcp"
+
+        Returns:
+            Translation: the matched rules and the translated connection
+
+        Examples:
+            >>> simulator.translate("10.0.0.5", "203.0.113.10", 443)
+            Translation(rules=({...},), source="198.51.100.5", destination="203.0.113.10", port=443, protocol="tcp")
+        """
+        return self._translate(Flow(source, destination, port, protocol), {})
+
+    def translate_all(self, flows: Iterable[Tuple]) -> List[Translation]:
+        """Returns a batch of connections after the NAT rules. The lookups of the addresses and ports shared by\
+        several connections are done once.
+
+        Args:
+            flows (Iterable[Tuple]): The connections, as ``Flow`` or (source, destination, port, protocol) tuples
+
+        Returns:
+            List[Translation]: the matched rules and the translated connection, for each connection
+
+        Examples:
+            >>> [t.destination for t in simulator.translate_all(flows)]
+            ["10.0.0.5", "192.0.2.7", ...]
+        """
+        cache = {}
+        return [self._translate(Flow(*flow), cache) for flow in flows]
+
+    def _translate(self, flow: Flow, cache: dict) -> Translation:
+        bits = self._matcher._match(flow, cache)
+        if not bits:
+            return Translation(
+                (), flow.source, flow.destination, flow.port, flow.protocol
+            )
+
+        lowest = bits & -bits
+        indexes = [lowest.bit_length() - 1]
+        first = self._targets[indexes[0]]
+        if self.bidirectional and first.automatic and len(first.sides) == 1:
+            bits ^= lowest
+            while bits:
+                lowest = bits & -bits
+                other = self._targets[lowest.bit_length() - 1]
+                if (
+                    other.automatic
+                    and len(other.sides) == 1
+                    and other.sides != first.sides
+                ):
+                    indexes.append(lowest.bit_length() - 1)
+                    break
+                bits ^= lowest
+
+        source, destination, port = flow.source, flow.destination, flow.port
+        for i in indexes:
+            target = self._targets[i]
+            if target.source is not None:
+                source = self._address(target.source, target.static, flow.source)
+            if target.destination is not None:
+                destination = self._address(
+                    target.destination, target.static, flow.destination
+                )
+            if target.port is not None and port is not None:
+                port = target.port
+        return Translation(
+            tuple(self.rules[i] for i in indexes),
+            source,
+            destination,
+            port,
+            flow.protocol,
+        )
+
+    def _target(self, rule: dict) -> _Target:
+        """Resolves once the translated objects of a rule"""
+        sides = {}
+        for side in ("source", "destination"):
+            uid = self._translated(rule, side)
+            if uid is not None:
+                original = _uid(field(rule, "original-" + side))
+                sides[side] = (
+                    self._resolver.addresses(uid),
+                    self._resolver.addresses(original)
+                    if original in self._resolver
+                    else (),
+                )
+        port = None
+        service = self._translated(rule, "service")
+        if service is not None:
+            ports = self._resolver.ports(service)
+            port = ports[0][1] if len(ports) > 0 else None
+        return _Target(
+            automatic=bool(field(rule, "auto-generated")),
+            static=field(rule, "method") == "static",
+            sides=tuple(sides),
+            source=sides.get("source"),
+            destination=sides.get("destination"),
+            port=port,
+        )
+
+    def _translated(self, rule: dict, side: str) -> Optional[str]:
+        """Uid of the translated object of a side, None if it's kept as it is"""
+        uid = _uid(field(rule, "translated-" + side))
+        obj = self._resolver.get(uid) if uid is not None else None
+        if obj is None or field(obj, "name") == ORIGINAL_OBJECT["name"]:
+            return None
+        return uid
+
+    @staticmethod
+    def _address(
+        side: Tuple[IntervalSet, IntervalSet], static: bool, value: str
+    ) -> Optional[str]:
+        translated, original = side
+        if len(translated) == 0:
+            return None
+        ip = ipaddress.ip_address(value)
+        target = next((t for t in translated if t[0] == ip.version), translated[0])
+        address = target[1]
+        if static and target[2] > target[1]:
+            # Static NAT of a network or a range: the offset of the address is kept
+            start = next(
+                (
+                    o[1]
+                    for o in original
+                    if o[0] == ip.version and o[1] <= int(ip) <= o[2]
+                ),
+                None,
+            )
+            if start is not None and address + int(ip) - start <= target[2]:
+                address += int(ip) - start
+        return str(to_address(target[0], address))
+
+    def _installed(self, rule: dict) -> bool:
+        if self._gateway is None:
+            return True
+        targets = field(rule, "install-on") or []
+        if isinstance(targets, (str, dict)):
+            targets = [targets]
+        if len(targets) == 0:
+            return True
+        for target in targets:
+            if _uid(target) == "All":
+                return True
+            obj = self._resolver.get(_uid(target))
+            if obj is not None and (
+                field(obj, "name") == POLICY_TARGETS
+                or field(obj, "uid") == field(self._gateway, "uid")
+            ):
+                return True
+        return False
+
+    def _auto_rules(self, objects: List[Any]) -> List[dict]:
+        static, hide = [], []
+        ordered = sorted(
+            (o for o in objects if field(field(o, "nat-settings") or {}, "auto-rule")),
+            key=lambda o: AUTO_RULE_ORDER.get(field(o, "type"), len(AUTO_RULE_ORDER)),
+        )
+        for obj in ordered:
+            settings = field(obj, "nat-settings")
+            uid = field(obj, "uid")
+            base = {
+                "type": "nat-rule",
+                "auto-generated": True,
+                "method": field(settings, "method"),
+                "original-service": ANY_OBJECT["uid"],
+                "translated-service": ORIGINAL_OBJECT["uid"],
+                "install-on": field(settings, "install-on") or [],
+            }
+            if field(settings, "method") == "static":
+                address = self._nat_address(obj, settings)
+                static.append(
+                    {
+                        **base,
+                        "uid": uid + "#static-source",
+                        "name": field(obj, "name"),
+                        "original-source": uid,
+                        "original-destination": ANY_OBJECT["uid"],
+                        "translated-source": address,
+                        "translated-destination": ORIGINAL_OBJECT["uid"],
+                    }
+                )
+                static.append(
+                    {
+                        **base,
+                        "uid": uid + "#static-destination",
+                        "name": field(obj, "name"),
+                        "original-source": ANY_OBJECT["uid"],
+                        "original-destination": address,
+                        "translated-source": ORIGINAL_OBJECT["uid"],
+                        "translated-destination": uid,
+                    }
+                )
+            elif field(settings, "method") == "hide":
+                if field(obj, "type") != "host":
+                    # Connections inside the network or the range are not translated
+                    hide.append(
+                        {
+                            **base,
+                            "uid": uid + "#internal",
+                            "name": field(obj, "name"),
+                            "original-source": uid,
+                            "original-destination": uid,
+                            "translated-source": ORIGINAL_OBJECT["uid"],
+                            "translated-destination": ORIGINAL_OBJECT["uid"],
+                        }
+                    )
+                if field(settings, "hide-behind") == "gateway":
+                    address = self._gateway_address()
+                else:
+                    address = self._nat_address(obj, settings)
+                hide.append(
+                    {
+                        **base,
+                        "uid": uid + "#hide",
+                        "name": field(obj, "name"),
+                        "original-source": uid,
+                        "original-destination": ANY_OBJECT["uid"],
+                        "translated-source": address,
+                        "translated-destination": ORIGINAL_OBJECT["uid"],
+                    }
+                )
+        return static + hide
+
+    def _nat_address(self, obj: Any, settings: Any) -> str:
+        """Adds the object holding the translated addresses of an object, and returns its uid"""
+        uid = field(obj, "uid") + "#nat"
+        nat = {
+            "uid": uid,
+            "name": str(field(obj, "name")) + " (NAT)",
+            "type": "address-range",
+        }
+        hide = field(settings, "method") == "hide"
+        for version, first, last in object_addresses(obj):
+            address = field(settings, "ipv" + str(version) + "-address")
+            if not address:
+                continue
+            start = int(ipaddress.ip_address(address))
+            end = start if hide else start + last - first
+            nat["ipv" + str(version) + "-address-first"] = str(
+                to_address(version, start)
+            )
+            nat["ipv" + str(version) + "-address-last"] = str(to_address(version, end))
+        self._resolver.add(nat)
+        return uid
+
+    def _gateway_address(self) -> str:
+        """Returns the uid of the gateway, or of an object without address if the gateway is unknown"""
+        if self._gateway is not None:
+            return field(self._gateway, "uid")
+        self._resolver.add(
+            {"uid": "#gateway", "name": "Gateway", "type": "simple-gateway"}
+        )
+        return "#gateway"
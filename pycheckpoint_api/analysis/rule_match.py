@@ -0,0 +1,356 @@
+import bisect
+import ipaddress
+import logging
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from pycheckpoint_api.analysis.address_index import field
+from pycheckpoint_api.analysis.group_resolver import GroupResolver
+from pycheckpoint_api.analysis.intervals import (
+    MAX_PORT,
+    IntervalSet,
+    merge_intervals,
+    subtract_intervals,
+)
+
+logger = logging.getLogger(__name__)
+
+# Type of the "Any" object of the rules
+ANY_TYPE = "CpmiAnyObject"
+
+# The "Any" object, the same on every management server
+ANY_OBJECT = {
+    "uid": "97aeb369-9aea-11d5-bd16-0090272ccb30",
+    "name": "Any",
+    "type": ANY_TYPE,
+}
+
+# Address space of each family
+ADDRESS_SPACES = {4: (1 << 32) - 1, 6: (1 << 128) - 1}
+
+# Protocols always indexed, even if no rule names them
+DEFAULT_PROTOCOLS = ("tcp", "udp")
+
+
+class Flow(NamedTuple):
+    """A connection to match against the rules"""
+
+    source: str
+    destination: str
+    # Destination port, or ICMP type. None to ignore the services of the rules
+    port: Optional[int] = None
+    protocol: str = "tcp"
+
+
+def flatten_rulebase(rulebase: Iterable[dict]) -> Iterator[dict]:
+    """This function is used to get the rules of a rulebase, sections being flattened
+
+    Args:
+        rulebase (Iterable[dict]): The ``rulebase`` field of a response, holding rules and sections
+
+    Returns:
+        Iterator[dict]: the rules, in order
+
+    Examples:
+        >>> len(list(flatten_rulebase(response["rulebase"])))
+        120
+    """
+    for item in rulebase:
+        if "rulebase" in item:
+            yield from flatten_rulebase(item["rulebase"])
+        else:
+            yield item
+
+
+def _is_any(value: Any) -> bool:
+    """Whether a value of a field is the "Any" object, even when the objects dictionary doesn't hold it"""
+    if isinstance(value, str):
+        return value in (ANY_OBJECT["uid"], ANY_OBJECT["name"])
+    return field(value, "type") == ANY_TYPE or field(value, "uid") == ANY_OBJECT["uid"]
+
+
+class _Dimension:
+    """Rules matching each value of a field (source, destination or service), as bitsets. The intervals of every\
+    rule cut each space into segments matched by the same rules: a lookup is a single binary search."""
+
+    def __init__(self, spaces: Dict[Any, int], sets: List[Tuple[IntervalSet, bool]]):
+        """Constructor of the class
+
+        Args:
+            spaces (Dict[Any, int]): Last value of each key (address family or protocol)
+            sets (List[Tuple[IntervalSet, bool]]): The intervals matched by each rule, and whether the rule also\
+            matches the keys not in ``spaces``
+        """
+        self.others = 0
+        events = {key: {0: [0, 0]} for key in spaces}
+        for i, (intervals, others) in enumerate(sets):
+            bit = 1 << i
+            if others:
+                self.others |= bit
+            for key, first, last in intervals:
+                events[key].setdefault(first, [0, 0])[0] |= bit
+                if last < spaces[key]:
+                    events[key].setdefault(last + 1, [0, 0])[1] |= bit
+
+        self.starts = {}
+        self.bits = {}
+        for key, boundaries in events.items():
+            starts, bits, current = [], [], 0
+            for boundary in sorted(boundaries):
+                added, removed = boundaries[boundary]
+                current = (current & ~removed) | added
+                if bits and bits[-1] == current:
+                    continue
+                starts.append(boundary)
+                bits.append(current)
+            self.starts[key] = starts
+            self.bits[key] = bits
+
+    def lookup(self, key: Any, value: int) -> int:
+        starts = self.starts.get(key)
+        if starts is None:
+            return self.others
+        return self.bits[key][bisect.bisect_right(starts, value) - 1]
+
+
+class RuleMatcher:
+    """This class compiles an access rulebase to find the rules matching a connection, without any request to the\
+    management server.
+
+    The sources, destinations and services of each rule are resolved once to intervals of addresses and ports,\
+    nested groups included. Each field is then cut into segments matched by the same rules, kept as bitsets: a query\
+    is three binary searches and a bitwise and, the first match being the lowest bit. Negated fields and disabled\
+    rules are taken into account.
+
+    Only addresses, protocols and ports are compared. Objects which can't be expressed as addresses (security zones,\
+    access roles, dynamic objects...) or as ports (applications, other services) match nothing, unless the field is\
+    negated. A rule applying an inline layer is returned as is: the matching rule of the inline layer is not searched.
+    """
+
+    # Fields holding the sources, destinations and services of a rule
+    _fields = ("source", "destination", "service")
+
+    def __init__(
+        self, rulebase: Any, objects: Iterable[Any] = (), resolver: GroupResolver = None
+    ):
+        """Constructor of the class
+
+        Args:
+            rulebase (Any): The rulebase, as returned by ``show_access_rulebase(show_all=True)`` with its\
+            ``objects-dictionary``, or the list of its rules (for instance from ``Snapshot.rules()``). Rules returned\
+            with ``show_as_ranges`` are supported as well.
+            objects (Iterable[Any], optional): More objects, for the groups whose members are not in the objects\
+            dictionary. Defaults to ()
+            resolver (GroupResolver, optional): A resolver already holding the objects. Defaults to None
+
+        Examples:
+            >>> rulebase = firewall.access_control_nat.access_rule.show_access_rulebase(name="Network", show_all=True)
+            >>> matcher = RuleMatcher(rulebase, firewall.network_objects.group.iter_groups(details_level="full"))
+            >>> matcher.match("10.0.0.1", "192.0.2.1", 443)["rule-number"]
+            12
+        """
+        if isinstance(rulebase, dict):
+            rules = flatten_rulebase(rulebase.get("rulebase", []))
+            dictionary = rulebase.get("objects-dictionary", [])
+        else:
+            rules = flatten_rulebase(rulebase)
+            dictionary = []
+
+        self._resolver = resolver if resolver is not None else GroupResolver()
+        self._resolver.add_all(dictionary)
+        self._resolver.add_all(objects)
+
+        self.rules = [r for r in rules if field(r, "enabled") is not False]
+        source, destination, service = self._fields
+        sources = [self._addresses(r, source) for r in self.rules]
+        destinations = [self._addresses(r, destination) for r in self.rules]
+        services = [self._services(r, service) for r in self.rules]
+
+        protocols = set(DEFAULT_PROTOCOLS)
+        for intervals, _ in services:
+            protocols.update(key for key, _, _ in intervals or ())
+        self._sources = _Dimension(ADDRESS_SPACES, sources)
+        self._destinations = _Dimension(ADDRESS_SPACES, destinations)
+        self._services = _Dimension(
+            {p: MAX_PORT for p in protocols},
+            [
+                self._negate(r, service, s, protocols)
+                for r, s in zip(self.rules, services)
+            ],
+        )
+        self._all = (1 << len(self.rules)) - 1
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def match(
+        self, source: str, destination: str, port: int = None, protocol: str = "tcp"
+    ) -> Optional[dict]:
+        """Returns the first rule matching a connection
+
+        Args:
+            source (str): Source address
+            destination (str): Destination address
+            port (int, optional): Destination port, or ICMP type. None to ignore the services. Defaults to None
+            protocol (str, optional): "tcp", "udp", "sctp", "icmp" or "icmp6". Defaults to "tcp"
+
+        Returns:
+            Optional[dict]: the rule, or None if no rule matches
+
+        Examples:
+            >>> matcher.match("10.0.0.1", "192.0.2.1", 53, "udp")["name"]
+            "DNS"
+        """
+        bits = self._match(Flow(source, destination, port, protocol), {})
+        return self.rules[(bits & -bits).bit_length() - 1] if bits else None
+
+    def matches(
+        self, source: str, destination: str, port: int = None, protocol: str = "tcp"
+    ) -> List[dict]:
+        """Returns every rule matching a connection, in order. Only the first one applies.
+
+        Args:
+            source (str): Source address
+            destination (str): Destination address
+            port (int, optional): Destination port, or ICMP type. None to ignore the services. Defaults to None
+            protocol (str, optional): "tcp", "udp", "sctp", "icmp" or "icmp6". Defaults to "tcp"
+
+        Returns:
+            List[dict]: the rules
+
+        Examples:
+            >>> [r["rule-number"] for r in matcher.matches("10.0.0.1", "192.0.2.1", 443)]
+            [12, 40, 97]
+        """
+        bits = self._match(Flow(source, destination, port, protocol), {})
+        result = []
+        while bits:
+            lowest = bits & -bits
+            result.append(self.rules[lowest.bit_length() - 1])
+            bits ^= lowest
+        return result
+
+    def match_all(self, flows: Iterable[Tuple]) -> List[Optional[dict]]:
+        """Returns the first rule matching each connection of a batch. The lookups of the addresses and ports shared\
+        by several connections are done once.
+
+        Args:
+            flows (Iterable[Tuple]): The connections, as ``Flow`` or (source, destination, port, protocol) tuples
+
+        Returns:
+            List[Optional[dict]]: the rule matching each connection, None if no rule matches
+
+        Examples:
+            >>> matcher.match_all([("10.0.0.1", "192.0.2.1", 443, "tcp"), Flow("10.0.0.2", "192.0.2.1", 22)])
+            [{...}, None]
+        """
+        cache = {}
+        result = []
+        for flow in flows:
+            bits = self._match(Flow(*flow), cache)
+            result.append(self.rules[(bits & -bits).bit_length() - 1] if bits else None)
+        return result
+
+    def _match(self, flow: Flow, cache: dict) -> int:
+        bits = self._all
+        for name, dimension, value in (
+            ("source", self._sources, flow.source),
+            ("destination", self._destinations, flow.destination),
+        ):
+            key = (name, value)
+            if key not in cache:
+                ip = ipaddress.ip_address(value)
+                cache[key] = dimension.lookup(ip.version, int(ip))
+            bits &= cache[key]
+        if flow.port is not None and bits:
+            key = ("service", flow.protocol, flow.port)
+            if key not in cache:
+                cache[key] = self._services.lookup(flow.protocol, int(flow.port))
+            bits &= cache[key]
+        return bits
+
+    def _addresses(self, rule: dict, name: str) -> Tuple[IntervalSet, bool]:
+        ranges = field(rule, name + "-ranges")
+        if ranges is not None:
+            intervals = merge_intervals(
+                (int(version[-1]), int(first), int(last))
+                for version in ("ipv4", "ipv6")
+                for first, last in (
+                    (ipaddress.ip_address(r["start"]), ipaddress.ip_address(r["end"]))
+                    for r in field(ranges, version) or []
+                )
+            )
+        else:
+            intervals = self._resolve(rule, name, self._resolver.addresses)
+        if intervals is None:
+            intervals = tuple((v, 0, last) for v, last in ADDRESS_SPACES.items())
+        return self._negate(rule, name, (intervals, False), ADDRESS_SPACES)
+
+    def _services(self, rule: dict, name: str) -> Tuple[Optional[IntervalSet], bool]:
+        """Ports of the services of a rule, and whether it matches the protocols not indexed. None for "Any" """
+        ranges = field(rule, name + "-ranges")
+        if ranges is not None:
+            return (
+                merge_intervals(
+                    (protocol, int(r["start"]), int(r["end"]))
+                    for protocol, values in ranges.items()
+                    if protocol != "others"
+                    for r in values
+                ),
+                len(field(ranges, "others") or []) > 0,
+            )
+        intervals = self._resolve(rule, name, self._resolver.ports)
+        return (None, True) if intervals is None else (intervals, False)
+
+    def _resolve(
+        self, rule: dict, name: str, resolve: Callable
+    ) -> Optional[IntervalSet]:
+        """Intervals of the objects of a field, None for "Any" """
+        values = []
+        objects = field(rule, name) or []
+        if isinstance(objects, (str, dict)):
+            objects = [objects]
+        for value in objects:
+            uid = value if isinstance(value, str) else field(value, "uid")
+            if _is_any(value):
+                return None
+            obj = self._resolver.get(uid)
+            if obj is not None and field(obj, "type") == ANY_TYPE:
+                return None
+            if obj is None:
+                logger.warning(
+                    "Object "
+                    + str(uid)
+                    + " of rule "
+                    + str(field(rule, "uid"))
+                    + " is unknown"
+                )
+                continue
+            values.append(resolve(uid))
+        return merge_intervals(i for v in values for i in v)
+
+    def _negate(
+        self,
+        rule: dict,
+        name: str,
+        value: Tuple[Optional[IntervalSet], bool],
+        keys: Iterable[Any],
+    ) -> Tuple[IntervalSet, bool]:
+        intervals, others = value
+        if intervals is None:
+            # "Any": every value of every key
+            intervals = tuple((key, 0, MAX_PORT) for key in keys)
+        if not field(rule, name + "-negate"):
+            return intervals, others
+        spaces = keys if isinstance(keys, dict) else {key: MAX_PORT for key in keys}
+        full = tuple((key, 0, last) for key, last in spaces.items())
+        return subtract_intervals(full, intervals), not others
@@ -0,0 +1,234 @@
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+from pycheckpoint_api.analysis.address_index import _Segments, field
+from pycheckpoint_api.analysis.group_resolver import GroupResolver
+from pycheckpoint_api.analysis.intervals import PROTOCOL_NAMES, IntervalSet, parse_ports
+
+
+def _protocol(value: Union[int, str]) -> str:
+    """Name of a protocol given by name or by IP protocol number"""
+    value = str(value).lower()
+    return PROTOCOL_NAMES.get(int(value), value) if value.isdigit() else value
+
+
+class ServicePortIndex:
+    """This class is a local index of the ports of the services: TCP, UDP and SCTP services, ICMP services (by ICMP\
+    type), other services (every port of their IP protocol) and service groups, whose members are merged. It finds\
+    the services covering a port, overlapping a range of ports or matching it exactly, without any request to the\
+    management server.
+
+    The ports of each protocol are cut into sorted segments covered by the same services: a lookup is a binary\
+    search, and a batch of ports is answered in a single pass over the sorted ports.
+    """
+
+    def __init__(self, objects: Iterable[Any] = ()):
+        """Constructor of the class
+
+        Args:
+            objects (Iterable[Any], optional): Services and service groups, as returned by the server (dictionaries\
+            or Box) or as records. Other objects are ignored. Defaults to ()
+
+        Examples:
+            >>> index = ServicePortIndex(firewall.service_applications.service_tcp.iter_services_tcp(raw=True))
+            >>> index.add_all(firewall.service_applications.service_group.iter_service_groups(raw=True))
+        """
+        self._resolver = GroupResolver()
+        self._services = []
+        self._entries = None
+        self._segments = None
+        self.add_all(objects)
+
+    def __len__(self) -> int:
+        return len(self._services)
+
+    def add(self, obj: Any):
+        """Adds a service or a service group to the index
+
+        Args:
+            obj (Any): The service
+
+        Examples:
+            >>> index.add({"uid": "196e93a9", "name": "https", "type": "service-tcp", "port": "443"})
+
+        """
+        self._resolver.add(obj)
+        self._services.append(obj)
+        self._entries = None
+        self._segments = None
+
+    def add_all(self, objects: Iterable[Any]):
+        """Adds services and service groups to the index
+
+        Args:
+            objects (Iterable[Any]): The services
+
+        Examples:
+            >>> index.add_all(snapshot.objects("services_udp"))
+
+        """
+        for obj in objects:
+            self.add(obj)
+
+    def ports(self, service: str) -> IntervalSet:
+        """Returns the ports of a service, or of the members of a service group
+
+        Args:
+            service (str): Uid or name of the service
+
+        Returns:
+            IntervalSet: the merged (protocol, first, last) ports
+
+        Examples:
+            >>> index.ports("web")
+            (("tcp", 80, 80), ("tcp", 443, 443), ("tcp", 8000, 8080))
+        """
+        return self._resolver.ports(service)
+
+    def covering(self, protocol: str, port: int) -> List[Any]:
+        """Returns the services covering a port
+
+        Args:
+            protocol (str): "tcp", "udp", "sctp", "icmp", "icmp6" or the name or number of an other IP protocol
+            port (int): The port, or the ICMP type
+
+        Returns:
+            List[Any]: the services and service groups, in the order they were added
+
+        Examples:
+            >>> [s["name"] for s in index.covering("tcp", 443)]
+            ["https", "web", "high_ports"]
+        """
+        return self.lookup([(protocol, port)])[(protocol, port)]
+
+    def lookup(
+        self, queries: Iterable[Tuple[str, int]]
+    ) -> Dict[Tuple[str, int], List[Any]]:
+        """Returns the services covering each port of a batch. The ports of each protocol are sorted and the segments\
+        are walked once, instead of a binary search per port.
+
+        Args:
+            queries (Iterable[Tuple[str, int]]): The (protocol, port) to look up
+
+        Returns:
+            Dict[Tuple[str, int], List[Any]]: the services covering each (protocol, port)
+
+        Examples:
+            >>> index.lookup([("tcp", 443), ("udp", 53)])
+            {("tcp", 443): [...], ("udp", 53): [...]}
+        """
+        segments = self._build()
+        result = {}
+        parsed = {(p, port): (_protocol(p), int(port)) for p, port in queries}
+        current, i = None, 0
+        for query in sorted(parsed, key=parsed.get):
+            protocol, port = parsed[query]
+            family = segments.get(protocol)
+            if family is None:
+                result[query] = []
+                continue
+            if protocol != current:
+                current, i = protocol, 0
+            while i + 1 < len(family.starts) and family.starts[i + 1] <= port:
+                i += 1
+            covers = family.covers[i] if family.starts[i] <= port else ()
+            entries = self._entries[protocol]
+            result[query] = self._services_of(entries[k] for k in covers)
+        return result
+
+    def overlapping(self, protocol: str, ports: Union[int, str]) -> List[Any]:
+        """Returns the services covering at least a port of a range
+
+        Args:
+            protocol (str): The protocol
+            ports (Union[int, str]): A port (443), a range ("8000-8080") or a bound (">1023")
+
+        Returns:
+            List[Any]: the services and service groups, in the order they were added
+
+        Examples:
+            >>> index.overlapping("tcp", "8000-8080")
+
+        """
+        first, last = parse_ports(ports)
+        family = self._build().get(_protocol(protocol))
+        if family is None:
+            return []
+        entries = self._entries[_protocol(protocol)]
+        return self._services_of(
+            entries[k] for k in sorted(family.between(first, last))
+        )
+
+    def within(self, protocol: str, ports: Union[int, str]) -> List[Any]:
+        """Returns the services whose ports of a protocol are all inside a range
+
+        Args:
+            protocol (str): The protocol
+            ports (Union[int, str]): A port (443), a range ("8000-8080") or a bound (">1023")
+
+        Returns:
+            List[Any]: the services and service groups, in the order they were added
+
+        Examples:
+            >>> index.within("tcp", "<1024")
+
+        """
+        first, last = parse_ports(ports)
+        protocol = _protocol(protocol)
+        return [
+            s
+            for s in self.overlapping(protocol, ports)
+            if all(
+                first <= low and high <= last
+                for key, low, high in self._resolver.ports(field(s, "uid"))
+                if key == protocol
+            )
+        ]
+
+    def exact(self, protocol: str, ports: Union[int, str]) -> List[Any]:
+        """Returns the services covering exactly a port or a range, and nothing else
+
+        Args:
+            protocol (str): The protocol
+            ports (Union[int, str]): A port (443), a range ("8000-8080") or a bound (">1023")
+
+        Returns:
+            List[Any]: the services and service groups, in the order they were added
+
+        Examples:
+            >>> [s["name"] for s in index.exact("tcp", 443)]
+            ["https"]
+        """
+        first, last = parse_ports(ports)
+        expected = ((_protocol(protocol), first, last),)
+        return [
+            s
+            for s in self.overlapping(protocol, ports)
+            if self._resolver.ports(field(s, "uid")) == expected
+        ]
+
+    @staticmethod
+    def _services_of(entries: Iterable[Tuple[Any, int, Any]]) -> List[Any]:
+        """Services of entries, once each, in the order they were added"""
+        result = {}
+        for _, position, service in sorted(entries, key=lambda e: e[1]):
+            result.setdefault(position, service)
+        return list(result.values())
+
+    def _build(self) -> Dict[str, _Segments]:
+        """Builds the segments after the last addition. Service groups are resolved at this point, once all their\
+        members are known."""
+        if self._segments is None:
+            self._entries = {}
+            for position, service in enumerate(self._services):
+                uid = field(service, "uid")
+                if uid is None:
+                    continue
+                for interval in self._resolver.ports(uid):
+                    self._entries.setdefault(interval[0], []).append(
+                        (interval, position, service)
+                    )
+            self._segments = {
+                protocol: _Segments([(e[0], e[2]) for e in entries])
+                for protocol, entries in self._entries.items()
+            }
+        return self._segments
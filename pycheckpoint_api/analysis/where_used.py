@@ -0,0 +1,293 @@
+import json
+from collections import deque
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+from pycheckpoint_api.analysis.address_index import field
+from pycheckpoint_api.analysis.rule_match import flatten_rulebase
+
+# Fields of the groups referencing other objects
+GROUP_FIELDS = ("members", "include", "except")
+
+# Fields of the rules referencing objects, by kind of rulebase
+RULE_FIELDS = {
+    "access": (
+        "source",
+        "destination",
+        "service",
+        "install-on",
+        "time",
+        "vpn",
+        "content",
+        "inline-layer",
+    ),
+    "nat": (
+        "original-source",
+        "original-destination",
+        "original-service",
+        "translated-source",
+        "translated-destination",
+        "translated-service",
+        "install-on",
+    ),
+}
+
+
+class Usage(NamedTuple):
+    """A reference to an object"""
+
+    # The group or the rule referencing the object
+    referrer: Any
+    # Field of the referrer holding the reference, like "members" or "source"
+    field: str
+    # Uid or name of the layer (or package) of a rule, None for a group
+    layer: Optional[str] = None
+
+
+def _uids(value: Any) -> List[str]:
+    if value is None:
+        return []
+    if isinstance(value, (str, dict)) or not isinstance(value, Iterable):
+        value = [value]
+    return [v if isinstance(v, str) else field(v, "uid") for v in value]
+
+
+class WhereUsedIndex:
+    """This class is a reverse index of the references between objects: the members of the groups, and the objects\
+    used by the access rules and the NAT rules. Every reference is read in a single pass over the exports, then the\
+    usages of any object, and the unused objects, are answered without any request to the management server.
+
+    A group or a rule added again replaces its previous references.
+    """
+
+    def __init__(self, objects: Iterable[Any] = ()):
+        """Constructor of the class
+
+        Args:
+            objects (Iterable[Any], optional): Objects, as returned by the server (dictionaries or Box) or as\
+            records. The members of the groups are read with ``details_level`` "standard" or "full", or from\
+            group records. Defaults to ()
+
+        Examples:
+            >>> index = WhereUsedIndex(firewall.network_objects.host.iter_hosts(raw=True))
+            >>> index.add_objects(firewall.network_objects.group.iter_groups(raw=True))
+            >>> index.add_rulebase(firewall.access_control_nat.access_rule.show_access_rulebase(
+            ...     name="Network", show_all=True, raw=True), layer="Network")
+        """
+        self._objects = {}
+        self._names = {}
+        self._usages = {}
+        # Uids referenced by each group or rule, to replace them when it's added again
+        self._references = {}
+        self.add_objects(objects)
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def add_objects(self, objects: Iterable[Any]) -> int:
+        """Adds objects, and the references of the groups to their members
+
+        Args:
+            objects (Iterable[Any]): The objects
+
+        Returns:
+            int: the number of objects added
+
+        Examples:
+            >>> index.add_objects(snapshot.objects("service_groups"))
+            42
+        """
+        count = 0
+        for obj in objects:
+            uid = field(obj, "uid")
+            if uid is None:
+                continue
+            self._objects[uid] = obj
+            name = field(obj, "name")
+            if name is not None:
+                self._names[name] = uid
+            self._remove_usages(uid)
+            for key in GROUP_FIELDS:
+                for member in _uids(field(obj, key)):
+                    self._add_usage(member, Usage(obj, key))
+            count += 1
+        return count
+
+    def add_rulebase(
+        self, rulebase: Any, layer: str = None, kind: str = "access"
+    ) -> int:
+        """Adds the references of the rules of a rulebase
+
+        Args:
+            rulebase (Any): The rulebase, as returned by ``show_access_rulebase(show_all=True)`` or\
+            ``show_nat_rulebase(show_all=True)``, or the list of its rules. The objects of the\
+            ``objects-dictionary`` are added as well
+            layer (str, optional): Uid or name of the layer, or of the package of a NAT rulebase. Defaults to the\
+            ``layer`` field of the rules
+            kind (str, optional): Kind of the rulebase, "access" or "nat". Defaults to "access"
+
+        Returns:
+            int: the number of rules added
+
+        Examples:
+            >>> index.add_rulebase(firewall.access_control_nat.nat_rule.show_nat_rulebase(
+            ...     package="standard", show_all=True, raw=True), layer="standard", kind="nat")
+            57
+        """
+        if kind not in RULE_FIELDS:
+            raise ValueError("Unknown kind of rulebase: " + str(kind))
+        if isinstance(rulebase, dict):
+            self.add_objects(
+                o
+                for o in rulebase.get("objects-dictionary", [])
+                if field(o, "uid") not in self._objects
+            )
+            rulebase = rulebase.get("rulebase", [])
+
+        count = 0
+        for rule in flatten_rulebase(rulebase):
+            rule_layer = layer if layer is not None else field(rule, "layer")
+            self._remove_usages(field(rule, "uid"))
+            for key in RULE_FIELDS[kind]:
+                for uid in _uids(field(rule, key)):
+                    self._add_usage(uid, Usage(rule, key, rule_layer))
+            count += 1
+        return count
+
+    def add_snapshot(self, snapshot: Any) -> int:
+        """Adds the objects and the rulebases of a snapshot
+
+        Args:
+            snapshot (Snapshot): The snapshot
+
+        Returns:
+            int: the number of rules added
+
+        Examples:
+            >>> with Snapshot("policy.db") as snapshot:
+            ...     index.add_snapshot(snapshot)
+        """
+        from pycheckpoint_api.snapshot import OBJECT_TYPES
+
+        for table in OBJECT_TYPES:
+            self.add_objects(snapshot.objects(table))
+        self.add_objects(
+            o
+            for o in (
+                json.loads(row["data"])
+                for row in snapshot.query("SELECT data FROM dictionary")
+            )
+            if o["uid"] not in self._objects
+        )
+        count = 0
+        for kind in RULE_FIELDS:
+            for layer in snapshot.layers(kind):
+                count += self.add_rulebase(
+                    snapshot.rules(layer["uid"]), layer=layer.get("name"), kind=kind
+                )
+        return count
+
+    def where_used(self, value: str, indirect: bool = False) -> List[Usage]:
+        """Returns the groups and the rules referencing an object
+
+        Args:
+            value (str): Uid or name of the object
+            indirect (bool, optional): Also returns the usages of the groups holding the object, directly or through\
+            nested groups. Defaults to False
+
+        Returns:
+            List[Usage]: the usages, in the order they were added (the direct usages first)
+
+        Examples:
+            >>> [(u.referrer["name"], u.field) for u in index.where_used("host1")]
+            [("servers", "members"), ("Allow web", "destination")]
+        """
+        uid = self._find(value)
+        usages = list(self._usages.get(uid, []))
+        if not indirect:
+            return usages
+
+        seen = {uid}
+        queue = deque(u.referrer for u in usages if u.field in GROUP_FIELDS)
+        while queue:
+            group = field(queue.popleft(), "uid")
+            if group in seen:
+                continue
+            seen.add(group)
+            for usage in self._usages.get(group, []):
+                usages.append(usage)
+                if usage.field in GROUP_FIELDS:
+                    queue.append(usage.referrer)
+        return usages
+
+    def is_used(self, value: str) -> bool:
+        """Tells if an object is referenced by a group or a rule
+
+        Args:
+            value (str): Uid or name of the object
+
+        Returns:
+            bool: True if the object is used
+
+        Examples:
+            >>> index.is_used("host1")
+            True
+        """
+        return len(self._usages.get(self._find(value), [])) > 0
+
+    def unused(self, types: Iterable[str] = None) -> List[Any]:
+        """Returns the objects referenced by no group and no rule
+
+        Args:
+            types (Iterable[str], optional): Only returns the objects of those types, like "host" or "network".\
+            Defaults to None (every type)
+
+        Returns:
+            List[Any]: the objects, in the order they were added
+
+        Examples:
+            >>> [o["name"] for o in index.unused(["host", "network"])]
+            ["old_server", "net_lab"]
+        """
+        types = set(types) if types is not None else None
+        return [
+            obj
+            for uid, obj in self._objects.items()
+            if uid not in self._usages
+            and (types is None or field(obj, "type") in types)
+        ]
+
+    def counts(self) -> Dict[str, int]:
+        """Returns the number of references of each object
+
+        Returns:
+            Dict[str, int]: the number of usages of each uid, 0 for the unused objects
+
+        Examples:
+            >>> index.counts()["196e93a9"]
+            3
+        """
+        result = {uid: 0 for uid in self._objects}
+        result.update((uid, len(usages)) for uid, usages in self._usages.items())
+        return result
+
+    def _add_usage(self, uid: str, usage: Usage):
+        self._usages.setdefault(uid, []).append(usage)
+        referrer = field(usage.referrer, "uid")
+        if referrer is not None:
+            self._references.setdefault(referrer, set()).add(uid)
+
+    def _remove_usages(self, referrer: Optional[str]):
+        """Removes the references of a group or a rule added before"""
+        for uid in self._references.pop(referrer, ()):
+            usages = [
+                u for u in self._usages[uid] if field(u.referrer, "uid") != referrer
+            ]
+            if len(usages) > 0:
+                self._usages[uid] = usages
+            else:
+                del self._usages[uid]
+
+    def _find(self, value: str) -> str:
+        if value in self._objects or value in self._usages:
+            return value
+        return self._names.get(value, value)
@@ -0,0 +1,130 @@
+import re
+from typing import Any
+
+_CAMEL_CASE = re.compile(r"(?<=[a-z0-9])([A-Z])")
+_NOT_ALLOWED = re.compile(r"[^a-zA-Z0-9_]")
+
+
+def attribute_name(key: str) -> str:
+    """This function is used to get the attribute name of a key, with the same rules as ``camel_killer_box``
+
+    Args:
+        key (str): Key of the JSON object
+
+    Returns:
+        str: the attribute name
+
+    Examples:
+        >>> attribute_name("ipv4-address")
+        "ipv4_address"
+
+        >>> attribute_name("objectsDictionary")
+        "objects_dictionary"
+    """
+    return _NOT_ALLOWED.sub("_", _CAMEL_CASE.sub(r"_\1", key)).lower()
+
+
+def wrap(value: Any) -> Any:
+    """This function is used to wrap a decoded JSON value in a lazy view. Other values are returned unchanged.
+
+    Args:
+        value (Any): The decoded JSON value
+
+    Returns:
+        Any: a ``LazyView`` for a dictionary, a ``LazyList`` for a list, the value itself otherwise
+
+    Examples:
+        >>> wrap({"uid": "196e93a9", "ipv4-address": "192.0.2.1"}).ipv4_address
+        "192.0.2.1"
+    """
+    if isinstance(value, dict) and not isinstance(value, LazyView):
+        return LazyView(value)
+    if isinstance(value, list) and not isinstance(value, LazyList):
+        return LazyList(value)
+    return value
+
+
+class LazyView(dict):
+    """This class is a dictionary giving an attribute access to a decoded JSON object, like ``Box`` does.
+    Unlike ``Box``, nothing is converted up front: a nested object is wrapped only when it's accessed, so building\
+    the response of a large export costs a shallow copy of the top level object only.
+    Keys are found with the same rules as ``camel_killer_box``: ``view.ipv4_address`` returns ``view["ipv4-address"]``.
+    """
+
+    __slots__ = ("_attributes",)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        try:
+            return self[self._key(name)]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name: str, value: Any):
+        if name in LazyView.__slots__:
+            object.__setattr__(self, name, value)
+        else:
+            self[self._key(name, missing=name)] = value
+
+    def __delattr__(self, name: str):
+        try:
+            del self[self._key(name)]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __getitem__(self, key: str) -> Any:
+        value = dict.__getitem__(self, key)
+        wrapped = wrap(value)
+        if wrapped is not value:
+            # The view replaces the original value, so it's only built once
+            dict.__setitem__(self, key, wrapped)
+        return wrapped
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self else default
+
+    def values(self) -> list:
+        return [self[k] for k in self]
+
+    def items(self) -> list:
+        return [(k, self[k]) for k in self]
+
+    def __dir__(self):
+        return list(super().__dir__()) + [attribute_name(k) for k in self]
+
+    def _key(self, name: str, missing: str = None) -> str:
+        """Finds the key matching an attribute name"""
+        if name in self:
+            return name
+        try:
+            attributes = object.__getattribute__(self, "_attributes")
+        except AttributeError:
+            attributes = None
+        if attributes is None or len(attributes) != len(self):
+            attributes = {attribute_name(k): k for k in self if isinstance(k, str)}
+            object.__setattr__(self, "_attributes", attributes)
+        if name in attributes:
+            return attributes[name]
+        if missing is not None:
+            return missing
+        raise KeyError(name)
+
+
+class LazyList(list):
+    """This class is a list wrapping its items in lazy views when they are accessed"""
+
+    __slots__ = ()
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return LazyList(list.__getitem__(self, index))
+        value = list.__getitem__(self, index)
+        wrapped = wrap(value)
+        if wrapped is not value:
+            list.__setitem__(self, index, wrapped)
+        return wrapped
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
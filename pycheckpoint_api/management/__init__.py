@@ -1,15 +1,20 @@
 from box import Box
+from restfly.errors import APIError
 from restfly.session import APISession
 
 from pycheckpoint_api import __version__
+from pycheckpoint_api.lazy_view import wrap
 from pycheckpoint_api.utils import sanitize_value
 
 from .access_control_nat import AccessControlNAT
+from .cache import ObjectCache, PublishValidator
+from .keepalive import KeepaliveScheduler
 from .misc import MISC
 from .network_objects import NetworkObjects
 from .policy import Policy
 from .service_applications import ServiceApplications
 from .session import Session
+from .session_store import SessionStore
 
 
 class Management(APISession):
@@ -44,6 +49,33 @@ class Management(APISession):
                 Port used to reach the Firewall Checkpoint.
             **version (str, optional)
                 Current API version used by the Firewall Checkpoint
+            **cache_ttl (float, optional)
+                Enables the client-side cache of the objects retrieved by uid or name, with entries expiring after\
+                this number of seconds. Disabled by default
+            **cache_size (int, optional)
+                Maximum number of objects kept in the cache. Defaults to 1024
+            **cache_validation (float, optional)
+                Clears the cache when a session has been published since the objects were cached, checking the last\
+                published session at most once every this number of seconds (0 to check on every lookup). Enables\
+                the cache, with entries kept until the next publish if ``cache_ttl`` is not given. Disabled by default
+            **keepalive (bool, optional)
+                Sends a keepalive from a background thread when the session is idle close to its\
+                ``session-timeout``. Defaults to False
+            **keepalive_margin (int, optional)
+                Number of seconds before the expiration of an idle session when the keepalive is sent. Defaults to 60
+            **raw (bool, optional)
+                Returns plain dictionaries and lists instead of Box objects for every request, skipping the\
+                conversion. It can be overridden per call with the ``raw`` keyword argument. Defaults to False
+            **lazy (bool, optional)
+                Returns lazy views instead of Box objects for every request: nested objects are only converted when\
+                they are accessed. It can be overridden per call with the ``lazy`` keyword argument. Defaults to False
+            **session_store (Union[str, SessionStore], optional)
+                Path of the file (or store) where the session is kept when the client exits. A later client with the\
+                same hostname, port, domain and user reuses it if it's still valid, without login nor logout.\
+                Defaults to None
+            **session_slot (int, optional)
+                Index of the session in the ``session_store``, so several clients of the same user opened at the same\
+                time each resume their own session. Set by ``SessionPool``. Defaults to None
 
         Examples:
             >>> Management(
@@ -54,6 +86,16 @@ class Management(APISession):
             ... domain="MyDomain",
             ... version="1.5",
             ... ssl_verify=False)
+
+            >>> Management(
+            ... hostname="127.0.0.1",
+            ... port=443,
+            ... api_key="hunter2",
+            ... version="1.5",
+            ... cache_ttl=300,
+            ... cache_size=5000,
+            ... keepalive=True,
+            ... session_store="~/.pycheckpoint_api/sessions.json")
         """
         self._user = sanitize_value(field="user", t=str, is_mandatory=False, **kw)
         self._password = sanitize_value(
@@ -68,22 +110,164 @@ class Management(APISession):
         self._url = f"https://{self._hostname}:{self._port}/web_api"
         if self._version not in ["1.6", "1.6.1", "1.7", "1.7.1", "1.8", "1.9"]:
             self._url += f"/v{self._version}"
+        cache_ttl = sanitize_value(field="cache_ttl", t=(int, float), **kw)
+        cache_size = sanitize_value(field="cache_size", t=int, default=1024, **kw)
+        cache_validation = sanitize_value(
+            field="cache_validation", t=(int, float), **kw
+        )
+        self._cache = None
+        if cache_validation is not None:
+            self._cache = ObjectCache(
+                ttl=cache_ttl if cache_ttl is not None else float("inf"),
+                max_size=cache_size,
+                validator=PublishValidator(
+                    self._last_published_session, interval=cache_validation
+                ),
+            )
+        elif cache_ttl is not None:
+            self._cache = ObjectCache(ttl=cache_ttl, max_size=cache_size)
+        self._keepalive = sanitize_value(field="keepalive", t=bool, default=False, **kw)
+        self._keepalive_margin = sanitize_value(
+            field="keepalive_margin", t=int, default=60, **kw
+        )
+        self._keepalive_scheduler = None
+        self._session_store = sanitize_value(
+            field="session_store", t=(str, SessionStore), **kw
+        )
+        if isinstance(self._session_store, str):
+            self._session_store = SessionStore(self._session_store)
+        self._session_key = SessionStore.key(
+            hostname=self._hostname,
+            port=self._port,
+            domain=kw.get("domain"),
+            user=self._user,
+            api_key=self._api_key,
+            slot=sanitize_value(field="session_slot", t=int, **kw),
+        )
+        if sanitize_value(field="raw", t=bool, default=False, **kw):
+            self._box = False
+            self._conv_json = True
+        self._lazy = sanitize_value(field="lazy", t=bool, default=False, **kw)
         self.conv_box = True
         super(Management, self).__init__(**kw)
 
+    def _req(self, method: str, path: str, **kwargs):
+        """Sends a request, returning lazy views instead of Box objects when asked"""
+        if kwargs.pop("lazy", self._lazy):
+            kwargs.update(box=False, conv_json=True)
+            return wrap(self._cached_req(method, path, **kwargs))
+        return self._cached_req(method, path, **kwargs)
+
+    def _cached_req(self, method: str, path: str, **kwargs):
+        """Sends a request, going through the object cache when it's enabled"""
+        if self._cache is None:
+            return self._send(method, path, **kwargs)
+
+        payload = kwargs.get("json")
+        box = kwargs.get("box", self._box)
+        # Only converted responses are cached, as plain dictionaries
+        cacheable = box or kwargs.get("conv_json", self._conv_json)
+        if cacheable:
+            resp = self._cache.lookup(path, payload)
+            if resp is not None:
+                return (
+                    Box(resp, **kwargs.get("box_attrs", self._box_attrs))
+                    if box
+                    else resp
+                )
+
+        resp = self._send(method, path, **kwargs)
+        self._cache.invalidate(path, payload)
+        if cacheable:
+            self._cache.store(
+                path, payload, resp.to_dict() if isinstance(resp, Box) else resp
+            )
+        return resp
+
+    def _send(self, method: str, path: str, **kwargs):
+        """Sends a request to the server, recording the activity of the session"""
+        if self._keepalive_scheduler is not None:
+            self._keepalive_scheduler.touch()
+        return super(Management, self)._req(method, path, **kwargs)
+
+    def _last_published_session(self) -> dict:
+        """Requests the last published session without going through the cache, which it validates"""
+        return self._send(
+            "POST",
+            "show-last-published-session",
+            json={},
+            box=False,
+            conv_json=True,
+        )
+
     def _build_session(self, **kwargs) -> Box:
         """Creates a Firewall Management API session."""
         super(Management, self)._build_session(**kwargs)
-        resp = self.session.login(**kwargs)
-        self._session.headers.update({"X-chkp-sid": resp["sid"]})
+        resp = self._resume_session()
+        if resp is None:
+            resp = self.session.login(**kwargs)
+            self._session.headers.update({"X-chkp-sid": resp["sid"]})
+            if self._session_store is not None:
+                self._session_store.save(self._session_key, resp)
+        self._session_info = resp
+        if self._keepalive:
+            self._keepalive_scheduler = KeepaliveScheduler(
+                self.session.keepalive,
+                timeout=resp.get("session-timeout", 600),
+                margin=self._keepalive_margin,
+            )
+            self._keepalive_scheduler.start()
         return resp
 
     def _deauthenticate(self):
         """Ends the authentication session."""
+        if self._keepalive_scheduler is not None:
+            self._keepalive_scheduler.stop()
+            self._keepalive_scheduler = None
+        if self._session_store is not None:
+            # The session is kept opened for the next client
+            self._session_store.save(self._session_key, self._session_info)
+            del self._session.headers["X-chkp-sid"]
+            return None
         resp = self.session.logout()
         del self._session.headers["X-chkp-sid"]
         return resp
 
+    def _resume_session(self) -> Box:
+        """Reuses the stored session if it's still valid on the server"""
+        if self._session_store is None:
+            return None
+        stored = self._session_store.get(self._session_key)
+        if stored is None:
+            return None
+
+        self._session.headers.update({"X-chkp-sid": stored["sid"]})
+        try:
+            current = self.session.show_session()
+        except APIError:
+            del self._session.headers["X-chkp-sid"]
+            self._session_store.remove(self._session_key)
+            return None
+
+        # The timeout of a session may be changed with set-session
+        stored["session-timeout"] = current.get(
+            "session-timeout", stored["session-timeout"]
+        )
+        return stored
+
+    @property
+    def cache(self) -> ObjectCache:
+        """The client-side object cache, if enabled with ``cache_ttl``.
+
+        Returns:
+            ObjectCache: the cache instance, or None if it's disabled
+
+        Examples:
+            >>> firewall.cache.clear()
+
+        """
+        return self._cache
+
     @property
     def session(self) -> Session:
         """The interface object for the Session Management.
@@ -1,13 +1,21 @@
+import itertools
 import logging
-import time
-from typing import List
+from typing import Iterable, Iterator, List
 
 from box import Box
 from restfly.endpoint import APIEndpoint
 
-from pycheckpoint_api.utils import sanitize_secondary_parameters
+from pycheckpoint_api.records import Record
+from pycheckpoint_api.utils import (
+    map_pages,
+    response_options,
+    root_api,
+    sanitize_secondary_parameters,
+)
 
 from ..exception import MandatoryFieldMissing
+from ..session import Session
+from .paginator import Paginator
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +23,9 @@ logger = logging.getLogger(__name__)
 class NetworkObject(APIEndpoint):
     """This class is used to create a common shape for any network object"""
 
+    # Compact record type returned with ``record=True``
+    _record = Record
+
     def show_object(
         self,
         endpoint: str,
@@ -34,6 +45,15 @@ class NetworkObject(APIEndpoint):
             **kw (dict, optional): Arbitrary keyword arguments for secondary parameters.
 
         Keyword Args:
+            **raw (bool, optional):
+                Returns plain dictionaries and lists instead of Box objects, skipping the conversion.\
+                Defaults to the ``raw`` setting of the client.
+            **lazy (bool, optional):
+                Returns lazy views instead of Box objects: nested objects are only converted when they are accessed.\
+                Defaults to the ``lazy`` setting of the client.
+            **record (bool, optional):
+                Returns compact ``__slots__`` records (see :mod:`pycheckpoint_api.records`) instead of Box objects,\
+                keeping only the main fields. Defaults to False.
             **details_level (str, optional):
                 The level of detail for some of the fields in the response can vary from showing only the UID value\
                 of the object to a fully detailed representation of the object.
@@ -63,7 +83,11 @@ class NetworkObject(APIEndpoint):
 
         payload.update(sanitize_secondary_parameters(secondary_parameters, **kw))
 
-        return self._post(endpoint, json=payload)
+        if self._use_records(kw):
+            return self._record.from_dict(
+                self._post(endpoint, json=payload, **response_options(**kw))
+            )
+        return self._post(endpoint, json=payload, **response_options(**kw))
 
     def delete_object(self, endpoint: str, uid: str = None, name: str = None, **kw):
         """
@@ -122,6 +146,8 @@ class NetworkObject(APIEndpoint):
         order: List[dict] = None,
         show_as_ranges: bool = None,
         extra_secondary_parameters: dict = None,
+        max_workers: int = 1,
+        adaptive: bool = False,
         **kw
     ) -> Box:
         """Retrieve objects.
@@ -140,9 +166,23 @@ class NetworkObject(APIEndpoint):
             descending order by the session publish time. Defaults to None
             extra_secondary_parameters (dict, optional): Any additional secondary parameter need to be add in the request\
             Defaults to None
+            max_workers (int, optional): Only used with `show_all`. Number of pages requested at the same time once the\
+            total is known. Defaults to 1 (pages are requested one after the other)
+            adaptive (bool, optional): Only used with `show_all`. Adapts the page size to the time taken by the server\
+            to return the previous page, starting from `limit` and up to 500, and backs off when a page times out.\
+            Pages are then requested one after the other. Defaults to False
             **kw (dict, optional): Arbitrary keyword arguments for secondary parameters.
 
         Keyword Args:
+            **raw (bool, optional):
+                Returns plain dictionaries and lists instead of Box objects, skipping the conversion.\
+                Defaults to the ``raw`` setting of the client.
+            **lazy (bool, optional):
+                Returns lazy views instead of Box objects: nested objects are only converted when they are accessed.\
+                Defaults to the ``lazy`` setting of the client.
+            **record (bool, optional):
+                Returns compact ``__slots__`` records (see :mod:`pycheckpoint_api.records`) instead of Box objects,\
+                keeping only the main fields. Defaults to False.
             **details_level (str, optional):
                 The level of detail for some of the fields in the response can vary from showing only the UID value\
                 of the object to a fully detailed representation of the object.
@@ -166,6 +206,8 @@ class NetworkObject(APIEndpoint):
                 order=order,
                 show_as_ranges=show_as_ranges,
                 extra_secondary_parameters=extra_secondary_parameters,
+                max_workers=max_workers,
+                adaptive=adaptive,
                 **kw
             )
         else:
@@ -208,6 +250,15 @@ class NetworkObject(APIEndpoint):
             **kw (dict, optional): Arbitrary keyword arguments for secondary parameters.
 
         Keyword Args:
+            **raw (bool, optional):
+                Returns plain dictionaries and lists instead of Box objects, skipping the conversion.\
+                Defaults to the ``raw`` setting of the client.
+            **lazy (bool, optional):
+                Returns lazy views instead of Box objects: nested objects are only converted when they are accessed.\
+                Defaults to the ``lazy`` setting of the client.
+            **record (bool, optional):
+                Returns compact ``__slots__`` records (see :mod:`pycheckpoint_api.records`) instead of Box objects,\
+                keeping only the main fields. Defaults to False.
             **details_level (str, optional):
                 The level of detail for some of the fields in the response can vary from showing only the UID value\
                 of the object to a fully detailed representation of the object.
@@ -247,7 +298,72 @@ class NetworkObject(APIEndpoint):
 
         payload.update(sanitize_secondary_parameters(secondary_parameters, **kw))
 
-        return self._post(endpoint, json=payload)
+        if self._use_records(kw):
+            page = self._post(endpoint, json=payload, **response_options(**kw))
+            page["objects"] = [
+                self._record.from_dict(o) for o in page.get("objects", [])
+            ]
+            return page
+        return self._post(endpoint, json=payload, **response_options(**kw))
+
+    @staticmethod
+    def _use_records(kw: dict) -> bool:
+        """Replaces the ``record`` keyword argument by a raw request, records being built from plain dictionaries"""
+        if not kw.pop("record", False):
+            return False
+        kw["raw"] = True
+        kw.pop("lazy", None)
+        return True
+
+    def paginator(
+        self,
+        endpoint: str,
+        filter_results: str = None,
+        limit: int = 50,
+        order: List[dict] = None,
+        show_as_ranges: bool = None,
+        extra_secondary_parameters: dict = None,
+        adaptive: bool = False,
+        **kw
+    ) -> Paginator:
+        """Build the paginator of a list of objects
+
+        Args:
+            endpoint (str): Endpoint to reach to show the objects
+            filter_results (str, optional): Search expression to filter objects by. Defaults to None
+            limit (int, optional): The maximal number of results per request. Defaults to 50 (between 1 and 500)
+            order (List[dict], optional): Sorts results by the given field. Defaults to None
+            show_as_ranges (bool, optional): Display the content as ranges of IP addresses when relevant.\
+            Defaults to None
+            extra_secondary_parameters (dict, optional): Any additional secondary parameter need to be add in the request\
+            Defaults to None
+            adaptive (bool, optional): Adapts the page size to the time taken by the server to return the previous\
+            page, and backs off when a page times out. Defaults to False
+            **kw (dict, optional): Arbitrary keyword arguments for secondary parameters.
+
+        Returns:
+            Paginator: a paginator requesting the pages with ``show_partial_objects``
+
+        Examples:
+            >>> firewall.network_objects.host.paginator(endpoint="show-hosts", limit=500).all(max_workers=4)
+
+        """
+
+        def fetch(offset: int, limit: int) -> Box:
+            return self.show_partial_objects(
+                endpoint=endpoint,
+                filter_results=filter_results,
+                limit=limit,
+                offset=offset,
+                order=order,
+                show_as_ranges=show_as_ranges,
+                extra_secondary_parameters=extra_secondary_parameters,
+                **kw
+            )
+
+        return Paginator(
+            fetch, key="objects", limit=limit, name=endpoint, adaptive=adaptive
+        )
 
     def show_all_objects(
         self,
@@ -257,6 +373,8 @@ class NetworkObject(APIEndpoint):
         order: List[dict] = None,
         show_as_ranges: bool = None,
         extra_secondary_parameters: dict = None,
+        max_workers: int = 1,
+        adaptive: bool = False,
         **kw
     ) -> Box:
         """Retrieve all objects
@@ -268,9 +386,23 @@ class NetworkObject(APIEndpoint):
             order (List[dict], optional): _description_ Defaults to None
             show_as_ranges (bool, optional): _description_ Defaults to None
             extra_secondary_parameters (dict, optional): _description_ Defaults to None
+            max_workers (int, optional): Number of pages requested at the same time once the total is known.\
+            Pages are still returned in order. Defaults to 1 (pages are requested one after the other)
+            adaptive (bool, optional): Adapts the page size to the time taken by the server to return the previous\
+            page, starting from `limit` and up to 500, and backs off when a page times out. `max_workers` is then\
+            ignored. Defaults to False
             **kw (dict, optional): Arbitrary keyword arguments for secondary parameters.
 
         Keyword Args:
+            **raw (bool, optional):
+                Returns plain dictionaries and lists instead of Box objects, skipping the conversion.\
+                Defaults to the ``raw`` setting of the client.
+            **lazy (bool, optional):
+                Returns lazy views instead of Box objects: nested objects are only converted when they are accessed.\
+                Defaults to the ``lazy`` setting of the client.
+            **record (bool, optional):
+                Returns compact ``__slots__`` records (see :mod:`pycheckpoint_api.records`) instead of Box objects,\
+                keeping only the main fields. Defaults to False.
             **details_level (str, optional):
                 The level of detail for some of the fields in the response can vary from showing only the UID value\
                 of the object to a fully detailed representation of the object.
@@ -284,102 +416,239 @@ class NetworkObject(APIEndpoint):
 
         Examples:
             >>> firewall.network_objects.<OBJECT_TYPE>.show_all_<OBJECT_TYPE>s()
+            >>> firewall.network_objects.host.show_hosts(show_all=True, limit=500, max_workers=8)
+            >>> firewall.network_objects.host.show_hosts(show_all=True, adaptive=True, details_level="full")
 
         """
-        all_objects = None
+        return self.paginator(
+            endpoint=endpoint,
+            filter_results=filter_results,
+            limit=limit,
+            order=order,
+            show_as_ranges=show_as_ranges,
+            extra_secondary_parameters=extra_secondary_parameters,
+            adaptive=adaptive,
+            **kw
+        ).all(max_workers=max_workers)
+
+    def iter_objects(
+        self,
+        endpoint: str,
+        filter_results: str = None,
+        limit: int = 50,
+        order: List[dict] = None,
+        show_as_ranges: bool = None,
+        extra_secondary_parameters: dict = None,
+        **kw
+    ) -> Iterator[Box]:
+        """Iterate over all objects, page by page. Only the current page is kept in memory, so the first objects\
+        can be processed before the following pages are requested.
+
+        Args:
+            endpoint (str): Endpoint to reach to show the objects
+            filter_results (str, optional): Search expression to filter objects by. Defaults to None\
+            The provided text should be exactly the same as it would be given in SmartConsole Object Explorer.\
+            The logical operators in the expression ('AND', 'OR') should be provided in capital letters.\
+            he search involves both a IP search and a textual search in name, comment, tags etc.
+            limit (int, optional): The maximal number of results per request. Defaults to 50 (between 1 and 500)
+            order (List[dict], optional): Sorts results by the given field. By default the results are sorted in the\
+            descending order by the session publish time. Defaults to None
+            show_as_ranges (bool, optional): Display the content as ranges of IP addresses when relevant.\
+            Defaults to None
+            extra_secondary_parameters (dict, optional): Any additional secondary parameter need to be add in the request\
+            Defaults to None
+            **kw (dict, optional): Arbitrary keyword arguments for secondary parameters.
+
+        Keyword Args:
+            **raw (bool, optional):
+                Returns plain dictionaries and lists instead of Box objects, skipping the conversion.\
+                Defaults to the ``raw`` setting of the client.
+            **lazy (bool, optional):
+                Returns lazy views instead of Box objects: nested objects are only converted when they are accessed.\
+                Defaults to the ``lazy`` setting of the client.
+            **record (bool, optional):
+                Returns compact ``__slots__`` records (see :mod:`pycheckpoint_api.records`) instead of Box objects,\
+                keeping only the main fields. Defaults to False.
+            **details_level (str, optional):
+                The level of detail for some of the fields in the response can vary from showing only the UID value\
+                of the object to a fully detailed representation of the object.
+            **domains_to_process (List[str], optional):
+                Indicates which domains to process the commands on. It cannot be used with the details_level full,\
+                must be run from the System Domain only and with ignore_warnings true.\
+                Valid values are: CURRENT_DOMAIN, ALL_DOMAINS_ON_THIS_SERVER.
+
+        Returns:
+            Iterator[:obj:`Box`]: The objects, one at a time
 
-        # Get a timer
-        timer_start = time.time()
+        Examples:
+            >>> for obj in firewall.network_objects.<OBJECT_TYPE>.iter_<OBJECT_TYPE>s():
+            ...     print(obj.name)
 
-        # Made a first request to determine the total number of objects
-        resp = self.show_partial_objects(
+        """
+        yield from self.paginator(
             endpoint=endpoint,
             filter_results=filter_results,
             limit=limit,
-            offset=0,
             order=order,
             show_as_ranges=show_as_ranges,
             extra_secondary_parameters=extra_secondary_parameters,
             **kw
-        )
+        ).items()
 
-        # Add the first results
-        all_objects = resp
-
-        # Evaluate the number of requests to be done
-        number_requests = int(resp.total / limit) + 1
-
-        logger.info(
-            endpoint
-            + " - Total: "
-            + str(resp.total)
-            + " - Number of requests to do: "
-            + str(number_requests)
-            + " (limit set to "
-            + str(limit)
-            + "/request) - In progress..."
-        )
-        logger.debug(
-            endpoint
-            + " - 1/"
-            + str(number_requests)
-            + " (limit set to "
-            + str(limit)
-            + "/request) exported... (offset:0)"
-        )
+    def bulk_add(
+        self,
+        payloads: Iterable[dict],
+        max_workers: int = 1,
+        publish_every: int = None,
+    ) -> Box:
+        """Create several objects, with ``max_workers`` requests sent at the same time.
+        A failure does not stop the batch: the error is reported in the result of the item.
 
-        for i in range(1, number_requests):
-            resp = self.show_partial_objects(
-                endpoint=endpoint,
-                filter_results=filter_results,
-                limit=limit,
-                offset=i * limit,
-                order=order,
-                show_as_ranges=show_as_ranges,
-                extra_secondary_parameters=extra_secondary_parameters,
-                **kw
-            )
+        Args:
+            payloads (Iterable[dict]): Parameters of the ``add`` method, one dictionary per object to create
+            max_workers (int, optional): Maximum number of requests sent at the same time. Defaults to 1
+            publish_every (int, optional): Publish the session every time this number of changes succeeded,\
+            once no other request is in flight, and once the batch is done if changes remain.\
+            Defaults to None (no publish)
 
-            logger.debug(
-                endpoint
-                + " - "
-                + str(i + 1)
-                + "/"
-                + str(number_requests)
-                + " (limit set to "
-                + str(limit)
-                + "/request) exported... (offset:"
-                + str(i)
-                + ")"
-            )
+        Returns:
+            :obj:`Box`: The number of ``succeeded`` and ``failed`` items, the ``results`` of each item\
+            (``index``, ``payload``, ``response`` and ``error``) in the same order as ``payloads``, and the\
+            ``publish_errors`` (``index`` of the last item sent before the publish, and ``error``). The changes of a\
+            failed publish are published with the next ones
 
-            all_objects.objects += resp.objects
+        Examples:
+            >>> firewall.network_objects.host.bulk_add(
+            ... [{"name": f"host{i}", "ip_address": f"10.0.0.{i}"} for i in range(1, 255)],
+            ... max_workers=8,
+            ... publish_every=100)
+        """
+        return self._bulk("add", payloads, max_workers, publish_every)
 
-        # Finalize the output
-        all_objects.to = all_objects.total
+    def bulk_set(
+        self,
+        payloads: Iterable[dict],
+        max_workers: int = 1,
+        publish_every: int = None,
+    ) -> Box:
+        """Edit several objects, with ``max_workers`` requests sent at the same time.
+        A failure does not stop the batch: the error is reported in the result of the item.
 
-        # End timer
-        timer_diff = time.time() - timer_start
+        Args:
+            payloads (Iterable[dict]): Parameters of the ``set`` method, one dictionary per object to edit
+            max_workers (int, optional): Maximum number of requests sent at the same time. Defaults to 1
+            publish_every (int, optional): Publish the session every time this number of changes succeeded,\
+            once no other request is in flight, and once the batch is done if changes remain.\
+            Defaults to None (no publish)
 
-        timer_text = ""
+        Returns:
+            :obj:`Box`: The number of ``succeeded`` and ``failed`` items, the ``results`` of each item\
+            (``index``, ``payload``, ``response`` and ``error``) in the same order as ``payloads``, and the\
+            ``publish_errors`` (``index`` of the last item sent before the publish, and ``error``). The changes of a\
+            failed publish are published with the next ones
 
-        if round(timer_diff % 60) != 0:
-            timer_text = (
-                str(int(timer_diff / 60)) + "min " + str(round(timer_diff % 60)) + "s"
-            )  # pragma: no cover
-        else:
-            timer_text = "<1s"
-
-        logger.info(
-            endpoint
-            + " - Total: "
-            + str(resp.total)
-            + " - Number of requests done: "
-            + str(number_requests)
-            + " (limit set to "
-            + str(limit)
-            + "/request) - Done in "
-            + timer_text
-        )
+        Examples:
+            >>> firewall.network_objects.host.bulk_set(
+            ... [{"name": "host1", "comments": "Web server"}, {"name": "host2", "comments": "Database"}],
+            ... max_workers=2)
+        """
+        return self._bulk("set", payloads, max_workers, publish_every)
+
+    def bulk_delete(
+        self,
+        payloads: Iterable[dict],
+        max_workers: int = 1,
+        publish_every: int = None,
+    ) -> Box:
+        """Delete several objects, with ``max_workers`` requests sent at the same time.
+        A failure does not stop the batch: the error is reported in the result of the item.
+
+        Args:
+            payloads (Iterable[dict]): Parameters of the ``delete`` method (``uid`` or ``name``), one dictionary per\
+            object to delete
+            max_workers (int, optional): Maximum number of requests sent at the same time. Defaults to 1
+            publish_every (int, optional): Publish the session every time this number of changes succeeded,\
+            once no other request is in flight, and once the batch is done if changes remain.\
+            Defaults to None (no publish)
+
+        Returns:
+            :obj:`Box`: The number of ``succeeded`` and ``failed`` items, the ``results`` of each item\
+            (``index``, ``payload``, ``response`` and ``error``) in the same order as ``payloads``, and the\
+            ``publish_errors`` (``index`` of the last item sent before the publish, and ``error``). The changes of a\
+            failed publish are published with the next ones
 
-        return all_objects
+        Examples:
+            >>> firewall.network_objects.host.bulk_delete([{"name": "host1"}, {"uid": "9423d36f-2d66-4754-b9e2"}])
+        """
+        return self._bulk("delete", payloads, max_workers, publish_every)
+
+    def _bulk(
+        self,
+        method: str,
+        payloads: Iterable[dict],
+        max_workers: int = 1,
+        publish_every: int = None,
+    ) -> Box:
+        """Calls ``method`` for each payload and gathers the results and errors of every item.
+        With ``publish_every``, the items are sent by groups just large enough to reach the number of changes to\
+        publish, and the session is only published once every request of the group is done.
+        """
+        func = getattr(self, method)
+        session = Session(root_api(self))
+        items = enumerate(payloads)
+        results = []
+        publish_errors = []
+        pending = 0
+
+        def run(item: tuple) -> dict:
+            index, payload = item
+            result = {
+                "index": index,
+                "payload": payload,
+                "response": None,
+                "error": None,
+            }
+            try:
+                result["response"] = func(**payload)
+            except Exception as e:
+                logger.debug(method + " #" + str(index) + " failed: " + str(e))
+                result["error"] = e
+            return result
+
+        def publish() -> bool:
+            """Publishes the pending changes, recording the error when it fails"""
+            logger.debug("Publishing " + str(pending) + " change(s)")
+            try:
+                session.publish()
+            except Exception as e:
+                logger.debug("Publish failed: " + str(e))
+                publish_errors.append({"index": results[-1]["index"], "error": e})
+                return False
+            return True
+
+        # The changes of a failed publish stay in the session: they are published with the next ones
+        published = True
+        while True:
+            size = publish_every - pending if publish_every is not None else None
+            group = list(itertools.islice(items, size))
+            if len(group) == 0:
+                break
+            done = list(map_pages(run, group, max_workers=max_workers))
+            results.extend(done)
+            pending += len([r for r in done if r["error"] is None])
+            if publish_every is not None and pending >= publish_every:
+                published = publish()
+                pending = 0
+            if size is None:
+                break
+
+        if publish_every is not None and (pending > 0 or not published):
+            publish()
+
+        failed = len([r for r in results if r["error"] is not None])
+        return Box(
+            succeeded=len(results) - failed,
+            failed=failed,
+            results=results,
+            publish_errors=publish_errors,
+        )
@@ -0,0 +1,343 @@
+import json
+import logging
+import time
+from typing import Any, Callable, Iterator, List, Tuple
+
+from box import Box
+from requests.exceptions import Timeout
+from restfly.errors import GatewayTimeoutError, RequestTimeoutError
+
+from pycheckpoint_api.utils import map_pages
+
+logger = logging.getLogger(__name__)
+
+# Maximal number of results per request accepted by the server
+MAX_LIMIT = 500
+
+# Maximal number of rules per request when they are shown as ranges
+MAX_LIMIT_AS_RANGES = 20
+
+# Errors raised when a page took too long to be built by the server
+TIMEOUT_ERRORS = (Timeout, GatewayTimeoutError, RequestTimeoutError)
+
+
+class Paginator:
+    """This class fetches every page of a list command (``show-hosts``, ``show-packages``, ``show-access-rulebase``...).
+    The pages can be:
+
+    * merged in a single response, sequentially or with several pages requested at the same time (``all``)
+    * returned one after the other, sequentially or with several pages requested at the same time (``pages``)
+    * streamed item by item, only the current page being kept in memory (``items``)
+
+    In the adaptive mode, the page size is chosen from the time taken by the previous page and from its size in bytes:\
+    it grows while the pages are quickly returned, shrinks when the objects are heavy (``details_level="full"``), and\
+    is halved when a page times out. Pages are then requested one after the other.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[..., Box],
+        key: str = "objects",
+        limit: int = 50,
+        name: str = None,
+        adaptive: bool = False,
+        max_limit: int = MAX_LIMIT,
+        target_time: float = 2.0,
+        target_size: int = 4 * 1024 * 1024,
+    ):
+        """Constructor of the class
+
+        Args:
+            fetch (Callable[..., Box]): Function requesting one page, called with the ``offset`` and ``limit`` keyword\
+            arguments
+            key (str, optional): Key of the response holding the items of the page. Defaults to "objects"
+            limit (int, optional): The maximal number of results per request. Defaults to 50 (between 1 and 500).\
+            In the adaptive mode, it's the size of the first page
+            name (str, optional): Name of the command, used in the logs. Defaults to ``key``
+            adaptive (bool, optional): Adapts the page size to the time taken by the server to return the previous\
+            page, and backs off when a page times out. Defaults to False
+            max_limit (int, optional): The maximal number of results per request accepted by the server.\
+            Defaults to 500 (use 20 for rules shown as ranges)
+            target_time (float, optional): Only used with ``adaptive``. Time, in seconds, a page should take.\
+            Defaults to 2.0
+            target_size (int, optional): Only used with ``adaptive``. Size, in bytes, of the results of a page once\
+            serialized as JSON. Defaults to 4 MiB
+
+        Examples:
+            >>> Paginator(
+            ... lambda offset, limit: firewall.policy.package.show_packages(offset=offset, limit=limit),
+            ... key="packages",
+            ... limit=500)
+            >>> Paginator(fetch, key="objects", adaptive=True)
+        """
+        self._fetch = fetch
+        self.key = key
+        self.max_limit = max_limit
+        self.limit = max(1, min(limit, max_limit))
+        self.name = name if name is not None else key
+        self.adaptive = adaptive
+        self.target_time = target_time
+        self.target_size = target_size
+
+    def fetch(self, offset: int) -> Box:
+        """Requests one page
+
+        Args:
+            offset (int): Number of the results to initially skip
+
+        Returns:
+            :obj:`Box`: The response from the server
+
+        Examples:
+            >>> paginator.fetch(offset=50)
+
+        """
+        return self._fetch(offset=offset, limit=self.limit)
+
+    def offsets(self, total: int) -> List[int]:
+        """Returns the offsets of the pages following the first one
+
+        Args:
+            total (int): Total number of results
+
+        Returns:
+            List[int]: the offsets to request
+
+        Examples:
+            >>> Paginator(fetch, limit=50).offsets(120)
+            [50, 100]
+        """
+        return list(range(self.limit, total, self.limit))
+
+    def pages(self, max_workers: int = 1) -> Iterator[Box]:
+        """Requests every page. The first page gives the total number of results, the following ones are then\
+        requested with up to ``max_workers`` pages at the same time.
+
+        Args:
+            max_workers (int, optional): Number of pages requested at the same time once the total is known.\
+            Defaults to 1 (pages are requested one after the other)
+
+        Returns:
+            Iterator[:obj:`Box`]: The pages, in order
+
+        Examples:
+            >>> for page in paginator.pages(max_workers=4):
+            ...     print(page["from"], page["to"])
+        """
+        if self.adaptive:
+            # The offset of a page depends on the size of the previous one
+            yield from self._adaptive_pages()
+            return
+
+        first = self.fetch(0)
+        yield first
+        yield from map_pages(
+            self.fetch, self.offsets(first.get("total", 0)), max_workers=max_workers
+        )
+
+    def all(self, max_workers: int = 1) -> Box:
+        """Requests every page and merges them in a single response
+
+        Args:
+            max_workers (int, optional): Number of pages requested at the same time once the total is known.\
+            Pages are still merged in order. Defaults to 1 (pages are requested one after the other)
+
+        Returns:
+            :obj:`Box`: The first response from the server, holding the items of every page
+
+        Examples:
+            >>> paginator.all(max_workers=4)
+
+        """
+        result = None
+
+        # Get a timer
+        timer_start = time.time()
+
+        for i, page in enumerate(self.pages(max_workers=max_workers)):
+            if result is None:
+                result = page
+                self._start(result)
+                number_requests = 1 + len(self.offsets(result.get("total", 0)))
+                logger.info(
+                    self.name
+                    + " - Total: "
+                    + str(result.get("total", 0))
+                    + " - Number of requests to do: "
+                    + str(number_requests)
+                    + " (limit set to "
+                    + str(self.limit)
+                    + "/request) - In progress..."
+                )
+            else:
+                self._merge(result, page)
+
+            logger.debug(
+                self.name
+                + " - "
+                + str(i + 1)
+                + "/"
+                + str(number_requests)
+                + " (limit set to "
+                + str(self.limit)
+                + "/request) exported... (offset:"
+                + str(page.get("from", i * self.limit + 1) - 1)
+                + ")"
+            )
+
+        # The adaptive mode only estimates the number of requests up front
+        number_requests = i + 1
+
+        # Finalize the output
+        self._finalize(result)
+
+        # End timer
+        timer_diff = time.time() - timer_start
+
+        timer_text = ""
+
+        if round(timer_diff % 60) != 0:
+            timer_text = (
+                str(int(timer_diff / 60)) + "min " + str(round(timer_diff % 60)) + "s"
+            )  # pragma: no cover
+        else:
+            timer_text = "<1s"
+
+        logger.info(
+            self.name
+            + " - Total: "
+            + str(result.get("total", 0))
+            + " - Number of requests done: "
+            + str(number_requests)
+            + " (limit set to "
+            + str(self.limit)
+            + "/request) - Done in "
+            + timer_text
+        )
+
+        return result
+
+    def items(self) -> Iterator[Any]:
+        """Streams the items of every page. Pages are requested one after the other, only when the items of the\
+        previous one have been consumed.
+
+        Returns:
+            Iterator[Any]: The items, one at a time
+
+        Examples:
+            >>> for obj in paginator.items():
+            ...     print(obj.name)
+        """
+        if self.adaptive:
+            for page in self._adaptive_pages():
+                yield from page.get(self.key, [])
+            return
+
+        offset = 0
+        while True:
+            page = self.fetch(offset)
+            items = page.get(self.key, [])
+
+            logger.debug(
+                self.name
+                + " - "
+                + str(offset + len(items))
+                + "/"
+                + str(page.get("total", 0))
+                + " (limit set to "
+                + str(self.limit)
+                + "/request) streamed... (offset:"
+                + str(offset)
+                + ")"
+            )
+
+            yield from items
+
+            offset += len(items)
+            if len(items) == 0 or offset >= page.get("total", 0):
+                return
+
+    def _adaptive_pages(self) -> Iterator[Box]:
+        """Requests every page one after the other, adapting the page size after each of them"""
+        offset = 0
+        while True:
+            page, elapsed = self._timed_fetch(offset)
+            yield page
+
+            count = self._count(page, offset)
+            offset += count
+            if count == 0 or offset >= page.get("total", 0):
+                return
+            self._adapt(elapsed, count, self._size(page))
+
+    def _timed_fetch(self, offset: int) -> Tuple[Box, float]:
+        """Requests a page, halving the page size each time the request times out"""
+        while True:
+            start = time.monotonic()
+            try:
+                page = self.fetch(offset)
+            except TIMEOUT_ERRORS:
+                if self.limit == 1:
+                    raise
+                self.limit = max(1, self.limit // 2)
+                logger.warning(
+                    self.name
+                    + " - Request timed out (offset:"
+                    + str(offset)
+                    + "), limit lowered to "
+                    + str(self.limit)
+                    + "/request"
+                )
+                continue
+            return page, time.monotonic() - start
+
+    def _count(self, page: Box, offset: int) -> int:
+        """Returns the number of results of a page. Rules nested in sections are counted with the ``to`` field"""
+        if "to" in page:
+            return max(0, page["to"] - offset)
+        return len(page.get(self.key, []))
+
+    def _size(self, page: Box) -> int:
+        """Returns the size in bytes of the results of a page, serialized as JSON"""
+        return len(
+            json.dumps(page.get(self.key, []), separators=(",", ":"), default=str)
+        )
+
+    def _adapt(self, elapsed: float, count: int, size: int = 0):
+        """Chooses the size of the next page from the time taken by the last one and from its size in bytes.
+        The time per result grows with the size of the results, but a fast server may still return pages too large\
+        to be parsed and kept in memory comfortably, so the page size is also capped to weigh about ``target_size``.
+        The page size is at most doubled from one page to the next one, to stay clear of the timeouts.
+        """
+        if elapsed <= 0:
+            wanted = self.limit * 2
+        else:
+            wanted = int(self.target_time * count / elapsed)
+        if size > 0:
+            wanted = min(wanted, int(self.target_size * count / size))
+        limit = max(1, min(wanted, self.limit * 2, self.max_limit))
+        if limit != self.limit:
+            logger.debug(
+                self.name
+                + " - Last page took "
+                + str(round(elapsed, 2))
+                + "s ("
+                + str(size)
+                + " bytes), limit set to "
+                + str(limit)
+                + "/request"
+            )
+            self.limit = limit
+
+    def _start(self, result: Box):
+        """Prepares the first page to receive the items of the following ones"""
+
+    def _merge(self, result: Box, page: Box):
+        """Adds the items of a page to the merged response"""
+        # dict.get keeps the items as they are: lazy views are not built for a merge
+        result.setdefault(self.key, []).extend(dict.get(page, self.key, []))
+
+    def _finalize(self, result: Box):
+        """Completes the merged response once every page has been added"""
+        if "total" in result:
+            result["to"] = result["total"]
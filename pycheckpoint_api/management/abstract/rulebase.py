@@ -0,0 +1,260 @@
+import logging
+import sys
+from typing import Callable, Iterable, Iterator, List
+
+from box import Box
+
+from .paginator import MAX_LIMIT, Paginator
+
+logger = logging.getLogger(__name__)
+
+
+def merge_rulebase(rulebase: List[dict], page: List[dict]) -> None:
+    """Appends the content of a rulebase page to the rulebase gathered so far.
+    When a section is cut by the page boundary, the server sends it again at the beginning of the next page:
+    its rules are appended to the section already known instead of creating a duplicate section.
+
+    Args:
+        rulebase (List[dict]): The rulebase gathered so far, updated in place
+        page (List[dict]): The rulebase of the next page
+
+    Examples:
+        >>> rulebase = [{"uid": "s1", "type": "access-section", "from": 1, "to": 2, "rulebase": [r1, r2]}]
+        >>> merge_rulebase(rulebase, [{"uid": "s1", "type": "access-section", "from": 3, "to": 3, "rulebase": [r3]}])
+        >>> rulebase
+        [{"uid": "s1", "type": "access-section", "from": 1, "to": 3, "rulebase": [r1, r2, r3]}]
+    """
+    if len(rulebase) > 0 and len(page) > 0:
+        last, first = rulebase[-1], page[0]
+        if (
+            "rulebase" in last
+            and "rulebase" in first
+            and last.get("uid") == first.get("uid")
+        ):
+            last["rulebase"].extend(first["rulebase"])
+            if "to" in first:
+                last["to"] = first["to"]
+            page = page[1:]
+
+    rulebase.extend(page)
+
+
+class ObjectsDictionary:
+    """This class is a uid-keyed table of the objects referenced by a rulebase (its ``objects-dictionary``).
+    Every page of a rulebase comes with its own dictionary: gathering them in this table keeps a single entry per uid,
+    whatever the number of pages referencing it.
+    """
+
+    def __init__(self, objects: Iterable[dict] = None):
+        """Constructor of the class
+
+        Args:
+            objects (Iterable[dict], optional): Objects to add in the table. Defaults to None
+
+        Examples:
+            >>> ObjectsDictionary(resp["objects-dictionary"])
+
+        """
+        self._objects = {}
+        if objects is not None:
+            self.update(objects)
+
+    def update(self, objects: Iterable[dict]) -> None:
+        """Adds the objects of a page. Objects already known are ignored so the first entry is always the shared one.
+
+        Args:
+            objects (Iterable[dict]): Objects to add in the table
+
+        Examples:
+            >>> table.update(resp["objects-dictionary"])
+
+        """
+        for obj in objects:
+            self._objects.setdefault(sys.intern(obj["uid"]), obj)
+
+    def get(self, uid: str, default: dict = None) -> dict:
+        return self._objects.get(uid, default)
+
+    def __getitem__(self, uid: str) -> dict:
+        return self._objects[uid]
+
+    def __contains__(self, uid: str) -> bool:
+        return uid in self._objects
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self._objects.values())
+
+    def resolve(self, rulebase: List[dict]) -> None:
+        """Replaces, in place, the uids referenced by the rules with the shared entries of the table.
+        Sections are processed recursively. Rules then point to the same object for a given uid instead of holding\
+        their own copy.
+
+        Args:
+            rulebase (List[dict]): The rulebase to process
+
+        Examples:
+            >>> table.resolve(resp.rulebase)
+            >>> resp.rulebase[0].source[0].name
+            "Any"
+        """
+        for item in rulebase:
+            for key, value in item.items():
+                if key == "uid":
+                    continue
+                if key == "rulebase" and isinstance(value, list):
+                    self.resolve(value)
+                else:
+                    self._resolve_value(item, key, value)
+
+    def _resolve_value(self, container: dict, key: str, value) -> None:
+        """Replaces a reference, or a list of references, without letting a Box copy the shared entry"""
+        if isinstance(value, str):
+            if value in self._objects:
+                dict.__setitem__(container, key, self._objects[value])
+        elif isinstance(value, list):
+            for i, element in enumerate(value):
+                if isinstance(element, str) and element in self._objects:
+                    list.__setitem__(value, i, self._objects[element])
+        elif isinstance(value, dict):
+            for k, v in value.items():
+                if k != "uid":
+                    self._resolve_value(value, k, v)
+
+
+class RulebasePaginator(Paginator):
+    """This class fetches every page of a rulebase (``show-access-rulebase``, ``show-nat-rulebase``...).
+    Sections cut between two pages are merged back together and the ``objects-dictionary`` of every page is gathered\
+    in a single table, with one entry per uid.
+
+    The items of a page are sections holding several rules: the pages requested one after the other start where the\
+    ``to`` field of the previous one ends, instead of after the number of items received.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[..., Box],
+        limit: int = 50,
+        name: str = "rulebase",
+        resolve_objects: bool = False,
+        adaptive: bool = False,
+        max_limit: int = MAX_LIMIT,
+    ):
+        """Constructor of the class
+
+        Args:
+            fetch (Callable[..., Box]): Function requesting one page, called with the ``offset`` and ``limit`` keyword\
+            arguments
+            limit (int, optional): The maximal number of results per request. Defaults to 50
+            name (str, optional): Name of the command, used in the logs. Defaults to "rulebase"
+            resolve_objects (bool, optional): Replace the uids referenced by the rules with the matching entry of the\
+            objects dictionary, shared by all the rules. Defaults to False
+            adaptive (bool, optional): Adapts the page size to the time taken by the server to return the previous\
+            page, and backs off when a page times out. Defaults to False
+            max_limit (int, optional): The maximal number of rules per request accepted by the server.\
+            Defaults to 500 (use 20 for rules shown as ranges)
+
+        Examples:
+            >>> RulebasePaginator(
+            ... lambda offset, limit: firewall.access_control_nat.access_rule.show_access_rulebase(
+            ...     name="Network", offset=offset, limit=limit, use_object_dictionnary=True),
+            ... name="access-rules",
+            ... resolve_objects=True)
+        """
+        super(RulebasePaginator, self).__init__(
+            fetch,
+            key="rulebase",
+            limit=limit,
+            name=name,
+            adaptive=adaptive,
+            max_limit=max_limit,
+        )
+        self.resolve_objects = resolve_objects
+        self._objects_dictionary = None
+
+    def pages(self, max_workers: int = 1) -> Iterator[Box]:
+        """Requests every page. With ``max_workers``, the offsets are computed from the total number of rules given\
+        by the first page. Otherwise, each page starts where the ``to`` field of the previous one ends.
+
+        Args:
+            max_workers (int, optional): Number of pages requested at the same time once the total is known.\
+            Defaults to 1 (pages are requested one after the other)
+
+        Returns:
+            Iterator[:obj:`Box`]: The pages, in order
+
+        Examples:
+            >>> for page in paginator.pages():
+            ...     print(page["from"], page["to"])
+        """
+        if self.adaptive or max_workers > 1:
+            yield from super(RulebasePaginator, self).pages(max_workers=max_workers)
+            return
+
+        offset = 0
+        while True:
+            page = self.fetch(offset)
+            yield page
+
+            count = self._count(page, offset)
+            offset += count
+            logger.debug(
+                self.name
+                + " - "
+                + str(offset)
+                + "/"
+                + str(page.get("total", 0))
+                + " (limit set to "
+                + str(self.limit)
+                + "/request) streamed..."
+            )
+            if count == 0 or offset >= page.get("total", 0):
+                return
+
+    def items(self) -> Iterator[Box]:
+        """Streams the sections and the rules outside of any section. A section cut between two pages is only\
+        returned once its last rules are received, merged back together. Only the current page is kept in memory,\
+        along with the objects dictionary gathered so far when ``resolve_objects`` is set.
+
+        Returns:
+            Iterator[:obj:`Box`]: The sections and rules of the rulebase, one at a time
+
+        Examples:
+            >>> for item in paginator.items():
+            ...     print(item.uid)
+        """
+        objects_dictionary = ObjectsDictionary()
+        last = None
+        for page in self.pages():
+            rulebase = list(page.get("rulebase", []))
+            if self.resolve_objects:
+                objects_dictionary.update(page.get("objects-dictionary", []))
+                objects_dictionary.resolve(rulebase)
+            if last is not None:
+                # The last item of the previous page may go on in this one
+                merged = [last]
+                merge_rulebase(merged, rulebase)
+                rulebase = merged
+            last = rulebase.pop() if len(rulebase) > 0 else None
+            yield from rulebase
+        if last is not None:
+            yield last
+
+    def _start(self, result: Box):
+        self._objects_dictionary = ObjectsDictionary(
+            result.get("objects-dictionary", [])
+        )
+
+    def _merge(self, result: Box, page: Box):
+        merge_rulebase(result["rulebase"], page.get("rulebase", []))
+        self._objects_dictionary.update(page.get("objects-dictionary", []))
+
+    def _finalize(self, result: Box):
+        super(RulebasePaginator, self)._finalize(result)
+        if len(self._objects_dictionary) > 0:
+            result.setdefault("objects-dictionary", [])
+            result["objects-dictionary"][:] = list(self._objects_dictionary)
+            if self.resolve_objects:
+                self._objects_dictionary.resolve(result["rulebase"])
@@ -1,11 +1,13 @@
-from typing import List, Union
+import functools
+from typing import Iterator, List, Union
 
 from box import Box
 from restfly.endpoint import APIEndpoint
 
 from pycheckpoint_api.models import Color
-from pycheckpoint_api.utils import sanitize_secondary_parameters
+from pycheckpoint_api.utils import response_options, sanitize_secondary_parameters
 
+from ..abstract.paginator import Paginator
 from ..exception import MandatoryFieldMissing
 
 
@@ -119,6 +121,12 @@ class AccessLayer(APIEndpoint):
             name (str, optional): Object name. Mandatory if "rule_number" or "uid" are not set.
 
         Keyword Args:
+            **raw (bool, optional):
+                Returns plain dictionaries and lists instead of Box objects, skipping the conversion.\
+                Defaults to the ``raw`` setting of the client.
+            **lazy (bool, optional):
+                Returns lazy views instead of Box objects: nested objects are only converted when they are accessed.\
+                Defaults to the ``lazy`` setting of the client.
             **details_level (str, optional):
                 The level of detail for some of the fields in the response can vary from showing only the UID value\
                 of the object to a fully detailed representation of the object.
@@ -145,7 +153,7 @@ class AccessLayer(APIEndpoint):
 
         payload.update(sanitize_secondary_parameters(secondary_parameters, **kw))
 
-        return self._post("show-access-layer", json=payload)
+        return self._post("show-access-layer", json=payload, **response_options(**kw))
 
     def set(
         self,
@@ -299,6 +307,8 @@ class AccessLayer(APIEndpoint):
         limit: int = 50,
         offset: int = 0,
         order: List[dict] = None,
+        show_all: bool = False,
+        max_workers: int = 1,
         **kw,
     ) -> Box:
         """
@@ -311,8 +321,19 @@ class AccessLayer(APIEndpoint):
             he search involves both a IP search and a textual search in name, comment, tags etc.
             limit (int): The maximal number of returned results. Defaults to 50 (between 1 and 500)
             offset (int): Number of the results to initially skip. Defaults to 0
+            order (List[dict], optional): Sorts results by the given field. Defaults to None
+            show_all (bool, optional): Indicates if you want to shown all objects or not. If yes, `offset` will be ignored.\
+            Defaults to False
+            max_workers (int, optional): Only used with `show_all`. Number of pages requested at the same time once the\
+            total is known. Defaults to 1 (pages are requested one after the other)
 
         Keyword Args:
+            **raw (bool, optional):
+                Returns plain dictionaries and lists instead of Box objects, skipping the conversion.\
+                Defaults to the ``raw`` setting of the client.
+            **lazy (bool, optional):
+                Returns lazy views instead of Box objects: nested objects are only converted when they are accessed.\
+                Defaults to the ``lazy`` setting of the client.
             **details_level (str, optional):
                 The level of detail for some of the fields in the response can vary from showing only the UID value\
                 of the object to a fully detailed representation of the object.
@@ -327,6 +348,18 @@ class AccessLayer(APIEndpoint):
         Examples:
             >>> management.access_control_nat.access_layer.show_access_layers()
         """
+        if show_all:
+            return Paginator(
+                functools.partial(
+                    self.show_access_layers,
+                    filter_results=filter_results,
+                    order=order,
+                    **kw,
+                ),
+                key="access-layers",
+                limit=limit,
+                name="show-access-layers",
+            ).all(max_workers=max_workers)
 
         # Main request parameters
         payload = {}
@@ -347,4 +380,50 @@ class AccessLayer(APIEndpoint):
 
         payload.update(sanitize_secondary_parameters(secondary_parameters, **kw))
 
-        return self._post("show-access-layers", json=payload)
+        return self._post("show-access-layers", json=payload, **response_options(**kw))
+
+    def iter_access_layers(
+        self,
+        filter_results: str = None,
+        limit: int = 50,
+        order: List[dict] = None,
+        **kw,
+    ) -> Iterator[Box]:
+        """
+        Iterate over all objects, page by page. Only the current page is kept in memory.
+
+        Args:
+            filter_results (str): Search expression to filter objects by.\
+            The provided text should be exactly the same as it would be given in SmartConsole Object Explorer.\
+            The logical operators in the expression ('AND', 'OR') should be provided in capital letters.\
+            he search involves both a IP search and a textual search in name, comment, tags etc.
+            limit (int): The maximal number of results per request. Defaults to 50 (between 1 and 500)
+            order (List[dict], optional): Sorts results by the given field. Defaults to None
+
+        Keyword Args:
+            **details_level (str, optional):
+                The level of detail for some of the fields in the response can vary from showing only the UID value\
+                of the object to a fully detailed representation of the object.
+            **domains_to_process (List[str], optional):
+                Indicates which domains to process the commands on. It cannot be used with the details_level full,\
+                must be run from the System Domain only and with ignore_warnings true.\
+                Valid values are: CURRENT_DOMAIN, ALL_DOMAINS_ON_THIS_SERVER.
+
+        Returns:
+            Iterator[:obj:`Box`]: The objects, one at a time
+
+        Examples:
+            >>> for obj in management.access_control_nat.access_layer.iter_access_layers():
+            ...     print(obj.name)
+        """
+        yield from Paginator(
+            functools.partial(
+                self.show_access_layers,
+                filter_results=filter_results,
+                order=order,
+                **kw,
+            ),
+            key="access-layers",
+            limit=limit,
+            name="show-access-layers",
+        ).items()
@@ -1,12 +1,13 @@
 import logging
-import time
-from typing import List, Union
+from typing import Iterator, List, Union
 
 from box import Box
 from restfly.endpoint import APIEndpoint
 
-from pycheckpoint_api.utils import sanitize_secondary_parameters
+from pycheckpoint_api.utils import response_options, sanitize_secondary_parameters
 
+from ..abstract.paginator import MAX_LIMIT, MAX_LIMIT_AS_RANGES
+from ..abstract.rulebase import RulebasePaginator
 from ..exception import MandatoryFieldMissing
 
 logger = logging.getLogger(__name__)
@@ -206,6 +207,12 @@ class AccessRule(APIEndpoint):
             hits_settings (bool, optional): N/A
 
         Keyword Args:
+            **raw (bool, optional):
+                Returns plain dictionaries and lists instead of Box objects, skipping the conversion.\
+                Defaults to the ``raw`` setting of the client.
+            **lazy (bool, optional):
+                Returns lazy views instead of Box objects: nested objects are only converted when they are accessed.\
+                Defaults to the ``lazy`` setting of the client.
             **details_level (str, optional):
                 The level of detail for some of the fields in the response can vary from showing only the UID value\
                 of the object to a fully detailed representation of the object.
@@ -245,7 +252,7 @@ class AccessRule(APIEndpoint):
 
         payload.update(sanitize_secondary_parameters(secondary_parameters, **kw))
 
-        return self._post("show-access-rule", json=payload)
+        return self._post("show-access-rule", json=payload, **response_options(**kw))
 
     def set(
         self,
@@ -488,6 +495,9 @@ class AccessRule(APIEndpoint):
         show_hits: bool = None,
         use_object_dictionnary: bool = None,
         hits_settings: dict = None,
+        max_workers: int = 1,
+        resolve_objects: bool = False,
+        adaptive: bool = False,
         **kw,
     ) -> Box:
         """Shows the entire Access Rules layer. This layer is divided into sections. An Access Rule may be within a section,
@@ -521,8 +531,23 @@ class AccessRule(APIEndpoint):
             show_hits (bool, optional): N/A
             use_object_dictionnary (bool, optional): N/A
             hits_settings (dict, optional): N/A
+            max_workers (int, optional): Only used with `show_all`. Number of pages requested at the same time once the\
+            total is known. Defaults to 1 (pages are requested one after the other)
+            resolve_objects (bool, optional): Only used with `show_all` and `use_object_dictionnary`. Replace the uids\
+            referenced by the rules with the matching entry of the objects dictionary, shared by all the rules.\
+            Defaults to False
+            adaptive (bool, optional): Only used with `show_all`. Adapts the page size to the time taken by the server\
+            to return the previous page, starting from `limit` and up to 500, and backs off when a page times out.\
+            Pages are then requested one after the other. The page size is capped at 20 rules with `show_as_ranges`.\
+            Defaults to False
 
         Keyword Args:
+            **raw (bool, optional):
+                Returns plain dictionaries and lists instead of Box objects, skipping the conversion.\
+                Defaults to the ``raw`` setting of the client.
+            **lazy (bool, optional):
+                Returns lazy views instead of Box objects: nested objects are only converted when they are accessed.\
+                Defaults to the ``lazy`` setting of the client.
             **details_level (str, optional):
                 The level of detail for some of the fields in the response can vary from showing only the UID value\
                 of the object to a fully detailed representation of the object.
@@ -552,6 +577,9 @@ class AccessRule(APIEndpoint):
                 show_hits=show_hits,
                 use_object_dictionnary=use_object_dictionnary,
                 hits_settings=hits_settings,
+                max_workers=max_workers,
+                resolve_objects=resolve_objects,
+                adaptive=adaptive,
                 **kw,
             )
         else:
@@ -571,6 +599,100 @@ class AccessRule(APIEndpoint):
                 **kw,
             )
 
+    def iter_access_rulebase(
+        self,
+        name: str = None,
+        uid: str = None,
+        filter_results: str = None,
+        filter_settings: dict = None,
+        limit: int = 50,
+        order: List[dict] = None,
+        package: str = None,
+        show_as_ranges: bool = False,
+        show_hits: bool = None,
+        use_object_dictionnary: bool = None,
+        hits_settings: dict = None,
+        resolve_objects: bool = False,
+        adaptive: bool = False,
+        **kw,
+    ) -> Iterator[Box]:
+        """
+        Iterate over the Access Rules layer, page by page. Only the current page is kept in memory.\
+        Sections cut between two pages are merged back together before being returned.
+
+        Args:
+            name (str, optional): Object name. Must be unique in the domain.
+            uid (str, optional): Object unique identifier.
+            filter_results (str, optional): Search expression to filter objects by.\
+            The provided text should be exactly the same as it would be given in SmartConsole Object Explorer.\
+            The logical operators in the expression ('AND', 'OR') should be provided in capital letters.\
+            he search involves both a IP search and a textual search in name, comment, tags etc.
+            filter_settings (str, optional): Sets filter preferences.
+            limit (int, optional): The maximal number of rules per request. Defaults to 50 (between 1 and 500)
+            order (List[dict], optional): Sorts results by the given field. By default the results are sorted in the \
+            descending order by the session publish time.
+            package (str, optional): Name of the package.
+            show_as_ranges (bool, optional): Shows the source, destination and services & applications parameters\
+            as ranges of IP addresses and port numbers. Pages are then limited to 20 rules.
+            show_hits (bool, optional): N/A
+            use_object_dictionnary (bool, optional): N/A
+            hits_settings (dict, optional): N/A
+            resolve_objects (bool, optional): Replace the uids referenced by the rules with the matching entry of the\
+            objects dictionary, shared by all the rules. Requires `use_object_dictionnary`. Defaults to False
+            adaptive (bool, optional): Adapts the page size to the time taken by the server to return the previous\
+            page, and backs off when a page times out. Defaults to False
+
+        Keyword Args:
+            **raw (bool, optional):
+                Returns plain dictionaries and lists instead of Box objects, skipping the conversion.\
+                Defaults to the ``raw`` setting of the client.
+            **lazy (bool, optional):
+                Returns lazy views instead of Box objects: nested objects are only converted when they are accessed.\
+                Defaults to the ``lazy`` setting of the client.
+            **details_level (str, optional):
+                The level of detail for some of the fields in the response can vary from showing only the UID value\
+                of the object to a fully detailed representation of the object.
+            **show_membership (bool, optional):
+                Indicates whether to calculate and show "groups" field for every object in reply.
+            **dereference_group_members (bool, optional):
+                Indicates whether to dereference "members" field by details level for every object in reply.
+
+        Returns:
+            Iterator[:obj:`Box`]: The sections, and the rules outside of any section, one at a time
+
+        Examples:
+            >>> for section in firewall.access_control_nat.access_rule.iter_access_rulebase(name="Network"):
+            ...     print(section.name)
+        """
+        if uid is None and name is None:
+            raise MandatoryFieldMissing("uid or name")
+
+        def fetch(offset: int, limit: int) -> Box:
+            return self._show_partial_access_rulebase(
+                name=name,
+                uid=uid,
+                filter_results=filter_results,
+                filter_settings=filter_settings,
+                limit=limit,
+                offset=offset,
+                order=order,
+                package=package,
+                show_as_ranges=show_as_ranges,
+                show_hits=show_hits,
+                use_object_dictionnary=use_object_dictionnary,
+                hits_settings=hits_settings,
+                **kw,
+            )
+
+        yield from RulebasePaginator(
+            fetch,
+            limit=limit,
+            name="access-rules",
+            resolve_objects=resolve_objects,
+            adaptive=adaptive,
+            max_limit=MAX_LIMIT_AS_RANGES if show_as_ranges else MAX_LIMIT,
+        ).items()
+
     def _show_partial_access_rulebase(
         self,
         name: str = None,
@@ -614,6 +736,12 @@ class AccessRule(APIEndpoint):
             hits_settings (dict, optional): N/A
 
         Keyword Args:
+            **raw (bool, optional):
+                Returns plain dictionaries and lists instead of Box objects, skipping the conversion.\
+                Defaults to the ``raw`` setting of the client.
+            **lazy (bool, optional):
+                Returns lazy views instead of Box objects: nested objects are only converted when they are accessed.\
+                Defaults to the ``lazy`` setting of the client.
             **details_level (str, optional):
                 The level of detail for some of the fields in the response can vary from showing only the UID value\
                 of the object to a fully detailed representation of the object.
@@ -667,7 +795,9 @@ class AccessRule(APIEndpoint):
 
         payload.update(sanitize_secondary_parameters(secondary_parameters, **kw))
 
-        return self._post("show-access-rulebase", json=payload)
+        return self._post(
+            "show-access-rulebase", json=payload, **response_options(**kw)
+        )
 
     def _show_all_access_rulebase(
         self,
@@ -682,6 +812,9 @@ class AccessRule(APIEndpoint):
         show_hits: bool = None,
         use_object_dictionnary: bool = None,
         hits_settings: dict = None,
+        max_workers: int = 1,
+        resolve_objects: bool = False,
+        adaptive: bool = False,
         **kw,
     ) -> Box:
         """Retrieve all objects
@@ -709,8 +842,20 @@ class AccessRule(APIEndpoint):
             show_hits (bool, optional): N/A
             use_object_dictionnary (bool, optional): N/A
             hits_settings (dict, optional): N/A
+            max_workers (int, optional): Number of pages requested at the same time once the total is known.\
+            Pages are still merged in order. Defaults to 1 (pages are requested one after the other)
+            resolve_objects (bool, optional): Replace the uids referenced by the rules with the matching entry of the\
+            objects dictionary, shared by all the rules. Requires `use_object_dictionnary`. Defaults to False
+            adaptive (bool, optional): Adapts the page size to the time taken by the server to return the previous\
+            page, and backs off when a page times out. `max_workers` is then ignored. Defaults to False
 
         Keyword Args:
+            **raw (bool, optional):
+                Returns plain dictionaries and lists instead of Box objects, skipping the conversion.\
+                Defaults to the ``raw`` setting of the client.
+            **lazy (bool, optional):
+                Returns lazy views instead of Box objects: nested objects are only converted when they are accessed.\
+                Defaults to the ``lazy`` setting of the client.
             **details_level (str, optional):
                 The level of detail for some of the fields in the response can vary from showing only the UID value\
                 of the object to a fully detailed representation of the object.
@@ -720,64 +865,21 @@ class AccessRule(APIEndpoint):
                 Indicates whether to dereference "members" field by details level for every object in reply.
 
         Returns:
-            :obj:`Box`: The response from the server
+            :obj:`Box`: The response from the server. Sections cut between two pages are merged back together and\
+            the ``objects-dictionary`` of every page is gathered in a single table, with one entry per uid.
 
         Examples:
             >>> firewall.access_control_nat.access_rule._show_all_access_rulebase()
         """
-        all_rules = None
-
-        # Get a timer
-        timer_start = time.time()
-
-        # Made a first request to determine the total number of objects
-        resp = self._show_partial_access_rulebase(
-            name=name,
-            uid=uid,
-            filter_results=filter_results,
-            filter_settings=filter_settings,
-            limit=limit,
-            offset=0,
-            order=order,
-            package=package,
-            show_as_ranges=show_as_ranges,
-            show_hits=show_hits,
-            use_object_dictionnary=use_object_dictionnary,
-            hits_settings=hits_settings,
-            **kw,
-        )
-
-        # Add the first results
-        all_rules = resp
 
-        # Evaluate the number of requests to be done
-        number_requests = int(resp.total / limit) + 1
-
-        logger.info(
-            "access-rules - Total: "
-            + str(resp.total)
-            + " - Number of requests to do: "
-            + str(number_requests)
-            + " (limit set to "
-            + str(limit)
-            + "/request) - In progress..."
-        )
-        logger.debug(
-            "access-rules - 1/"
-            + str(number_requests)
-            + " (limit set to "
-            + str(limit)
-            + "/request) exported... (offset:0)"
-        )
-
-        for i in range(1, number_requests):
-            resp = self._show_partial_access_rulebase(
+        def fetch(offset: int, limit: int) -> Box:
+            return self._show_partial_access_rulebase(
                 name=name,
                 uid=uid,
                 filter_results=filter_results,
                 filter_settings=filter_settings,
                 limit=limit,
-                offset=i * limit,
+                offset=offset,
                 order=order,
                 package=package,
                 show_as_ranges=show_as_ranges,
@@ -787,44 +889,11 @@ class AccessRule(APIEndpoint):
                 **kw,
             )
 
-            logger.debug(
-                "access-rules - "
-                + str(i + 1)
-                + "/"
-                + str(number_requests)
-                + " (limit set to "
-                + str(limit)
-                + "/request) exported... (offset:"
-                + str(i)
-                + ")"
-            )
-
-            all_rules.rulebase += resp.rulebase
-
-        # Finalize the output
-        all_rules.to = all_rules.total
-
-        # End timer
-        timer_diff = time.time() - timer_start
-
-        timer_text = ""
-
-        if round(timer_diff % 60) != 0:
-            timer_text = (
-                str(int(timer_diff / 60)) + "min " + str(round(timer_diff % 60)) + "s"
-            )  # pragma: no cover
-        else:
-            timer_text = "<1s"
-
-        logger.info(
-            "access-rules - Total: "
-            + str(resp.total)
-            + " - Number of requests done: "
-            + str(number_requests)
-            + " (limit set to "
-            + str(limit)
-            + "/request) - Done in "
-            + timer_text
-        )
-
-        return all_rules
+        return RulebasePaginator(
+            fetch,
+            limit=limit,
+            name="access-rules",
+            resolve_objects=resolve_objects,
+            adaptive=adaptive,
+            max_limit=MAX_LIMIT_AS_RANGES if show_as_ranges else MAX_LIMIT,
+        ).all(max_workers=max_workers)
@@ -3,7 +3,7 @@ from typing import Union
 from box import Box
 from restfly.endpoint import APIEndpoint
 
-from pycheckpoint_api.utils import sanitize_secondary_parameters
+from pycheckpoint_api.utils import response_options, sanitize_secondary_parameters
 
 from ..exception import MandatoryFieldMissing
 
@@ -79,6 +79,12 @@ class AccessSection(APIEndpoint):
             name (str, optional): Object name. Mandatory if "rule_number" or "uid" are not set.
 
         Keyword Args:
+            **raw (bool, optional):
+                Returns plain dictionaries and lists instead of Box objects, skipping the conversion.\
+                Defaults to the ``raw`` setting of the client.
+            **lazy (bool, optional):
+                Returns lazy views instead of Box objects: nested objects are only converted when they are accessed.\
+                Defaults to the ``lazy`` setting of the client.
             **details_level (str, optional):
                 The level of detail for some of the fields in the response can vary from showing only the UID value\
                 of the object to a fully detailed representation of the object.
@@ -106,7 +112,7 @@ class AccessSection(APIEndpoint):
 
         payload.update(sanitize_secondary_parameters(secondary_parameters, **kw))
 
-        return self._post("show-access-section", json=payload)
+        return self._post("show-access-section", json=payload, **response_options(**kw))
 
     def set(
         self,
@@ -1,12 +1,12 @@
 import logging
-import time
-from typing import List, Union
+from typing import Iterator, List, Union
 
 from box import Box
 from restfly.endpoint import APIEndpoint
 
-from pycheckpoint_api.utils import sanitize_secondary_parameters
+from pycheckpoint_api.utils import response_options, sanitize_secondary_parameters
 
+from ..abstract.rulebase import RulebasePaginator
 from ..exception import MandatoryFieldMissing
 
 logger = logging.getLogger(__name__)
@@ -133,6 +133,12 @@ class NATRule(APIEndpoint):
             name (str, optional): Object name. Mandatory if "rule_number" or "uid" are not set.
 
         Keyword Args:
+            **raw (bool, optional):
+                Returns plain dictionaries and lists instead of Box objects, skipping the conversion.\
+                Defaults to the ``raw`` setting of the client.
+            **lazy (bool, optional):
+                Returns lazy views instead of Box objects: nested objects are only converted when they are accessed.\
+                Defaults to the ``lazy`` setting of the client.
             **details_level (str, optional):
                 The level of detail for some of the fields in the response can vary from showing only the UID value\
                 of the object to a fully detailed representation of the object.
@@ -162,7 +168,7 @@ class NATRule(APIEndpoint):
 
         payload.update(sanitize_secondary_parameters(secondary_parameters, **kw))
 
-        return self._post("show-nat-rule", json=payload)
+        return self._post("show-nat-rule", json=payload, **response_options(**kw))
 
     def set(
         self,
@@ -345,6 +351,9 @@ class NATRule(APIEndpoint):
         show_hits: bool = None,
         use_object_dictionnary: bool = None,
         hits_settings: dict = None,
+        max_workers: int = 1,
+        resolve_objects: bool = False,
+        adaptive: bool = False,
         **kw,
     ) -> Box:
         """Shows the entire NAT Rules layer. This layer is divided into sections. A NAT Rule may be within a section,
@@ -371,8 +380,22 @@ class NATRule(APIEndpoint):
             show_hits (bool, optional): N/A
             use_object_dictionnary (bool, optional): N/A
             hits_settings (dict, optional): N/A
+            max_workers (int, optional): Only used with `show_all`. Number of pages requested at the same time once the\
+            total is known. Defaults to 1 (pages are requested one after the other)
+            resolve_objects (bool, optional): Only used with `show_all` and `use_object_dictionnary`. Replace the uids\
+            referenced by the rules with the matching entry of the objects dictionary, shared by all the rules.\
+            Defaults to False
+            adaptive (bool, optional): Only used with `show_all`. Adapts the page size to the time taken by the server\
+            to return the previous page, starting from `limit` and up to 500, and backs off when a page times out.\
+            Pages are then requested one after the other. Defaults to False
 
         Keyword Args:
+            **raw (bool, optional):
+                Returns plain dictionaries and lists instead of Box objects, skipping the conversion.\
+                Defaults to the ``raw`` setting of the client.
+            **lazy (bool, optional):
+                Returns lazy views instead of Box objects: nested objects are only converted when they are accessed.\
+                Defaults to the ``lazy`` setting of the client.
             **details_level (str, optional):
                 The level of detail for some of the fields in the response can vary from showing only the UID value\
                 of the object to a fully detailed representation of the object.
@@ -399,6 +422,9 @@ class NATRule(APIEndpoint):
                 show_hits=show_hits,
                 use_object_dictionnary=use_object_dictionnary,
                 hits_settings=hits_settings,
+                max_workers=max_workers,
+                resolve_objects=resolve_objects,
+                adaptive=adaptive,
                 **kw,
             )
         else:
@@ -415,6 +441,87 @@ class NATRule(APIEndpoint):
                 **kw,
             )
 
+    def iter_nat_rulebase(
+        self,
+        package: str,
+        filter_results: str = None,
+        filter_settings: dict = None,
+        limit: int = 50,
+        order: List[dict] = None,
+        show_hits: bool = None,
+        use_object_dictionnary: bool = None,
+        hits_settings: dict = None,
+        resolve_objects: bool = False,
+        adaptive: bool = False,
+        **kw,
+    ) -> Iterator[Box]:
+        """
+        Iterate over the NAT Rules layer, page by page. Only the current page is kept in memory.\
+        Sections cut between two pages are merged back together before being returned.
+
+        Args:
+            package (str): Name of the package
+            filter_results (str, optional): Search expression to filter objects by.\
+            The provided text should be exactly the same as it would be given in SmartConsole Object Explorer.\
+            The logical operators in the expression ('AND', 'OR') should be provided in capital letters.\
+            he search involves both a IP search and a textual search in name, comment, tags etc.
+            filter_settings (str, optional): Sets filter preferences.
+            limit (int, optional): The maximal number of rules per request. Defaults to 50 (between 1 and 500)
+            order (List[dict], optional): Sorts results by the given field. By default the results are sorted in the \
+            descending order by the session publish time.
+            show_hits (bool, optional): N/A
+            use_object_dictionnary (bool, optional): N/A
+            hits_settings (dict, optional): N/A
+            resolve_objects (bool, optional): Replace the uids referenced by the rules with the matching entry of the\
+            objects dictionary, shared by all the rules. Requires `use_object_dictionnary`. Defaults to False
+            adaptive (bool, optional): Adapts the page size to the time taken by the server to return the previous\
+            page, and backs off when a page times out. Defaults to False
+
+        Keyword Args:
+            **raw (bool, optional):
+                Returns plain dictionaries and lists instead of Box objects, skipping the conversion.\
+                Defaults to the ``raw`` setting of the client.
+            **lazy (bool, optional):
+                Returns lazy views instead of Box objects: nested objects are only converted when they are accessed.\
+                Defaults to the ``lazy`` setting of the client.
+            **details_level (str, optional):
+                The level of detail for some of the fields in the response can vary from showing only the UID value\
+                of the object to a fully detailed representation of the object.
+            **show_membership (bool, optional):
+                Indicates whether to calculate and show "groups" field for every object in reply.
+            **dereference_group_members (bool, optional):
+                Indicates whether to dereference "members" field by details level for every object in reply.
+
+        Returns:
+            Iterator[:obj:`Box`]: The sections, and the rules outside of any section, one at a time
+
+        Examples:
+            >>> for section in firewall.access_control_nat.nat_rule.iter_nat_rulebase(package="MyPackage"):
+            ...     print(section.name)
+        """
+
+        def fetch(offset: int, limit: int) -> Box:
+            return self._show_partial_nat_rulebase(
+                package=package,
+                filter_results=filter_results,
+                filter_settings=filter_settings,
+                limit=limit,
+                offset=offset,
+                order=order,
+                show_hits=show_hits,
+                use_object_dictionnary=use_object_dictionnary,
+                hits_settings=hits_settings,
+                **kw,
+            )
+
+        yield from RulebasePaginator(
+            fetch,
+            limit=limit,
+            name="nat-rules",
+            resolve_objects=resolve_objects,
+            adaptive=adaptive,
+        ).items()
+
     def _show_partial_nat_rulebase(
         self,
         package: str = None,
@@ -446,6 +553,12 @@ class NATRule(APIEndpoint):
             hits_settings (dict, optional): N/A
 
         Keyword Args:
+            **raw (bool, optional):
+                Returns plain dictionaries and lists instead of Box objects, skipping the conversion.\
+                Defaults to the ``raw`` setting of the client.
+            **lazy (bool, optional):
+                Returns lazy views instead of Box objects: nested objects are only converted when they are accessed.\
+                Defaults to the ``lazy`` setting of the client.
             **details_level (str, optional):
                 The level of detail for some of the fields in the response can vary from showing only the UID value\
                 of the object to a fully detailed representation of the object.
@@ -491,7 +604,7 @@ class NATRule(APIEndpoint):
 
         payload.update(sanitize_secondary_parameters(secondary_parameters, **kw))
 
-        return self._post("show-nat-rulebase", json=payload)
+        return self._post("show-nat-rulebase", json=payload, **response_options(**kw))
 
     def _show_all_nat_rulebase(
         self,
@@ -503,6 +616,9 @@ class NATRule(APIEndpoint):
         show_hits: bool = None,
         use_object_dictionnary: bool = None,
         hits_settings: dict = None,
+        max_workers: int = 1,
+        resolve_objects: bool = False,
+        adaptive: bool = False,
         **kw,
     ) -> Box:
         """Retrieve all objects
@@ -522,8 +638,20 @@ class NATRule(APIEndpoint):
             show_hits (bool, optional): N/A
             use_object_dictionnary (bool, optional): N/A
             hits_settings (dict, optional): N/A
+            max_workers (int, optional): Number of pages requested at the same time once the total is known.\
+            Pages are still merged in order. Defaults to 1 (pages are requested one after the other)
+            resolve_objects (bool, optional): Replace the uids referenced by the rules with the matching entry of the\
+            objects dictionary, shared by all the rules. Requires `use_object_dictionnary`. Defaults to False
+            adaptive (bool, optional): Adapts the page size to the time taken by the server to return the previous\
+            page, and backs off when a page times out. `max_workers` is then ignored. Defaults to False
 
         Keyword Args:
+            **raw (bool, optional):
+                Returns plain dictionaries and lists instead of Box objects, skipping the conversion.\
+                Defaults to the ``raw`` setting of the client.
+            **lazy (bool, optional):
+                Returns lazy views instead of Box objects: nested objects are only converted when they are accessed.\
+                Defaults to the ``lazy`` setting of the client.
             **details_level (str, optional):
                 The level of detail for some of the fields in the response can vary from showing only the UID value\
                 of the object to a fully detailed representation of the object.
@@ -533,60 +661,20 @@ class NATRule(APIEndpoint):
                 Indicates whether to dereference "members" field by details level for every object in reply.
 
         Returns:
-            :obj:`Box`: The response from the server
+            :obj:`Box`: The response from the server. Sections cut between two pages are merged back together and\
+            the ``objects-dictionary`` of every page is gathered in a single table, with one entry per uid.
 
         Examples:
             >>> firewall.access_control_nat.nat_rule._show_all_nat_rulebase(package="MyPackage")
         """
-        all_rules = None
 
-        # Get a timer
-        timer_start = time.time()
-
-        # Made a first request to determine the total number of objects
-        resp = self._show_partial_nat_rulebase(
-            package=package,
-            filter_results=filter_results,
-            filter_settings=filter_settings,
-            limit=limit,
-            offset=0,
-            order=order,
-            show_hits=show_hits,
-            use_object_dictionnary=use_object_dictionnary,
-            hits_settings=hits_settings,
-            **kw,
-        )
-
-        # Add the first results
-        all_rules = resp
-
-        # Evaluate the number of requests to be done
-        number_requests = int(resp.total / limit) + 1
-
-        logger.info(
-            "nat-rules - Total: "
-            + str(resp.total)
-            + " - Number of requests to do: "
-            + str(number_requests)
-            + " (limit set to "
-            + str(limit)
-            + "/request) - In progress..."
-        )
-        logger.debug(
-            "nat-rules - 1/"
-            + str(number_requests)
-            + " (limit set to "
-            + str(limit)
-            + "/request) exported... (offset:0)"
-        )
-
-        for i in range(1, number_requests):
-            resp = self._show_partial_nat_rulebase(
+        def fetch(offset: int, limit: int) -> Box:
+            return self._show_partial_nat_rulebase(
                 package=package,
                 filter_results=filter_results,
                 filter_settings=filter_settings,
                 limit=limit,
-                offset=i * limit,
+                offset=offset,
                 order=order,
                 show_hits=show_hits,
                 use_object_dictionnary=use_object_dictionnary,
@@ -594,44 +682,10 @@ class NATRule(APIEndpoint):
                 **kw,
             )
 
-            logger.debug(
-                "nat-rules - "
-                + str(i + 1)
-                + "/"
-                + str(number_requests)
-                + " (limit set to "
-                + str(limit)
-                + "/request) exported... (offset:"
-                + str(i)
-                + ")"
-            )
-
-            all_rules.rulebase += resp.rulebase
-
-        # Finalize the output
-        all_rules.to = all_rules.total
-
-        # End timer
-        timer_diff = time.time() - timer_start
-
-        timer_text = ""
-
-        if round(timer_diff % 60) != 0:
-            timer_text = (
-                str(int(timer_diff / 60)) + "min " + str(round(timer_diff % 60)) + "s"
-            )  # pragma: no cover
-        else:
-            timer_text = "<1s"
-
-        logger.info(
-            "nat-rules - Total: "
-            + str(resp.total)
-            + " - Number of requests done: "
-            + str(number_requests)
-            + " (limit set to "
-            + str(limit)
-            + "/request) - Done in "
-            + timer_text
-        )
-
-        return all_rules
+        return RulebasePaginator(
+            fetch,
+            limit=limit,
+            name="nat-rules",
+            resolve_objects=resolve_objects,
+            adaptive=adaptive,
+        ).all(max_workers=max_workers)
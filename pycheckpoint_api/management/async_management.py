@@ -0,0 +1,273 @@
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Iterator
+
+import requests
+from requests.adapters import HTTPAdapter
+from restfly.endpoint import APIEndpoint
+
+from pycheckpoint_api.management import Management
+
+
+class _WorkerSessions:
+    """Gives each thread its own ``requests.Session``, built from the session used for the login.
+    A ``requests.Session`` is not thread-safe, so the workers never share one: each of them keeps its own keep-alive\
+    connection to the server. The headers and the cookies are shared by every session, so a new ``X-chkp-sid`` (or\
+    its removal on logout) reaches every worker, and the other settings are applied to every session.
+    """
+
+    def __init__(self, session: requests.Session):
+        object.__setattr__(self, "_template", session)
+        object.__setattr__(self, "_local", threading.local())
+        object.__setattr__(self, "_sessions", [])
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.current(), name)
+
+    def __setattr__(self, name: str, value: Any):
+        with self._lock:
+            for session in [self._template] + self._sessions:
+                setattr(session, name, value)
+
+    def current(self) -> requests.Session:
+        """Returns the session of the calling thread, created on its first request"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+            with self._lock:
+                session.headers = self._template.headers
+                session.cookies = self._template.cookies
+                session.verify = self._template.verify
+                session.cert = self._template.cert
+                session.proxies = self._template.proxies
+                self._sessions.append(session)
+            self._local.session = session
+        return session
+
+    def close(self):
+        """Closes the session of every thread"""
+        with self._lock:
+            sessions = list(self._sessions)
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+        self._template.close()
+
+
+class AsyncEndpoint:
+    """This class exposes an endpoint of the Management API where every method is a coroutine.
+
+    Nested endpoints are wrapped too, so the endpoint tree is the same as the one from ``Management``.
+    Methods named ``iter_*`` return an asynchronous iterator instead of a coroutine.
+    """
+
+    def __init__(self, client: "ThreadPoolManagement", endpoint: APIEndpoint):
+        """Constructor of the class
+
+        Args:
+            client (ThreadPoolManagement): The client running the requests on its worker threads
+            endpoint (APIEndpoint): The synchronous endpoint to wrap
+
+        """
+        self._client = client
+        self._endpoint = endpoint
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._endpoint, name)
+        if isinstance(attribute, APIEndpoint):
+            return AsyncEndpoint(self._client, attribute)
+        if not callable(attribute):
+            return attribute
+        if name.startswith("iter_"):
+
+            @functools.wraps(attribute)
+            def iterate(*args, **kw) -> AsyncIterator[Any]:
+                return self._client._iterate(attribute(*args, **kw))
+
+            return iterate
+
+        @functools.wraps(attribute)
+        async def call(*args, **kw) -> Any:
+            return await self._client._run(attribute, *args, **kw)
+
+        return call
+
+
+class ThreadPoolManagement:
+    """A thread-pool facade giving asyncio code access to the Endpoints of the Checkpoint Firewall Management API.
+    It shares the endpoint tree of ``Management`` (``network_objects``, ``service_applications``, ``access_control_nat``,\
+    ``policy``, ``session`` and ``misc``) but every method is a coroutine.
+
+    It's not an asynchronous HTTP transport: the requests are sent by the synchronous client on ``max_workers``\
+    threads. Every request in flight holds a worker thread until the server answers, the other coroutines wait for a\
+    free worker, so the concurrency is bounded by the number of threads and doesn't scale like native coroutines.\
+    The threads are only created once, and each of them has its own HTTP session and keep-alive connection, all of\
+    them sharing the headers (and so the authentication session) of the login.
+    """
+
+    def __init__(self, max_workers: int = 10, **kw):
+        """Class constructor. The login is done when entering the asynchronous context or when calling ``login()``.
+
+        Args:
+            max_workers (int, optional): Number of worker threads, that is the maximum number of requests in flight\
+            and of keep-alive connections kept open to the server. Defaults to 10
+            **kw (dict): Arbitrary keyword arguments for parameters, see ``Management``.
+
+        Examples:
+            >>> async with ThreadPoolManagement(
+            ... hostname="127.0.0.1",
+            ... port=443,
+            ... user="test@example.com",
+            ... password="hunter2",
+            ... version="1.5",
+            ... max_workers=20) as firewall:
+            ...     hosts = await asyncio.gather(
+            ...         firewall.network_objects.host.show(name="host1"),
+            ...         firewall.network_objects.host.show(name="host2"))
+        """
+        self._kw = kw
+        self._max_workers = max_workers
+        self._executor = None
+        self._management = None
+
+    async def __aenter__(self) -> "ThreadPoolManagement":
+        await self.login()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_traceback):
+        await self.logout()
+
+    async def login(self) -> Management:
+        """Creates the underlying Management session and authenticates
+
+        Returns:
+            Management: the synchronous client used to send the requests
+
+        Examples:
+            >>> await firewall.login()
+
+        """
+        self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        self._management = await self._run(functools.partial(Management, **self._kw))
+        self._management._session = _WorkerSessions(self._management._session)
+        return self._management
+
+    async def logout(self):
+        """Ends the authentication session and releases the connections
+
+        Examples:
+            >>> await firewall.logout()
+
+        """
+        try:
+            if self._management is not None:
+                await self._run(self._management._deauthenticate)
+                self._management._session.close()
+        finally:
+            self._management = None
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+    async def _run(self, func: Callable, *args, **kw) -> Any:
+        """Runs a blocking call on a worker thread and waits for its result"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kw)
+        )
+
+    async def _iterate(self, iterator: Iterator[Any]) -> AsyncIterator[Any]:
+        """Consumes a blocking iterator on the worker pool"""
+        done = object()
+        while True:
+            item = await self._run(next, iterator, done)
+            if item is done:
+                return
+            yield item
+
+    def _endpoint(self, name: str) -> AsyncEndpoint:
+        if self._management is None:
+            raise RuntimeError("The client is not logged in, call login() first")
+        return AsyncEndpoint(self, getattr(self._management, name))
+
+    @property
+    def session(self) -> AsyncEndpoint:
+        """The asynchronous interface object for the Session Management.
+
+        Returns:
+            AsyncEndpoint: a Session instance where methods are coroutines
+
+        Examples:
+            >>> await firewall.session.publish()
+
+        """
+        return self._endpoint("session")
+
+    @property
+    def network_objects(self) -> AsyncEndpoint:
+        """The asynchronous interface object for the Network Objects Management.
+
+        Returns:
+            AsyncEndpoint: a NetworkObjects instance where methods are coroutines
+
+        Examples:
+            >>> await firewall.network_objects.host.show(name="host1")
+
+        """
+        return self._endpoint("network_objects")
+
+    @property
+    def service_applications(self) -> AsyncEndpoint:
+        """The asynchronous interface object for the Service & Applications Management.
+
+        Returns:
+            AsyncEndpoint: a ServiceApplications instance where methods are coroutines
+
+        Examples:
+            >>> await firewall.service_applications.service_tcp.show(name="https")
+
+        """
+        return self._endpoint("service_applications")
+
+    @property
+    def access_control_nat(self) -> AsyncEndpoint:
+        """The asynchronous interface object for the Access Control & NAT Management.
+
+        Returns:
+            AsyncEndpoint: an AccessControlNAT instance where methods are coroutines
+
+        Examples:
+            >>> await firewall.access_control_nat.access_rule.show_access_rulebase(name="Network")
+
+        """
+        return self._endpoint("access_control_nat")
+
+    @property
+    def policy(self) -> AsyncEndpoint:
+        """The asynchronous interface object for the Policy Management.
+
+        Returns:
+            AsyncEndpoint: a Policy instance where methods are coroutines
+
+        Examples:
+            >>> await firewall.policy.package.show_packages()
+
+        """
+        return self._endpoint("policy")
+
+    @property
+    def misc(self) -> AsyncEndpoint:
+        """The asynchronous interface object for the MISC (Miscellaneous) Management.
+
+        Returns:
+            AsyncEndpoint: a MISC instance where methods are coroutines
+
+        Examples:
+            >>> await firewall.misc.generic_objects.get_rulebaseactions()
+
+        """
+        return self._endpoint("misc")
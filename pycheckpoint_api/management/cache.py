@@ -0,0 +1,273 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+
+
+class ObjectCache:
+    """This class is a client-side cache of the objects retrieved with a ``show-<type>`` command.
+    Entries are stored by uid and can also be found by name. They expire after ``ttl`` seconds and the least\
+    recently used entries are evicted once ``max_size`` entries are stored.
+
+    The cache is filled and invalidated by ``Management`` from the commands sent to the server:
+
+    * ``show-<type>`` with only a ``uid`` or a ``name`` (and optionally ``details-level``) is served from the cache
+    * ``add-<type>``, ``set-<type>`` and ``delete-<type>`` invalidate the targeted object, whatever the command it\
+      was cached from (``show-<type>`` or ``show-generic-object``), and the cached groups when the memberships of the\
+      object are given
+    * ``delete-<type>`` also invalidates the entries referencing the deleted object, like the groups it was a member of
+    * ``publish`` and ``discard`` clear the cache
+
+    With a ``PublishValidator``, the cache is also cleared when a session is published by another client.
+    """
+
+    # Commands returning session data instead of an object
+    _EXCLUDED = ("show-session", "show-task")
+
+    def __init__(
+        self,
+        ttl: float = 60,
+        max_size: int = 1024,
+        validator: "PublishValidator" = None,
+    ):
+        """Constructor of the class
+
+        Args:
+            ttl (float, optional): Time to live of an entry, in seconds. Defaults to 60
+            max_size (int, optional): Maximum number of entries kept in the cache. Defaults to 1024
+            validator (PublishValidator, optional): Clears the cache when a new session has been published since\
+            the entries were stored. Defaults to None
+
+        Examples:
+            >>> ObjectCache(ttl=300, max_size=5000)
+            >>> ObjectCache(ttl=float("inf"), validator=PublishValidator(fetch, interval=30))
+
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self.validator = validator
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._names = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @classmethod
+    def _parse(cls, path: str, payload: dict) -> Optional[Tuple[str, str, str]]:
+        """Extracts the command, the object type and the details level of a cacheable request"""
+        if path in cls._EXCLUDED or not isinstance(payload, dict):
+            return None
+        command, _, object_type = path.partition("-")
+        if command not in ("show", "add", "set", "delete") or object_type == "":
+            return None
+        return command, object_type, payload.get("details-level", "standard")
+
+    def lookup(self, path: str, payload: dict) -> Any:
+        """Returns a copy of the cached response for a ``show-<type>`` request
+
+        Args:
+            path (str): Command sent to the server
+            payload (dict): Body of the request
+
+        Returns:
+            Any: The cached response, or None if the request is not cacheable or the entry is missing or expired
+
+        Examples:
+            >>> cache.lookup("show-host", {"name": "host1"})
+
+        """
+        parsed = self._parse(path, payload)
+        if parsed is None or parsed[0] != "show" or not self._is_lookup(payload):
+            return None
+        _, object_type, details_level = parsed
+        if self.validator is not None and not self.validator.validate():
+            self.clear()
+        with self._lock:
+            key = self._key(object_type, details_level, payload)
+            entry = self._entries.get(key) if key is not None else None
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return copy.deepcopy(entry[1])
+
+    def store(self, path: str, payload: dict, response: Any):
+        """Stores the response of a ``show-<type>`` request
+
+        Args:
+            path (str): Command sent to the server
+            payload (dict): Body of the request
+            response (Any): Response from the server
+
+        Examples:
+            >>> cache.store("show-host", {"name": "host1"}, resp)
+
+        """
+        parsed = self._parse(path, payload)
+        if parsed is None or parsed[0] != "show" or not self._is_lookup(payload):
+            return
+        if not isinstance(response, dict) or "uid" not in response:
+            return
+        _, object_type, details_level = parsed
+        key = (object_type, details_level, response["uid"])
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl, copy.deepcopy(response))
+            if response.get("name") is not None:
+                self._names[(object_type, details_level, response["name"])] = key
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, path: str, payload: dict):
+        """Invalidates the entries affected by a command
+
+        Args:
+            path (str): Command sent to the server
+            payload (dict): Body of the request
+
+        Examples:
+            >>> cache.invalidate("set-host", {"name": "host1", "color": "red"})
+
+        """
+        if path in ("publish", "discard"):
+            self.clear()
+            if self.validator is not None and path == "publish":
+                # The session published by this client is recorded with the next lookup
+                self.validator.reset()
+            return
+        parsed = self._parse(path, payload)
+        if parsed is None or parsed[0] == "show":
+            return
+        _, object_type, _ = parsed
+        names = {payload.get("name"), payload.get("new-name")} - {None}
+        uids = {payload.get("uid")} - {None}
+        with self._lock:
+            # The same object may be cached by uid only from another command, like show-generic-object
+            uids.update(
+                key[2]
+                for name, key in self._names.items()
+                if name[0] == object_type and name[2] in names
+            )
+            # A deleted object disappears from the groups, rules... referencing it
+            references = uids | names if parsed[0] == "delete" else set()
+            for key in list(self._entries):
+                entry = self._entries[key][1]
+                if key[2] in uids or entry.get("name") in names:
+                    self._remove(key)
+                elif key[0] == "group" and "groups" in payload:
+                    self._remove(key)
+                elif len(references) > 0 and _references(entry, references):
+                    self._remove(key)
+
+    def clear(self):
+        """Removes every entry of the cache
+
+        Examples:
+            >>> cache.clear()
+
+        """
+        with self._lock:
+            self._entries.clear()
+            self._names.clear()
+
+    @staticmethod
+    def _is_lookup(payload: dict) -> bool:
+        """Checks that the request only identifies an object, without any other option changing the response"""
+        return ("uid" in payload or "name" in payload) and set(payload) <= {
+            "uid",
+            "name",
+            "details-level",
+        }
+
+    def _key(self, object_type: str, details_level: str, payload: dict) -> tuple:
+        if "uid" in payload:
+            return (object_type, details_level, payload["uid"])
+        return self._names.get((object_type, details_level, payload["name"]))
+
+    def _remove(self, key: tuple):
+        entry = self._entries.pop(key, None)
+        if entry is not None and entry[1].get("name") is not None:
+            name = (key[0], key[1], entry[1]["name"])
+            if self._names.get(name) == key:
+                del self._names[name]
+
+
+def _references(value: Any, values: set) -> bool:
+    """Checks if a cached response holds one of the values (uids or names), at any depth"""
+    if isinstance(value, str):
+        return value in values
+    if isinstance(value, dict):
+        return any(_references(v, values) for v in value.values())
+    if isinstance(value, list):
+        return any(_references(v, values) for v in value)
+    return False
+
+
+class PublishValidator:
+    """This class tells if the domain changed since the entries of a cache were stored, from the last published\
+    session (``show-last-published-session``). Its uid and publish time are recorded when the cache is filled:\
+    a single request then checks that nothing was published, at most once every ``interval`` seconds.
+    """
+
+    def __init__(self, fetch: Callable[[], dict], interval: float = 0):
+        """Constructor of the class
+
+        Args:
+            fetch (Callable[[], dict]): Function returning the last published session
+            interval (float, optional): Minimal number of seconds between two checks. Defaults to 0 (every lookup\
+            is checked)
+
+        Examples:
+            >>> PublishValidator(firewall.session.show_last_published_session, interval=30)
+
+        """
+        self._fetch = fetch
+        self.interval = interval
+        self.marker = None
+        self.checks = 0
+        self._checked_at = None
+        self._lock = threading.Lock()
+
+    def validate(self) -> bool:
+        """Checks that no session was published since the last check
+
+        Returns:
+            bool: False if a session was published since the last check, True otherwise (including the first check,\
+            which only records the last published session)
+
+        Examples:
+            >>> if not validator.validate():
+            ...     cache.clear()
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self.marker is not None and now - self._checked_at < self.interval:
+                return True
+            session = self._fetch()
+            self.checks += 1
+            self._checked_at = now
+            marker = (
+                session.get("uid"),
+                session.get("publish-time", {}).get("posix"),
+            )
+            changed = self.marker is not None and marker != self.marker
+            self.marker = marker
+            return not changed
+
+    def reset(self):
+        """Forgets the recorded session: the next check records the current one
+
+        Examples:
+            >>> validator.reset()
+
+        """
+        with self._lock:
+            self.marker = None
+            self._checked_at = None
@@ -0,0 +1,104 @@
+import logging
+import threading
+import time
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class KeepaliveScheduler:
+    """This class keeps a session alive from a background thread.
+    The keepalive is only sent when no request was made for a while: a busy session is never disturbed, while an\
+    idle one is refreshed ``margin`` seconds before it would expire. A failed keepalive is sent again after\
+    ``retry`` seconds, while the session is still valid.
+    """
+
+    def __init__(
+        self,
+        keepalive: Callable[[], None],
+        timeout: float = 600,
+        margin: float = 60,
+        retry: float = 10,
+    ):
+        """Constructor of the class
+
+        Args:
+            keepalive (Callable[[], None]): Function sending the keepalive request
+            timeout (float, optional): Session expiration timeout in seconds. Defaults to 600
+            margin (float, optional): Number of seconds before the expiration when the keepalive is sent.\
+            It's reduced to half of the timeout for short timeouts. Defaults to 60
+            retry (float, optional): Number of seconds before a failed keepalive is sent again.\
+            It's reduced to half of the margin for short margins. Defaults to 10
+
+        Examples:
+            >>> KeepaliveScheduler(firewall.session.keepalive, timeout=600, margin=60)
+
+        """
+        self._keepalive = keepalive
+        self.timeout = timeout
+        self.margin = min(margin, timeout / 2)
+        self.retry = min(retry, self.margin / 2)
+        self.last_activity = time.monotonic()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def touch(self):
+        """Records an activity on the session, delaying the next keepalive
+
+        Examples:
+            >>> scheduler.touch()
+
+        """
+        self.last_activity = time.monotonic()
+
+    def start(self):
+        """Starts the background thread
+
+        Examples:
+            >>> scheduler.start()
+
+        """
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="pycheckpoint-api-keepalive", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stops the background thread
+
+        Examples:
+            >>> scheduler.stop()
+
+        """
+        self._stop.set()
+        if self.running and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        while True:
+            idle = time.monotonic() - self.last_activity
+            delay = self.timeout - self.margin - idle
+            if delay > 0:
+                if self._stop.wait(delay):
+                    return
+                continue
+            if self._stop.is_set():
+                return
+            try:
+                logger.debug("Session idle for " + str(int(idle)) + "s, keepalive sent")
+                self._keepalive()
+            except Exception as e:
+                # The session is still idle: sent again soon, before it expires
+                logger.warning("Keepalive failed: " + str(e))
+                if self._stop.wait(self.retry):
+                    return
+                continue
+            self.touch()
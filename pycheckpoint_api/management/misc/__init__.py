@@ -1,9 +1,24 @@
 from restfly.endpoint import APIEndpoint
 
+from .changes import Changes
 from .generic_objects import GenericObjects
+from .task import Task
 
 
 class MISC(APIEndpoint):
+    @property
+    def changes(self) -> Changes:
+        """The interface object for the changes between dates or sessions.
+
+        Returns:
+            Changes: a Changes instance
+
+        Examples:
+            >>> firewall.misc.changes
+
+        """
+        return Changes(self)
+
     @property
     def generic_objects(self) -> GenericObjects:
         """The interface object for the objects type "Generic Objects" Management.
@@ -17,3 +32,16 @@ class MISC(APIEndpoint):
 
         """
         return GenericObjects(self)
+
+    @property
+    def task(self) -> Task:
+        """The interface object for the tasks run by the server.
+
+        Returns:
+            Task: a Task instance
+
+        Examples:
+            >>> firewall.misc.task
+
+        """
+        return Task(self)
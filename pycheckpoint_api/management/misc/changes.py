@@ -0,0 +1,138 @@
+from typing import List
+
+from box import Box
+from restfly.endpoint import APIEndpoint
+
+from pycheckpoint_api.utils import response_options, sanitize_secondary_parameters
+
+from .task import Task
+
+
+class Changes(APIEndpoint):
+    def show_changes(
+        self,
+        from_date: str = None,
+        to_date: str = None,
+        from_session: str = None,
+        to_session: str = None,
+        **kw
+    ) -> Box:
+        """Show changes between the provided dates or sessions. The changes are computed by a task on the server.
+
+        Args:
+            from_date (str, optional): The date from which to show changes, in ISO 8601 format. Defaults to None
+            to_date (str, optional): The date until which to show changes, in ISO 8601 format. Defaults to None
+            from_session (str, optional): The session UID from which to show changes. Defaults to None
+            to_session (str, optional): The session UID until which to show changes. Defaults to None
+            **kw (dict, optional): Arbitrary keyword arguments for secondary parameters.
+
+        Keyword Args:
+            **offset (int, optional):
+                Number of the results to initially skip.
+            **limit (int, optional):
+                The maximal number of returned results.
+            **dereference_group_members (bool, optional):
+                Indicates whether to dereference "members" field by details level for every object in reply.
+            **show_membership (bool, optional):
+                Indicates whether to calculate and show "groups" field for every object in reply.
+            **raw (bool, optional):
+                Returns plain dictionaries and lists instead of Box objects, skipping the conversion.\
+                Defaults to the ``raw`` setting of the client.
+            **lazy (bool, optional):
+                Returns lazy views instead of Box objects: nested objects are only converted when they are accessed.\
+                Defaults to the ``lazy`` setting of the client.
+
+        Returns:
+            :obj:`Box`: The response from the server, holding the ``task-id`` computing the changes
+
+        Examples:
+            >>> firewall.misc.changes.show_changes(from_date="2017-02-01T08:20:50", to_date="2017-10-01")
+        """
+        payload = {}
+        if from_date is not None:
+            payload["from-date"] = from_date
+        if to_date is not None:
+            payload["to-date"] = to_date
+        if from_session is not None:
+            payload["from-session"] = from_session
+        if to_session is not None:
+            payload["to-session"] = to_session
+
+        # Secondary parameters
+        secondary_parameters = {
+            "offset": int,
+            "limit": int,
+            "dereference_group_members": bool,
+            "show_membership": bool,
+        }
+        payload.update(sanitize_secondary_parameters(secondary_parameters, **kw))
+
+        return self._post("show-changes", json=payload, **response_options(**kw))
+
+    def get_changes(
+        self,
+        from_date: str = None,
+        to_date: str = None,
+        from_session: str = None,
+        to_session: str = None,
+        limit: int = 500,
+        timeout: float = 600,
+        interval: float = 1,
+    ) -> List[Box]:
+        """Show changes between the provided dates or sessions, page by page, and waits for the tasks computing them.
+        Pages are requested until the ``total`` given by the server is reached.
+
+        Args:
+            from_date (str, optional): The date from which to show changes, in ISO 8601 format. Defaults to None
+            to_date (str, optional): The date until which to show changes, in ISO 8601 format. Defaults to None
+            from_session (str, optional): The session UID from which to show changes. Defaults to None
+            to_session (str, optional): The session UID until which to show changes. Defaults to None
+            limit (int, optional): The maximal number of results per request. Defaults to 500
+            timeout (float, optional): Maximal number of seconds to wait for each task. Defaults to 600
+            interval (float, optional): Number of seconds between two checks of the task. Defaults to 1
+
+        Returns:
+            List[:obj:`Box`]: The changes of each session, in the order of the server. Their ``operations`` hold the\
+            ``added-objects``, the ``modified-objects`` (``old-object`` and ``new-object``) and the\
+            ``deleted-objects``
+
+        Examples:
+            >>> for change in firewall.misc.changes.get_changes(from_session="7a13a360-9b24-40d7-acd3-5b50247be33e"):
+            ...     print(len(change.operations["modified-objects"]))
+        """
+        changes = []
+        offset = 0
+        while True:
+            resp = self.show_changes(
+                from_date=from_date,
+                to_date=to_date,
+                from_session=from_session,
+                to_session=to_session,
+                offset=offset,
+                limit=limit,
+            )
+            resp = Task(self._api).wait(
+                resp["task-id"],
+                timeout=timeout,
+                interval=interval,
+                details_level="full",
+            )
+
+            page, total, to = [], None, None
+            for task in resp.get("tasks", []):
+                if task.get("status") != "succeeded":
+                    raise RuntimeError(
+                        "Unable to compute the changes: task "
+                        + str(task.get("task-id"))
+                        + " "
+                        + str(task.get("status"))
+                    )
+                for details in task.get("task-details", []):
+                    page.extend(details.get("changes", []))
+                    total = details.get("total", total)
+                    to = details.get("to", to)
+            changes.extend(page)
+
+            offset = to if to is not None else offset + len(page)
+            if len(page) == 0 or total is None or offset >= total:
+                return changes
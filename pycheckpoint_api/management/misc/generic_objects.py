@@ -1,13 +1,38 @@
+import functools
+from typing import Iterator
+
 from box import Box
 from restfly.endpoint import APIEndpoint
 
+from pycheckpoint_api.utils import response_options
+
+from ..abstract.paginator import Paginator
+
 
 class GenericObjects(APIEndpoint):
     def get_rulebaseactions(
         self,
+        limit: int = None,
+        offset: int = None,
+        show_all: bool = False,
+        max_workers: int = 1,
+        raw: bool = None,
+        lazy: bool = None,
     ) -> Box:
         """This method is used to recover generic objects named rule base actions from Checkpoint API
 
+        Args:
+            limit (int, optional): The maximal number of returned results. Defaults to None (50 if ``show_all``)
+            offset (int, optional): Number of the results to initially skip. Defaults to None
+            show_all (bool, optional): Indicates if you want to shown all objects or not. If yes, `offset` will be ignored.\
+            Defaults to False
+            max_workers (int, optional): Only used with `show_all`. Number of pages requested at the same time once the\
+            total is known. Defaults to 1 (pages are requested one after the other)
+            raw (bool, optional): Returns plain dictionaries and lists instead of Box objects, skipping the conversion.\
+            Defaults to None (the ``raw`` setting of the client)
+            lazy (bool, optional): Returns lazy views, converted on access, instead of Box objects.\
+            Defaults to None (the ``lazy`` setting of the client)
+
         Returns:
             :obj:`Box`: The response from the server
 
@@ -15,7 +40,52 @@ class GenericObjects(APIEndpoint):
             >>> firewall.misc.generic_objects.get_rulebaseactions()
 
         """
+        if show_all:
+            return self._rulebaseactions_paginator(limit=limit, raw=raw, lazy=lazy).all(
+                max_workers=max_workers
+            )
+
         # Main request parameters
         payload = {"class-name": "com.checkpoint.objects.rulebase.RulebaseAction"}
+        if limit is not None:
+            payload["limit"] = limit
+        if offset is not None:
+            payload["offset"] = offset
+
+        return self._post(
+            "show-generic-objects", json=payload, **response_options(raw=raw, lazy=lazy)
+        )
+
+    def iter_rulebaseactions(
+        self, limit: int = 50, raw: bool = None, lazy: bool = None
+    ) -> Iterator[Box]:
+        """Iterate over the rule base actions, page by page. Only the current page is kept in memory.
+
+        Args:
+            limit (int, optional): The maximal number of results per request. Defaults to 50
+            raw (bool, optional): Returns plain dictionaries instead of Box objects. Defaults to None (the ``raw``\
+            setting of the client)
+            lazy (bool, optional): Returns lazy views instead of Box objects. Defaults to None (the ``lazy`` setting\
+            of the client)
+
+        Returns:
+            Iterator[:obj:`Box`]: The rule base actions, one at a time
+
+        Examples:
+            >>> for action in firewall.misc.generic_objects.iter_rulebaseactions():
+            ...     print(action.name)
+
+        """
+        yield from self._rulebaseactions_paginator(
+            limit=limit, raw=raw, lazy=lazy
+        ).items()
 
-        return self._post("show-generic-objects", json=payload)
+    def _rulebaseactions_paginator(
+        self, limit: int = None, raw: bool = None, lazy: bool = None
+    ) -> Paginator:
+        return Paginator(
+            functools.partial(self.get_rulebaseactions, raw=raw, lazy=lazy),
+            key="objects",
+            limit=limit if limit is not None else 50,
+            name="show-generic-objects",
+        )
@@ -0,0 +1,69 @@
+import time
+
+from box import Box
+from restfly.endpoint import APIEndpoint
+
+from pycheckpoint_api.utils import response_options, sanitize_secondary_parameters
+
+# Status of a task still running on the server
+IN_PROGRESS = "in progress"
+
+
+class Task(APIEndpoint):
+    def show_task(self, task_id: str, **kw) -> Box:
+        """Show task progress and details.
+
+        Args:
+            task_id (str): Unique identifier of the task
+            **kw (dict, optional): Arbitrary keyword arguments for secondary parameters.
+
+        Keyword Args:
+            **details_level (str, optional):
+                The level of detail of the task details: "full" returns the result of the command run by the task.
+            **raw (bool, optional):
+                Returns plain dictionaries and lists instead of Box objects, skipping the conversion.\
+                Defaults to the ``raw`` setting of the client.
+            **lazy (bool, optional):
+                Returns lazy views instead of Box objects: nested objects are only converted when they are accessed.\
+                Defaults to the ``lazy`` setting of the client.
+
+        Returns:
+            :obj:`Box`: The response from the server
+
+        Examples:
+            >>> firewall.misc.task.show_task(task_id="01234567-89ab-cdef-a930-8c37a59972b3")
+        """
+        payload = {"task-id": task_id}
+
+        # Secondary parameters
+        secondary_parameters = {"details_level": str}
+        payload.update(sanitize_secondary_parameters(secondary_parameters, **kw))
+
+        return self._post("show-task", json=payload, **response_options(**kw))
+
+    def wait(
+        self, task_id: str, timeout: float = 600, interval: float = 1, **kw
+    ) -> Box:
+        """Waits for a task to be done, requesting its progress every ``interval`` seconds
+
+        Args:
+            task_id (str): Unique identifier of the task
+            timeout (float, optional): Maximal number of seconds to wait. Defaults to 600
+            interval (float, optional): Number of seconds between two requests. Defaults to 1
+            **kw (dict, optional): Arbitrary keyword arguments for secondary parameters, see ``show_task``.
+
+        Returns:
+            :obj:`Box`: The last response from the server, where no task is in progress
+
+        Examples:
+            >>> firewall.misc.task.wait(firewall.session.publish()["task-id"], details_level="full")
+
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            resp = self.show_task(task_id, **kw)
+            if all(t.get("status") != IN_PROGRESS for t in resp.get("tasks", [])):
+                return resp
+            if time.monotonic() >= deadline:
+                raise TimeoutError("Task " + task_id + " still in progress")
+            time.sleep(interval)
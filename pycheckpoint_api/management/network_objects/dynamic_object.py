@@ -1,4 +1,4 @@
-from typing import List, Union
+from typing import Iterator, List, Union
 
 from box import Box
 
@@ -238,3 +238,52 @@ class DynamicObject(NetworkObject):
             },
             **kw,
         )
+
+    def iter_dynamic_objects(
+        self,
+        filter_results: str = None,
+        limit: int = 50,
+        order: List[dict] = None,
+        **kw,
+    ) -> Iterator[Box]:
+        """
+        Iterate over all objects, page by page, without keeping them all in memory.
+
+        Args:
+            filter_results (str, optional): Search expression to filter objects by.\
+            The provided text should be exactly the same as it would be given in SmartConsole Object Explorer.\
+            The logical operators in the expression ('AND', 'OR') should be provided in capital letters.\
+            he search involves both a IP search and a textual search in name, comment, tags etc.
+            limit (int, optional): The maximal number of results per request. Defaults to 50 (between 1 and 500)
+            order (List[dict], optional): Sorts results by the given field. By default the results are sorted in the \
+            descending order by the session publish time.
+
+        Keyword Args:
+            **details_level (str, optional):
+                The level of detail for some of the fields in the response can vary from showing only the UID value\
+                of the object to a fully detailed representation of the object.
+            **domains_to_process (List[str], optional):
+                Indicates which domains to process the commands on. It cannot be used with the details_level full,\
+                must be run from the System Domain only and with ignore_warnings true.\
+                Valid values are: CURRENT_DOMAIN, ALL_DOMAINS_ON_THIS_SERVER.
+            **show_membership (bool, optional):
+                Indicates whether to calculate and show "groups" field for every object in reply.
+
+        Returns:
+            Iterator[:obj:`Box`]: The objects, one at a time
+
+        Examples:
+            >>> for obj in firewall.network_objects.dynamic_object.iter_dynamic_objects():
+            ...     print(obj.name)
+        """
+        return self.iter_objects(
+            endpoint="show-dynamic-objects",
+            filter_results=filter_results,
+            limit=limit,
+            order=order,
+            extra_secondary_parameters={
+                "domains_to_process": bool,
+                "show_membership": bool,
+            },
+            **kw,
+        )
@@ -1,8 +1,9 @@
-from typing import List, Union
+from typing import Iterator, List, Union
 
 from box import Box
 
 from pycheckpoint_api.models import Color
+from pycheckpoint_api.records import HostRecord
 from pycheckpoint_api.utils import sanitize_secondary_parameters
 
 from ..abstract.network_object import NetworkObject
@@ -10,6 +11,8 @@ from ..exception import MandatoryFieldMissing
 
 
 class Host(NetworkObject):
+    _record = HostRecord
+
     def add(
         self,
         name: str,
@@ -273,3 +276,38 @@ class Host(NetworkObject):
             extra_secondary_parameters={"show_membership": bool},
             **kw
         )
+
+    def iter_hosts(
+        self,
+        filter_results: str = None,
+        limit: int = 50,
+        order: List[dict] = None,
+        **kw
+    ) -> Iterator[Box]:
+        """
+        Iterate over all objects, page by page, without keeping them all in memory.
+
+        Args:
+            filter_results (str, optional): Search expression to filter objects by.\
+            The provided text should be exactly the same as it would be given in SmartConsole Object Explorer.\
+            The logical operators in the expression ('AND', 'OR') should be provided in capital letters.\
+            he search involves both a IP search and a textual search in name, comment, tags etc.
+            limit (int, optional): The maximal number of results per request. Defaults to 50 (between 1 and 500)
+            order (List[dict], optional): Sorts results by the given field. By default the results are sorted in the \
+            descending order by the session publish time.
+
+        Returns:
+            Iterator[:obj:`Box`]: The objects, one at a time
+
+        Examples:
+            >>> for obj in firewall.network_objects.host.iter_hosts():
+            ...     print(obj.name)
+        """
+        return self.iter_objects(
+            endpoint="show-hosts",
+            filter_results=filter_results,
+            limit=limit,
+            order=order,
+            extra_secondary_parameters={"show_membership": bool},
+            **kw
+        )
@@ -1,4 +1,4 @@
-from typing import List, Union
+from typing import Iterator, List, Union
 
 from box import Box
 
@@ -247,3 +247,47 @@ class ServiceGroup(NetworkObject):
             },
             **kw
         )
+
+    def iter_service_groups(
+        self,
+        filter_results: str = None,
+        limit: int = 50,
+        order: List[dict] = None,
+        show_as_ranges: bool = False,
+        **kw
+    ) -> Iterator[Box]:
+        """
+        Iterate over all objects, page by page, without keeping them all in memory.
+
+        Args:
+            filter_results (str, optional): Search expression to filter objects by.\
+            The provided text should be exactly the same as it would be given in SmartConsole Object Explorer.\
+            The logical operators in the expression ('AND', 'OR') should be provided in capital letters.\
+            he search involves both a IP search and a textual search in name, comment, tags etc.
+            limit (int, optional): The maximal number of results per request. Defaults to 50 (between 1 and 500)
+            order (List[dict], optional): Sorts results by the given field. By default the results are sorted in the \
+            descending order by the session publish time.
+            show_as_ranges (bool, optional): When true, the group's matched content is displayed as ranges of IP addresses \
+            rather than network objects. Objects that are not represented using IP addresses are presented as objects.\
+            The 'members' parameter is omitted from the response and instead the 'ranges' parameter is displayed.\
+                        Defaults to False.
+
+        Returns:
+            Iterator[:obj:`Box`]: The objects, one at a time
+
+        Examples:
+            >>> for obj in Management.service_applications.service_group.iter_service_groups():
+            ...     print(obj.name)
+        """
+        return self.iter_objects(
+            endpoint="show-service-groups",
+            filter_results=filter_results,
+            limit=limit,
+            order=order,
+            show_as_ranges=show_as_ranges,
+            extra_secondary_parameters={
+                "dereference_group_members": bool,
+                "show_membership": bool,
+            },
+            **kw
+        )
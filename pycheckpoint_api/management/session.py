@@ -1,11 +1,17 @@
-from typing import List, Union
+import functools
+from typing import Iterator, List, Union
 
 from box import Box
 from restfly.endpoint import APIEndpoint
 
 from pycheckpoint_api.models import Color
-from pycheckpoint_api.utils import sanitize_secondary_parameters, sanitize_value
+from pycheckpoint_api.utils import (
+    response_options,
+    sanitize_secondary_parameters,
+    sanitize_value,
+)
 
+from .abstract.paginator import Paginator
 from .exception import MandatoryFieldMissing
 
 
@@ -234,11 +240,20 @@ class Session(APIEndpoint):
 
         return self._post("login-to-domain", json=payload)
 
-    def show_session(self, uid: str = None) -> Box:
+    def show_session(self, uid: str = None, **kw) -> Box:
         """Show session.
 
         Args:
             uid (str, optional): Session unique identifier. Defaults to None.
+            **kw (dict, optional): Arbitrary keyword arguments for response options.
+
+        Keyword Args:
+            **raw (bool, optional):
+                Returns plain dictionaries and lists instead of Box objects, skipping the conversion.\
+                Defaults to the ``raw`` setting of the client.
+            **lazy (bool, optional):
+                Returns lazy views instead of Box objects: nested objects are only converted when they are accessed.\
+                Defaults to the ``lazy`` setting of the client.
 
         Returns:
             :obj:`Box`: The response from the server
@@ -251,7 +266,7 @@ class Session(APIEndpoint):
         if uid is not None:
             payload["uid"] = uid
 
-        return self._post("show-session", json=payload)
+        return self._post("show-session", json=payload, **response_options(**kw))
 
     def set_session(
         self,
@@ -398,6 +413,8 @@ class Session(APIEndpoint):
         offset: int = 0,
         order: List[dict] = None,
         view_published_sessions: bool = False,
+        show_all: bool = False,
+        max_workers: int = 1,
         **kw
     ) -> Box:
         """Retrieve all objects.
@@ -414,9 +431,19 @@ class Session(APIEndpoint):
                 By default the results are sorted in the descending order by the session publish time.\
                 Defaults to None
             view_published_sessions (bool, optional): Show a list of published sessions. Defaults to False
+            show_all (bool, optional): Indicates if you want to shown all objects or not. If yes, `offset` will be ignored.\
+            Defaults to False
+            max_workers (int, optional): Only used with `show_all`. Number of pages requested at the same time once the\
+            total is known. Defaults to 1 (pages are requested one after the other)
             **kw (dict, optional): Arbitrary keyword arguments for secondary parameters.
 
         Keyword Args:
+            **raw (bool, optional):
+                Returns plain dictionaries and lists instead of Box objects, skipping the conversion.\
+                Defaults to the ``raw`` setting of the client.
+            **lazy (bool, optional):
+                Returns lazy views instead of Box objects: nested objects are only converted when they are accessed.\
+                Defaults to the ``lazy`` setting of the client.
             **details_level (str, optional):
                 The level of detail for some of the fields in the response can vary from showing only the UID value\
                 of the object to a fully detailed representation of the object.
@@ -428,6 +455,14 @@ class Session(APIEndpoint):
             >>> Management.session.switch_session(uid="7a13a360-9b24-40d7-acd3-5b50247be33e")
 
         """
+        if show_all:
+            return self._sessions_paginator(
+                filter_results=filter_results,
+                limit=limit,
+                order=order,
+                view_published_sessions=view_published_sessions,
+                **kw
+            ).all(max_workers=max_workers)
 
         # Main request parameters
         payload = {}
@@ -446,7 +481,59 @@ class Session(APIEndpoint):
         secondary_parameters = {"details_level": str}
         payload.update(sanitize_secondary_parameters(secondary_parameters, **kw))
 
-        return self._post("show-sessions", json=payload)
+        return self._post("show-sessions", json=payload, **response_options(**kw))
+
+    def iter_sessions(
+        self,
+        filter_results: str = None,
+        limit: int = 50,
+        order: List[dict] = None,
+        view_published_sessions: bool = False,
+        **kw
+    ) -> Iterator[Box]:
+        """Iterate over all objects, page by page. Only the current page is kept in memory.
+
+        Args:
+            filter_results (str, optional): Search expression to filter objects by. Defaults to None
+            limit (int, optional): The maximal number of results per request. Defaults to 50 (between 1 and 500).
+            order (List[dict], optional): Sorts results by the given field. Defaults to None
+            view_published_sessions (bool, optional): Show a list of published sessions. Defaults to False
+            **kw (dict, optional): Arbitrary keyword arguments for secondary parameters.
+
+        Keyword Args:
+            **raw (bool, optional):
+                Returns plain dictionaries and lists instead of Box objects, skipping the conversion.\
+                Defaults to the ``raw`` setting of the client.
+            **lazy (bool, optional):
+                Returns lazy views instead of Box objects: nested objects are only converted when they are accessed.\
+                Defaults to the ``lazy`` setting of the client.
+            **details_level (str, optional):
+                The level of detail for some of the fields in the response can vary from showing only the UID value\
+                of the object to a fully detailed representation of the object.
+
+        Returns:
+            Iterator[:obj:`Box`]: The sessions, one at a time
+
+        Examples:
+            >>> for session in Management.session.iter_sessions(view_published_sessions=True):
+            ...     print(session)
+
+        """
+        yield from self._sessions_paginator(
+            filter_results=filter_results,
+            limit=limit,
+            order=order,
+            view_published_sessions=view_published_sessions,
+            **kw
+        ).items()
+
+    def _sessions_paginator(self, limit: int = 50, **kw) -> Paginator:
+        return Paginator(
+            functools.partial(self.show_sessions, **kw),
+            key="objects",
+            limit=limit,
+            name="show-sessions",
+        )
 
     def continue_session_in_smartconsole(self, uid: str = None) -> Box:
         """ Logout from existing session. The session will be continued next time your open SmartConsole.\
@@ -468,9 +555,20 @@ class Session(APIEndpoint):
 
         return self._post("continue-session-in-smartconsole", json=payload)
 
-    def show_last_published_session(self) -> Box:
+    def show_last_published_session(self, **kw) -> Box:
         """Shows the last published session.
 
+        Args:
+            **kw (dict, optional): Arbitrary keyword arguments for response options.
+
+        Keyword Args:
+            **raw (bool, optional):
+                Returns plain dictionaries and lists instead of Box objects, skipping the conversion.\
+                Defaults to the ``raw`` setting of the client.
+            **lazy (bool, optional):
+                Returns lazy views instead of Box objects: nested objects are only converted when they are accessed.\
+                Defaults to the ``lazy`` setting of the client.
+
         Returns:
             :obj:`Box`: The response from the server
 
@@ -479,7 +577,9 @@ class Session(APIEndpoint):
 
         """
 
-        return self._post("show-last-published-session", json={})
+        return self._post(
+            "show-last-published-session", json={}, **response_options(**kw)
+        )
 
     def show_login_message(self, **kw) -> Box:
         """Retrieve existing object using object name or uid.
@@ -488,6 +588,12 @@ class Session(APIEndpoint):
             **kw (dict, optional): Arbitrary keyword arguments for secondary parameters.
 
         Keyword Args:
+            **raw (bool, optional):
+                Returns plain dictionaries and lists instead of Box objects, skipping the conversion.\
+                Defaults to the ``raw`` setting of the client.
+            **lazy (bool, optional):
+                Returns lazy views instead of Box objects: nested objects are only converted when they are accessed.\
+                Defaults to the ``lazy`` setting of the client.
             **details_level (string, optional):
                 The level of detail for some of the fields in the response can vary from showing only
                 the UID value of the object to a fully detailed representation of the object.
@@ -506,7 +612,7 @@ class Session(APIEndpoint):
         secondary_parameters = {"details_level": str}
         payload.update(sanitize_secondary_parameters(secondary_parameters, **kw))
 
-        return self._post("show-login-message", json=payload)
+        return self._post("show-login-message", json=payload, **response_options(**kw))
 
     def set_login_message(
         self,
@@ -605,9 +711,20 @@ class Session(APIEndpoint):
 
         return self._post("set-automatic-purge", json=payload)
 
-    def show_automatic_purge(self) -> Box:
+    def show_automatic_purge(self, **kw) -> Box:
         """Show Automatic Purge.
 
+        Args:
+            **kw (dict, optional): Arbitrary keyword arguments for response options.
+
+        Keyword Args:
+            **raw (bool, optional):
+                Returns plain dictionaries and lists instead of Box objects, skipping the conversion.\
+                Defaults to the ``raw`` setting of the client.
+            **lazy (bool, optional):
+                Returns lazy views instead of Box objects: nested objects are only converted when they are accessed.\
+                Defaults to the ``lazy`` setting of the client.
+
         Returns:
             :obj:`Box`: The response from the server
 
@@ -616,4 +733,4 @@ class Session(APIEndpoint):
 
         """
 
-        return self._post("show-automatic-purge", json={})
+        return self._post("show-automatic-purge", json={}, **response_options(**kw))
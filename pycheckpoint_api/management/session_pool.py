@@ -0,0 +1,187 @@
+import logging
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List
+
+from box import Box
+
+from pycheckpoint_api.management import Management, SessionStore
+
+logger = logging.getLogger(__name__)
+
+
+class SessionPool:
+    """This class opens several authenticated ``Management`` sessions to spread independent changes across them.
+    A session applies its changes one after the other: with N sessions, the management server works on N changes\
+    at the same time. Each session has its own ``X-chkp-sid`` header and is published separately, in the order of\
+    the pool.
+
+    With a ``session_store``, each session of the pool is stored in its own slot (its index in the pool), so a later\
+    pool of the same size resumes one distinct session per client. Two pools of the same user must not be opened at\
+    the same time with the same store.
+    """
+
+    def __init__(self, size: int = 4, **kw):
+        """Class constructor. The sessions are opened when entering the context or when calling ``open()``.
+
+        Args:
+            size (int, optional): Number of sessions to open. Defaults to 4
+            **kw (dict): Arbitrary keyword arguments for parameters, see ``Management``.
+
+        Examples:
+            >>> with SessionPool(
+            ... size=4,
+            ... hostname="127.0.0.1",
+            ... port=443,
+            ... user="test@example.com",
+            ... password="hunter2",
+            ... version="1.5") as pool:
+            ...     pool.run(lambda firewall, host: firewall.network_objects.host.add(**host), hosts)
+            ...     pool.publish()
+        """
+        self._size = size
+        self._kw = kw
+        if isinstance(kw.get("session_store"), str):
+            # A single store serializes the updates of the file by the sessions of the pool
+            self._kw["session_store"] = SessionStore(kw["session_store"])
+        self._sessions = []
+
+    def __enter__(self) -> "SessionPool":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    @property
+    def sessions(self) -> List[Management]:
+        """The opened sessions, in the order of the pool.
+
+        Returns:
+            List[Management]: the authenticated clients
+
+        Examples:
+            >>> pool.sessions[0].session.show_session()
+
+        """
+        return list(self._sessions)
+
+    def open(self) -> List[Management]:
+        """Opens the sessions of the pool, at the same time
+
+        Returns:
+            List[Management]: the authenticated clients
+
+        Examples:
+            >>> pool.open()
+
+        """
+        with ThreadPoolExecutor(max_workers=self._size) as executor:
+            futures = [
+                executor.submit(Management, session_slot=slot, **self._kw)
+                for slot in range(self._size)
+            ]
+            errors = []
+            for future in futures:
+                try:
+                    self._sessions.append(future.result())
+                except Exception as e:
+                    errors.append(e)
+
+        if len(errors) > 0:
+            self.close()
+            raise errors[0]
+        return self.sessions
+
+    def close(self):
+        """Ends every session of the pool. Changes that are not published are kept in the sessions.
+
+        Examples:
+            >>> pool.close()
+
+        """
+        sessions, self._sessions = self._sessions, []
+        for management in sessions:
+            try:
+                management._deauthenticate()
+                management._session.close()
+            except Exception as e:
+                logger.warning("Unable to close a session of the pool: " + str(e))
+
+    def run(self, func: Callable[[Management, Any], Any], items: Iterable[Any]) -> Box:
+        """Spreads independent work across the sessions: every session takes the next item as soon as it's done\
+        with the previous one. A failure does not stop the run: the error is reported in the result of the item.
+
+        Args:
+            func (Callable[[Management, Any], Any]): Function applying an item, given the session to use and the item
+            items (Iterable[Any]): Items to apply
+
+        Returns:
+            :obj:`Box`: The number of ``succeeded`` and ``failed`` items, and the ``results`` of each item\
+            (``index``, ``payload``, ``response`` and ``error``) in the same order as ``items``
+
+        Examples:
+            >>> pool.run(
+            ... lambda firewall, host: firewall.network_objects.host.add(**host),
+            ... [{"name": f"host{i}", "ip_address": f"10.0.0.{i}"} for i in range(1, 255)])
+        """
+        if len(self._sessions) == 0:
+            raise RuntimeError("The pool is not opened, call open() first")
+
+        work = queue.Queue()
+        for item in enumerate(items):
+            work.put(item)
+        results = [None] * work.qsize()
+
+        def worker(management: Management):
+            while True:
+                try:
+                    index, item = work.get_nowait()
+                except queue.Empty:
+                    return
+                result = {
+                    "index": index,
+                    "payload": item,
+                    "response": None,
+                    "error": None,
+                }
+                try:
+                    result["response"] = func(management, item)
+                except Exception as e:
+                    logger.debug("Item #" + str(index) + " failed: " + str(e))
+                    result["error"] = e
+                results[index] = result
+
+        with ThreadPoolExecutor(max_workers=len(self._sessions)) as executor:
+            for future in [executor.submit(worker, m) for m in self._sessions]:
+                future.result()
+
+        failed = len([r for r in results if r["error"] is not None])
+        return Box(succeeded=len(results) - failed, failed=failed, results=results)
+
+    def publish(self) -> List[Box]:
+        """Publishes the sessions one after the other, in the order of the pool
+
+        Returns:
+            List[:obj:`Box`]: The response from the server for each session
+
+        Examples:
+            >>> pool.publish()
+
+        """
+        return [management.session.publish() for management in self._sessions]
+
+    def discard(self) -> List[Box]:
+        """Discards the changes of every session of the pool
+
+        Returns:
+            List[:obj:`Box`]: The response from the server for each session
+
+        Examples:
+            >>> pool.discard()
+
+        """
+        return [management.session.discard() for management in self._sessions]
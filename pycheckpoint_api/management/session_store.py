@@ -0,0 +1,148 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+from box import Box
+
+
+class SessionStore:
+    """This class is an on-disk store of the sessions opened by ``Management``, so a later process can reuse a\
+    session that is still valid instead of logging in again.
+    Sessions are stored by hostname, port, domain and user, and by slot for the clients of a ``SessionPool`` (each of\
+    them resumes its own session). The file only contains the session identifiers (never the password or the API key)\
+    and is only readable by its owner.
+    """
+
+    def __init__(self, path: str = None):
+        """Constructor of the class
+
+        Args:
+            path (str, optional): Path of the file storing the sessions.\
+            Defaults to None (``~/.pycheckpoint_api/sessions.json``)
+
+        Examples:
+            >>> SessionStore("/var/lib/my-cron-job/sessions.json")
+
+        """
+        if path is None:
+            path = os.path.join("~", ".pycheckpoint_api", "sessions.json")
+        self.path = os.path.expanduser(path)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(
+        hostname: str,
+        port: int,
+        domain: str = None,
+        user: str = None,
+        api_key: str = None,
+        slot: int = None,
+    ) -> str:
+        """Builds the identifier of a session in the store
+
+        Args:
+            hostname (str): Hostname of the management server
+            port (int): Port of the management server
+            domain (str, optional): Domain of the session. Defaults to None
+            user (str, optional): User of the session. Defaults to None
+            api_key (str, optional): API key of the session, only a hash of it is used. Defaults to None
+            slot (int, optional): Index of the session, when several sessions of the same user are opened at the same\
+            time. Defaults to None (a single session)
+
+        Returns:
+            str: the identifier of the session
+
+        Examples:
+            >>> SessionStore.key("127.0.0.1", 443, "MyDomain", "admin")
+            "admin@127.0.0.1:443/MyDomain"
+            >>> SessionStore.key("127.0.0.1", 443, "MyDomain", "admin", slot=2)
+            "admin@127.0.0.1:443/MyDomain#2"
+        """
+        if user is None and api_key is not None:
+            user = "api-key-" + hashlib.sha256(api_key.encode()).hexdigest()[:16]
+        key = f"{user}@{hostname}:{port}/{domain or ''}"
+        if slot is not None:
+            key += f"#{slot}"
+        return key
+
+    def get(self, key: str) -> Box:
+        """Returns a stored session, unless it has obviously expired
+
+        Args:
+            key (str): Identifier of the session
+
+        Returns:
+            :obj:`Box`: The stored session (``sid``, ``uid``, ``session-timeout`` and ``last-used``), or None
+
+        Examples:
+            >>> store.get("admin@127.0.0.1:443/MyDomain")
+
+        """
+        with self._lock:
+            entry = self._read().get(key)
+        if entry is None:
+            return None
+        if time.time() - entry.get("last-used", 0) > entry.get("session-timeout", 600):
+            return None
+        return Box(entry)
+
+    def save(self, key: str, session: dict):
+        """Stores a session, or updates its last use
+
+        Args:
+            key (str): Identifier of the session
+            session (dict): Response of the login, or session previously returned by ``get``
+
+        Examples:
+            >>> store.save("admin@127.0.0.1:443/MyDomain", firewall.session.login(user="admin", password="hunter2"))
+
+        """
+        entry = {
+            "sid": session["sid"],
+            "uid": session.get("uid"),
+            "session-timeout": session.get("session-timeout", 600),
+            "last-used": time.time(),
+        }
+        with self._lock:
+            sessions = self._read()
+            sessions[key] = entry
+            self._write(sessions)
+
+    def remove(self, key: str):
+        """Removes a session from the store
+
+        Args:
+            key (str): Identifier of the session
+
+        Examples:
+            >>> store.remove("admin@127.0.0.1:443/MyDomain")
+
+        """
+        with self._lock:
+            sessions = self._read()
+            if sessions.pop(key, None) is not None:
+                self._write(sessions)
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, sessions: dict):
+        """Replaces the file atomically, so a concurrent process never reads a partial file"""
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".sessions-")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(sessions, f)
+            os.chmod(tmp, 0o600)
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
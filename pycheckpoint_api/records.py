@@ -0,0 +1,253 @@
+import sys
+from typing import Any, Tuple, Union
+
+
+def _intern(value: Any) -> Any:
+    """Interns a string, so every copy of the same uid or name is stored once"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _name_or_uid(value: Union[str, dict]) -> str:
+    """Returns the name of a referenced object, or its uid when the details level only gives the uid"""
+    if isinstance(value, dict):
+        value = value.get("name", value.get("uid"))
+    return _intern(value)
+
+
+def _uid(value: Union[str, dict]) -> str:
+    """Returns the uid of a referenced object"""
+    if isinstance(value, dict):
+        value = value.get("uid")
+    return _intern(value)
+
+
+# Fields holding several values, empty tuples by default
+_COLLECTIONS = ("tags", "members")
+
+
+class Record:
+    """This class is a compact representation of an object of the Management API.
+    Records only keep the main fields of an object in ``__slots__`` attributes: they are several times smaller than\
+    the matching Box, which matters when hundreds of thousands of objects are kept in memory.
+    Uids and names are interned, so objects referencing the same uid share the same string.
+    """
+
+    __slots__ = ("uid", "name", "type", "tags", "meta_info")
+
+    # Attribute name -> key of the JSON object, for the fields copied as they are
+    _keys = {"uid": "uid", "name": "name", "type": "type"}
+
+    def __init__(self, **kw):
+        """Constructor of the class
+
+        Args:
+            **kw (dict): Value of each field. Missing fields are set to None (or an empty tuple for collections)
+
+        Examples:
+            >>> HostRecord(uid="9423d36f-2d66-4754-b9e2-e7f4493756d4", name="host1", ipv4_address="192.0.2.1")
+
+        """
+        for slot in self._slots():
+            object.__setattr__(
+                self, slot, kw.get(slot, () if slot in _COLLECTIONS else None)
+            )
+
+    @classmethod
+    def _slots(cls) -> Tuple[str, ...]:
+        slots = ()
+        for klass in reversed(cls.__mro__):
+            slots += getattr(klass, "__slots__", ())
+        return slots
+
+    @classmethod
+    def from_dict(cls, data: Union[str, dict]) -> "Record":
+        """Builds a record from an object returned by the server
+
+        Args:
+            data (Union[str, dict]): The object, or its uid only when requested with ``details_level="uid"``
+
+        Returns:
+            Record: the record
+
+        Examples:
+            >>> HostRecord.from_dict(firewall.network_objects.host.show(name="host1", raw=True))
+
+        """
+        if isinstance(data, str):
+            return cls(uid=_intern(data))
+
+        kw = {}
+        for attribute, key in cls._keys.items():
+            kw[attribute] = _intern(data.get(key))
+        kw["tags"] = tuple(_name_or_uid(t) for t in data.get("tags", []))
+        meta_info = data.get("meta-info")
+        if meta_info is not None:
+            kw["meta_info"] = MetaInfo.from_dict(meta_info)
+        cls._complete(kw, data)
+        return cls(**kw)
+
+    @classmethod
+    def _complete(cls, kw: dict, data: dict):
+        """Adds the fields that need a conversion"""
+
+    def to_dict(self) -> dict:
+        """Returns the fields of the record as a dictionary
+
+        Returns:
+            dict: the fields of the record
+
+        Examples:
+            >>> record.to_dict()
+            {"uid": "9423d36f-2d66-4754-b9e2-e7f4493756d4", "name": "host1", ...}
+        """
+        result = {}
+        for slot in self._slots():
+            value = getattr(self, slot)
+            result[slot] = value.to_dict() if isinstance(value, MetaInfo) else value
+        return result
+
+    def __eq__(self, other: Any) -> bool:
+        return type(self) is type(other) and all(
+            getattr(self, s) == getattr(other, s) for s in self._slots()
+        )
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.uid))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(uid={self.uid!r}, name={self.name!r})"
+
+    def __getstate__(self) -> dict:
+        return {slot: getattr(self, slot) for slot in self._slots()}
+
+    def __setstate__(self, state: dict):
+        for slot, value in state.items():
+            object.__setattr__(self, slot, value)
+
+
+class MetaInfo:
+    """This class is a compact representation of the ``meta-info`` field of an object"""
+
+    __slots__ = ("creator", "creation_time", "last_modifier", "last_modify_time")
+
+    def __init__(
+        self,
+        creator: str = None,
+        creation_time: int = None,
+        last_modifier: str = None,
+        last_modify_time: int = None,
+    ):
+        self.creator = creator
+        self.creation_time = creation_time
+        self.last_modifier = last_modifier
+        self.last_modify_time = last_modify_time
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "MetaInfo":
+        """Builds the meta information from the ``meta-info`` field
+
+        Args:
+            data (dict): The ``meta-info`` field
+
+        Returns:
+            MetaInfo: the meta information. Times are POSIX timestamps in milliseconds
+
+        Examples:
+            >>> MetaInfo.from_dict(host["meta-info"]).last_modify_time
+            1655210413215
+        """
+        return cls(
+            creator=_intern(data.get("creator")),
+            creation_time=data.get("creation-time", {}).get("posix"),
+            last_modifier=_intern(data.get("last-modifier")),
+            last_modify_time=data.get("last-modify-time", {}).get("posix"),
+        )
+
+    def to_dict(self) -> dict:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, MetaInfo) and self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f"MetaInfo(last_modifier={self.last_modifier!r}, last_modify_time={self.last_modify_time!r})"
+
+
+class HostRecord(Record):
+    """This class is a compact representation of a host"""
+
+    __slots__ = ("ipv4_address", "ipv6_address")
+
+    _keys = {
+        **Record._keys,
+        "ipv4_address": "ipv4-address",
+        "ipv6_address": "ipv6-address",
+    }
+
+
+class NetworkRecord(Record):
+    """This class is a compact representation of a network"""
+
+    __slots__ = ("subnet4", "mask_length4", "subnet6", "mask_length6")
+
+    _keys = {
+        **Record._keys,
+        "subnet4": "subnet4",
+        "mask_length4": "mask-length4",
+        "subnet6": "subnet6",
+        "mask_length6": "mask-length6",
+    }
+
+
+class AddressRangeRecord(Record):
+    """This class is a compact representation of an address range"""
+
+    __slots__ = (
+        "ipv4_address_first",
+        "ipv4_address_last",
+        "ipv6_address_first",
+        "ipv6_address_last",
+    )
+
+    _keys = {
+        **Record._keys,
+        "ipv4_address_first": "ipv4-address-first",
+        "ipv4_address_last": "ipv4-address-last",
+        "ipv6_address_first": "ipv6-address-first",
+        "ipv6_address_last": "ipv6-address-last",
+    }
+
+
+class GroupRecord(Record):
+    """This class is a compact representation of a group. Members are kept as uids."""
+
+    __slots__ = ("members",)
+
+    @classmethod
+    def _complete(cls, kw: dict, data: dict):
+        kw["members"] = tuple(_uid(m) for m in data.get("members", []))
+
+
+class ServiceRecord(Record):
+    """This class is a compact representation of a TCP or UDP service"""
+
+    __slots__ = ("port", "source_port", "protocol")
+
+    _keys = {
+        **Record._keys,
+        "port": "port",
+        "source_port": "source-port",
+        "protocol": "protocol",
+    }
+
+
+class ServiceTcpRecord(ServiceRecord):
+    """This class is a compact representation of a TCP service"""
+
+    __slots__ = ()
+
+
+class ServiceUdpRecord(ServiceRecord):
+    """This class is a compact representation of a UDP service"""
+
+    __slots__ = ()
@@ -0,0 +1,922 @@
+import ipaddress
+import json
+import logging
+import sqlite3
+import time
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+from box import Box
+from restfly.errors import APIError
+
+from pycheckpoint_api.analysis.address_index import address_intervals, to_address
+
+logger = logging.getLogger(__name__)
+
+# Table -> (container, endpoint, iteration method) of each exported object type
+OBJECT_TYPES = {
+    "hosts": ("network_objects", "host", "iter_hosts"),
+    "networks": ("network_objects", "network", "iter_networks"),
+    "address_ranges": ("network_objects", "address_range", "iter_address_ranges"),
+    "multicast_address_ranges": (
+        "network_objects",
+        "multicast_address_range",
+        "iter_multicast_address_ranges",
+    ),
+    "groups": ("network_objects", "group", "iter_groups"),
+    "groups_with_exclusion": (
+        "network_objects",
+        "group_with_exclusion",
+        "iter_groups_with_exclusion",
+    ),
+    "checkpoint_hosts": ("network_objects", "checkpoint_host", "iter_checkpoint_hosts"),
+    "simple_gateways": ("network_objects", "simple_gateway", "iter_simple_gateways"),
+    "simple_clusters": ("network_objects", "simple_cluster", "iter_simple_clusters"),
+    "security_zones": ("network_objects", "security_zone", "iter_security_zones"),
+    "dynamic_objects": ("network_objects", "dynamic_object", "iter_dynamic_objects"),
+    "dns_domains": ("network_objects", "dns_domain", "iter_dns_domains"),
+    "wildcards": ("network_objects", "wildcard", "iter_wildcards"),
+    "access_point_names": (
+        "network_objects",
+        "access_point_name",
+        "iter_access_point_names",
+    ),
+    "tags": ("network_objects", "tag", "iter_tags"),
+    "times": ("network_objects", "time", "iter_times"),
+    "time_groups": ("network_objects", "time_group", "iter_time_groups"),
+    "services_tcp": ("service_applications", "service_tcp", "iter_services_tcp"),
+    "services_udp": ("service_applications", "service_udp", "iter_services_udp"),
+    "services_icmp": ("service_applications", "service_icmp", "iter_services_icmp"),
+    "services_icmp6": ("service_applications", "service_icmp6", "iter_services_icmp6"),
+    "services_sctp": ("service_applications", "service_sctp", "iter_services_sctp"),
+    "services_other": ("service_applications", "service_other", "iter_services_other"),
+    "service_groups": ("service_applications", "service_group", "iter_service_groups"),
+    "application_sites": (
+        "service_applications",
+        "application_site",
+        "iter_application_sites",
+    ),
+    "application_site_groups": (
+        "service_applications",
+        "application_site_group",
+        "iter_application_site_groups",
+    ),
+}
+
+# Number of objects written to the database at once
+BATCH_SIZE = 500
+
+# Key of the last published session in the meta table
+LAST_PUBLISHED_SESSION = "last-published-session"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS object_tags (uid TEXT NOT NULL, kind TEXT NOT NULL, tag TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS object_tags_tag ON object_tags (tag);
+CREATE INDEX IF NOT EXISTS object_tags_uid ON object_tags (uid);
+CREATE TABLE IF NOT EXISTS object_addresses (
+    uid TEXT NOT NULL, kind TEXT NOT NULL, first TEXT NOT NULL, last TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS object_addresses_range ON object_addresses (first, last);
+CREATE INDEX IF NOT EXISTS object_addresses_uid ON object_addresses (uid);
+CREATE TABLE IF NOT EXISTS dictionary (uid TEXT PRIMARY KEY, name TEXT, type TEXT, data TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS dictionary_name ON dictionary (name);
+CREATE TABLE IF NOT EXISTS layers (uid TEXT PRIMARY KEY, name TEXT, kind TEXT NOT NULL, data TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS layers_name ON layers (name);
+CREATE TABLE IF NOT EXISTS rules (
+    layer TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    uid TEXT NOT NULL,
+    name TEXT,
+    type TEXT,
+    section TEXT,
+    rule_number INTEGER,
+    data TEXT NOT NULL,
+    PRIMARY KEY (layer, position)
+);
+CREATE INDEX IF NOT EXISTS rules_uid ON rules (uid);
+"""
+
+_OBJECT_TABLE = """
+CREATE TABLE IF NOT EXISTS {table} (
+    uid TEXT PRIMARY KEY, name TEXT, type TEXT, last_modify_time INTEGER, data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS {table}_name ON {table} (name);
+"""
+
+# IPv4 addresses are stored as IPv4-mapped IPv6 addresses, so both families share the same keys
+_IPV4_MAPPED = 0xFFFF << 32
+
+
+def address_key(address: str) -> str:
+    """This function is used to get the key of an IP address, ordered like the addresses themselves
+
+    Args:
+        address (str): IPv4 or IPv6 address
+
+    Returns:
+        str: 32 hexadecimal digits of the address, IPv4 addresses being mapped in the IPv6 space
+
+    Examples:
+        >>> address_key("192.0.2.1")
+        "00000000000000000000ffffc0000201"
+    """
+    ip = ipaddress.ip_address(address)
+    value = int(ip) | _IPV4_MAPPED if ip.version == 4 else int(ip)
+    return format(value, "032x")
+
+
+def object_ranges(obj: dict) -> List[Tuple[str, str]]:
+    """This function is used to get the IP ranges covered by a host, a network or an address range
+
+    Args:
+        obj (dict): The object, as returned by the server
+
+    Returns:
+        List[Tuple[str, str]]: the first and last addresses of each range. Empty for the other objects, and for\
+        wildcards which don't cover a range
+
+    Examples:
+        >>> object_ranges({"subnet4": "192.0.2.0", "mask-length4": 24})
+        [("192.0.2.0", "192.0.2.255")]
+    """
+    return [
+        (str(to_address(i.version, i.first)), str(to_address(i.version, i.last)))
+        for i in address_intervals(obj)
+        if i.wildcard is None
+    ]
+
+
+def _modify_time(obj: dict) -> int:
+    return obj.get("meta-info", {}).get("last-modify-time", {}).get("posix", 0)
+
+
+def _session_uid(marker: Optional[str]) -> Optional[str]:
+    """Uid of the session recorded in a marker of ``last_published_session``, None if there is none"""
+    uid = marker.partition("@")[0] if marker is not None else None
+    return uid if uid not in ("", "None") else None
+
+
+def _uid(value: Any) -> str:
+    return value.get("uid") if isinstance(value, dict) else value
+
+
+def _name(value: Any) -> str:
+    return value.get("name", value.get("uid")) if isinstance(value, dict) else value
+
+
+class Snapshot:
+    """This class stores the objects and the rulebases of a management server in a local SQLite database.
+    Objects are kept in one table per type and indexed by uid, name, IP address and tag, rules are kept by layer:\
+    analysis tools can then query them offline, without requesting the management server again.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        """Constructor of the class. The tables are created if they don't exist yet.
+
+        Args:
+            path (str, optional): Path of the database. Defaults to ":memory:" (kept in memory only)
+
+        Examples:
+            >>> with Snapshot("checkpoint.db") as snapshot:
+            ...     snapshot.export(firewall)
+        """
+        self.path = path
+        self._connection = sqlite3.connect(path)
+        self._connection.row_factory = sqlite3.Row
+        with self._connection:
+            self._connection.executescript(
+                _SCHEMA + "".join(_OBJECT_TABLE.format(table=t) for t in OBJECT_TYPES)
+            )
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+
+    def close(self):
+        """Closes the database
+
+        Examples:
+            >>> snapshot.close()
+
+        """
+        self._connection.close()
+
+    def export(
+        self,
+        firewall: Any,
+        object_types: List[str] = None,
+        rulebases: bool = True,
+        limit: int = 500,
+        adaptive: bool = False,
+        details_level: str = "full",
+    ) -> Box:
+        """Streams the objects and the rulebases of a management server into the database.
+        Objects are written page by page, so the whole export is never kept in memory.
+
+        Args:
+            firewall (Management): The authenticated client
+            object_types (List[str], optional): Tables to export, see ``OBJECT_TYPES``. Defaults to None (all of them)
+            rulebases (bool, optional): Exports the access rulebase of every layer and the NAT rulebase of every\
+            package. Defaults to True
+            limit (int, optional): The maximal number of results per request. Defaults to 500
+            adaptive (bool, optional): Adapts the page size to the time taken by the server to return the previous\
+            page. Defaults to False
+            details_level (str, optional): The level of detail of the objects. Defaults to "full"
+
+        Returns:
+            :obj:`Box`: The number of objects exported in each table, and of rules with ``rules``
+
+        Examples:
+            >>> snapshot.export(firewall, object_types=["hosts", "networks"], rulebases=False)
+            Box({'hosts': 1204, 'networks': 87})
+        """
+        # Read first: a change published during the export is found by the next sync
+        published = self.last_published_session(firewall)
+
+        counts = Box()
+        for table in object_types if object_types is not None else OBJECT_TYPES:
+            counts[table] = self.export_objects(
+                firewall,
+                table,
+                limit=limit,
+                adaptive=adaptive,
+                details_level=details_level,
+            )
+        if rulebases:
+            counts["rules"] = self.export_rulebases(
+                firewall, limit=limit, adaptive=adaptive
+            )
+        self.set_meta("exported-at", str(int(time.time())))
+        self.set_meta(LAST_PUBLISHED_SESSION, published)
+        return counts
+
+    def sync(
+        self,
+        firewall: Any,
+        object_types: List[str] = None,
+        rulebases: bool = True,
+        limit: int = 500,
+        force: bool = False,
+    ) -> Box:
+        """Applies the changes published since the last export or sync, instead of exporting everything again.
+
+        * Nothing is requested if no session was published since the last sync (``show-last-published-session``)
+        * The changes of the sessions published since the last published session recorded by the previous export or\
+        sync are requested (``show-changes``): the objects they add or modify are requested again by uid, the\
+        objects they delete are removed. An object is then found from the session publishing it, whatever the time\
+        it was modified at.
+        * Every object of the tables still empty is requested, like every object of every table without a previous\
+        export or sync, when no published session is known, or with ``force``
+        * Rulebases are exported again when something was published
+
+        Args:
+            firewall (Management): The authenticated client
+            object_types (List[str], optional): Tables to sync, see ``OBJECT_TYPES``. Defaults to None (all of them)
+            rulebases (bool, optional): Exports the rulebases again when something was published. Defaults to True
+            limit (int, optional): The maximal number of results per request. Defaults to 500
+            force (bool, optional): Requests every object again, even if no session was published since the last sync.\
+            Defaults to False
+
+        Returns:
+            :obj:`Box`: ``changed`` tells if something was published, ``updated`` and ``deleted`` hold the number of\
+            objects written and removed in each table, ``rules`` the number of exported rules
+
+        Examples:
+            >>> snapshot.sync(firewall)
+            Box({'changed': True, 'updated': {'hosts': 3}, 'deleted': {'hosts': 1}, 'rules': 342})
+        """
+        published = self.last_published_session(firewall)
+        previous = self.get_meta(LAST_PUBLISHED_SESSION)
+        result = Box(changed=False, updated={}, deleted={}, rules=0)
+        if not force and published == previous:
+            logger.info("Snapshot - No session published since the last sync")
+            return result
+
+        result.changed = True
+        tables = object_types if object_types is not None else list(OBJECT_TYPES)
+        previous_uid, published_uid = _session_uid(previous), _session_uid(published)
+        exported = [
+            t
+            for t in tables
+            if force
+            or previous_uid is None
+            or published_uid is None
+            or self.query("SELECT COUNT(*) FROM " + self._check_table(t))[0][0] == 0
+        ]
+        for table in exported:
+            updated, deleted = self.sync_objects(firewall, table, limit=limit)
+            if updated > 0:
+                result.updated[table] = updated
+            if deleted > 0:
+                result.deleted[table] = deleted
+
+        changed = [t for t in tables if t not in exported]
+        if len(changed) > 0:
+            # Changes of the sessions published since the one recorded by the previous sync
+            changes = firewall.misc.changes.get_changes(
+                from_session=previous_uid, to_session=published_uid, limit=limit
+            )
+            updated, deleted = self.apply_changes(
+                firewall, changes, object_types=changed
+            )
+            result.updated.update(updated)
+            result.deleted.update(deleted)
+        if rulebases:
+            result.rules = self.export_rulebases(firewall, limit=limit)
+
+        self.set_meta("synced-at", str(int(time.time())))
+        self.set_meta(LAST_PUBLISHED_SESSION, published)
+        return result
+
+    def sync_objects(
+        self, firewall: Any, table: str, limit: int = 500
+    ) -> Tuple[int, int]:
+        """Replaces the objects of a type with the ones of the server: every object is written again, the objects no\
+        longer returned by the server are removed.
+
+        Args:
+            firewall (Management): The authenticated client
+            table (str): Table of the objects, see ``OBJECT_TYPES``
+            limit (int, optional): The maximal number of results per request. Defaults to 500
+
+        Returns:
+            Tuple[int, int]: the number of written and removed objects
+
+        Examples:
+            >>> snapshot.sync_objects(firewall, "hosts")
+            (1204, 1)
+        """
+        container, endpoint, method = OBJECT_TYPES[self._check_table(table)]
+        iterate = getattr(getattr(getattr(firewall, container), endpoint), method)
+        current = set()
+
+        def track(objects: Iterable[dict]) -> Iterator[dict]:
+            for obj in objects:
+                current.add(obj["uid"])
+                yield obj
+
+        updated = self.store_objects(
+            table, track(iterate(limit=limit, raw=True, details_level="full"))
+        )
+        known = set(row[0] for row in self.query("SELECT uid FROM " + table))
+        deleted = self.delete_objects(known - current)
+        logger.info(
+            "Snapshot - "
+            + table
+            + ": "
+            + str(updated)
+            + " objects updated, "
+            + str(deleted)
+            + " deleted"
+        )
+        return updated, deleted
+
+    def apply_changes(
+        self, firewall: Any, changes: Iterable[dict], object_types: List[str] = None
+    ) -> Tuple[Box, Box]:
+        """Applies the changes of published sessions, as returned by ``misc.changes.get_changes``. The objects added\
+        or modified are requested again by uid, with ``details_level="full"``, and the deleted objects are removed.
+        When an object is changed by several sessions, only its last change is applied.
+
+        Args:
+            firewall (Management): The authenticated client
+            changes (Iterable[dict]): The changes of each session, in the order they were published
+            object_types (List[str], optional): Tables to update, see ``OBJECT_TYPES``. Defaults to None (all of them)
+
+        Returns:
+            Tuple[:obj:`Box`, :obj:`Box`]: the number of written and removed objects in each table
+
+        Examples:
+            >>> snapshot.apply_changes(firewall, firewall.misc.changes.get_changes(from_session=uid))
+            (Box({'hosts': 3}), Box({'hosts': 1}))
+        """
+        # Type of the objects (like "address-range") -> table
+        tables = {
+            endpoint.replace("_", "-"): table
+            for table, (_, endpoint, _) in OBJECT_TYPES.items()
+            if object_types is None or table in object_types
+        }
+
+        # Last change of each object: uid -> (table, still exists)
+        latest = {}
+        for change in changes:
+            operations = change.get("operations", {})
+            objects = [(o, True) for o in operations.get("added-objects", [])]
+            objects += [
+                (o.get("new-object", o), True)
+                for o in operations.get("modified-objects", [])
+            ]
+            objects += [(o, False) for o in operations.get("deleted-objects", [])]
+            for obj, exists in objects:
+                table = tables.get(obj.get("type"))
+                if table is not None:
+                    latest[obj["uid"]] = (table, exists)
+
+        updated, deleted = Box(), Box()
+        for table in OBJECT_TYPES:
+            uids = [uid for uid, (t, exists) in latest.items() if t == table and exists]
+            removed = [
+                uid for uid, (t, exists) in latest.items() if t == table and not exists
+            ]
+            if len(uids) > 0:
+                container, endpoint, _ = OBJECT_TYPES[table]
+                endpoint = getattr(getattr(firewall, container), endpoint)
+                count = self.store_objects(
+                    table, self._show_objects(endpoint, uids, removed)
+                )
+                if count > 0:
+                    updated[table] = count
+            count = self.delete_objects(removed)
+            if count > 0:
+                deleted[table] = count
+        logger.info(
+            "Snapshot - "
+            + str(sum(updated.values()))
+            + " objects updated, "
+            + str(sum(deleted.values()))
+            + " deleted"
+        )
+        return updated, deleted
+
+    @staticmethod
+    def _show_objects(
+        endpoint: Any, uids: List[str], removed: List[str]
+    ) -> Iterator[dict]:
+        """Requests objects by uid, the ones deleted since their change being added to ``removed``"""
+        for uid in uids:
+            try:
+                yield endpoint.show(uid=uid, raw=True, details_level="full")
+            except APIError as e:
+                if e.code != 404:
+                    raise
+                removed.append(uid)
+
+    @staticmethod
+    def last_published_session(firewall: Any) -> str:
+        """Returns a marker of the last published session, changing each time a session is published
+
+        Args:
+            firewall (Management): The authenticated client
+
+        Returns:
+            str: the uid and the publish time of the last published session
+
+        Examples:
+            >>> Snapshot.last_published_session(firewall)
+            "7a13a360-9b24-40d7-acd3-5b50247be33e@1655210413215"
+        """
+        session = firewall.session.show_last_published_session()
+        publish_time = session.get("publish-time", {}).get("posix")
+        return str(session.get("uid")) + "@" + str(publish_time)
+
+    def export_objects(
+        self,
+        firewall: Any,
+        table: str,
+        limit: int = 500,
+        adaptive: bool = False,
+        details_level: str = "full",
+    ) -> int:
+        """Streams the objects of a type into their table
+
+        Args:
+            firewall (Management): The authenticated client
+            table (str): Table of the objects, see ``OBJECT_TYPES``
+            limit (int, optional): The maximal number of results per request. Defaults to 500
+            adaptive (bool, optional): Adapts the page size to the time taken by the server to return the previous\
+            page. Defaults to False
+            details_level (str, optional): The level of detail of the objects. Defaults to "full"
+
+        Returns:
+            int: the number of exported objects
+
+        Examples:
+            >>> snapshot.export_objects(firewall, "hosts")
+            1204
+        """
+        container, endpoint, method = OBJECT_TYPES[self._check_table(table)]
+        iterate = getattr(getattr(getattr(firewall, container), endpoint), method)
+        count = self.store_objects(
+            table,
+            iterate(
+                limit=limit, adaptive=adaptive, raw=True, details_level=details_level
+            ),
+        )
+        logger.info("Snapshot - " + table + ": " + str(count) + " objects exported")
+        return count
+
+    def export_rulebases(
+        self, firewall: Any, limit: int = 500, adaptive: bool = False
+    ) -> int:
+        """Exports the access rulebase of every layer and the NAT rulebase of every package
+
+        Args:
+            firewall (Management): The authenticated client
+            limit (int, optional): The maximal number of results per request. Defaults to 500
+            adaptive (bool, optional): Adapts the page size to the time taken by the server to return the previous\
+            page. Defaults to False
+
+        Returns:
+            int: the number of exported rules
+
+        Examples:
+            >>> snapshot.export_rulebases(firewall)
+            342
+        """
+        count = 0
+        access_control_nat = firewall.access_control_nat
+        for layer in access_control_nat.access_layer.iter_access_layers(
+            limit=limit, raw=True
+        ):
+            rulebase = access_control_nat.access_rule.show_access_rulebase(
+                uid=layer["uid"],
+                show_all=True,
+                limit=limit,
+                adaptive=adaptive,
+                raw=True,
+            )
+            count += self.store_rulebase(layer, rulebase, kind="access")
+
+        for package in firewall.policy.package.iter_packages(limit=limit, raw=True):
+            if not package.get("nat-policy", False):
+                continue
+            rulebase = access_control_nat.nat_rule.show_nat_rulebase(
+                package=package["name"],
+                show_all=True,
+                limit=limit,
+                adaptive=adaptive,
+                raw=True,
+            )
+            count += self.store_rulebase(package, rulebase, kind="nat")
+
+        logger.info("Snapshot - rulebases: " + str(count) + " rules exported")
+        return count
+
+    def store_objects(self, table: str, objects: Iterable[dict]) -> int:
+        """Writes objects in their table, replacing the objects with the same uid
+
+        Args:
+            table (str): Table of the objects, see ``OBJECT_TYPES``
+            objects (Iterable[dict]): The objects, as returned by the server
+
+        Returns:
+            int: the number of written objects
+
+        Examples:
+            >>> snapshot.store_objects("hosts", firewall.network_objects.host.iter_hosts(raw=True))
+            1204
+        """
+        self._check_table(table)
+        count = 0
+        batch = []
+        for obj in objects:
+            batch.append(obj)
+            if len(batch) == BATCH_SIZE:
+                count += self._write_objects(table, batch)
+                batch = []
+        count += self._write_objects(table, batch)
+        return count
+
+    def delete_objects(self, uids: Iterable[str]) -> int:
+        """Removes objects, whatever their table
+
+        Args:
+            uids (Iterable[str]): Uids of the objects
+
+        Returns:
+            int: the number of removed objects
+
+        Examples:
+            >>> snapshot.delete_objects(["196e93a9-b90b-4ab1-baa6-124e7289aa20"])
+            1
+        """
+        uids = [(uid,) for uid in uids]
+        count = 0
+        with self._connection:
+            for table in OBJECT_TYPES:
+                count += self._connection.executemany(
+                    "DELETE FROM " + table + " WHERE uid = ?", uids
+                ).rowcount
+            self._connection.executemany("DELETE FROM object_tags WHERE uid = ?", uids)
+            self._connection.executemany(
+                "DELETE FROM object_addresses WHERE uid = ?", uids
+            )
+        return count
+
+    def store_rulebase(self, layer: dict, rulebase: dict, kind: str = "access") -> int:
+        """Writes the rules of a layer, replacing its previous rules. Sections are flattened: each rule keeps the\
+        name of its section. The ``objects-dictionary`` is written in the ``dictionary`` table.
+
+        Args:
+            layer (dict): The access layer, or the package for a NAT rulebase
+            rulebase (dict): The complete rulebase, as returned by ``show_access_rulebase(show_all=True)``
+            kind (str, optional): Kind of the rulebase, "access" or "nat". Defaults to "access"
+
+        Returns:
+            int: the number of written rules
+
+        Examples:
+            >>> snapshot.store_rulebase(layer, firewall.access_control_nat.access_rule.show_access_rulebase(
+            ...     uid=layer["uid"], show_all=True, raw=True))
+            120
+        """
+        rows = []
+        for section, rule in self._flatten(rulebase.get("rulebase", [])):
+            rows.append(
+                (
+                    layer["uid"],
+                    len(rows),
+                    rule.get("uid"),
+                    rule.get("name"),
+                    rule.get("type"),
+                    section,
+                    rule.get("rule-number"),
+                    json.dumps(rule),
+                )
+            )
+
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO layers VALUES (?, ?, ?, ?)",
+                (layer["uid"], layer.get("name"), kind, json.dumps(layer)),
+            )
+            self._connection.execute(
+                "DELETE FROM rules WHERE layer = ?", (layer["uid"],)
+            )
+            self._connection.executemany(
+                "INSERT INTO rules VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO dictionary VALUES (?, ?, ?, ?)",
+                [
+                    (o["uid"], o.get("name"), o.get("type"), json.dumps(o))
+                    for o in rulebase.get("objects-dictionary", [])
+                ],
+            )
+        return len(rows)
+
+    def get(self, uid: str) -> Optional[dict]:
+        """Returns an object by uid, whatever its table. Entries of the objects dictionary are found as well.
+
+        Args:
+            uid (str): Object unique identifier
+
+        Returns:
+            Optional[dict]: the object, or None if it's unknown
+
+        Examples:
+            >>> snapshot.get("196e93a9-b90b-4ab1-baa6-124e7289aa20")["name"]
+            "host1"
+        """
+        for table in tuple(OBJECT_TYPES) + ("dictionary",):
+            row = self._connection.execute(
+                "SELECT data FROM " + table + " WHERE uid = ?", (uid,)
+            ).fetchone()
+            if row is not None:
+                return json.loads(row["data"])
+        return None
+
+    def find(self, name: str, table: str = None) -> List[dict]:
+        """Returns the objects with a name
+
+        Args:
+            name (str): Object name
+            table (str, optional): Table of the objects. Defaults to None (every table)
+
+        Returns:
+            List[dict]: the objects
+
+        Examples:
+            >>> snapshot.find("host1", table="hosts")
+
+        """
+        tables = [self._check_table(table)] if table is not None else OBJECT_TYPES
+        result = []
+        for t in tables:
+            result.extend(
+                json.loads(row["data"])
+                for row in self._connection.execute(
+                    "SELECT data FROM " + t + " WHERE name = ?", (name,)
+                )
+            )
+        return result
+
+    def find_by_address(self, address: str) -> List[dict]:
+        """Returns the hosts, networks and address ranges holding an IP address
+
+        Args:
+            address (str): IPv4 or IPv6 address
+
+        Returns:
+            List[dict]: the objects
+
+        Examples:
+            >>> [o["name"] for o in snapshot.find_by_address("192.0.2.1")]
+            ["host1", "net_192.0.2.0_24"]
+        """
+        key = address_key(address)
+        return self._load(
+            self._connection.execute(
+                "SELECT DISTINCT uid, kind FROM object_addresses WHERE first <= ? AND last >= ?",
+                (key, key),
+            )
+        )
+
+    def find_by_tag(self, tag: str) -> List[dict]:
+        """Returns the objects with a tag
+
+        Args:
+            tag (str): Tag name
+
+        Returns:
+            List[dict]: the objects
+
+        Examples:
+            >>> snapshot.find_by_tag("production")
+
+        """
+        return self._load(
+            self._connection.execute(
+                "SELECT DISTINCT uid, kind FROM object_tags WHERE tag = ?", (tag,)
+            )
+        )
+
+    def objects(self, table: str) -> Iterator[dict]:
+        """Iterates over the objects of a table
+
+        Args:
+            table (str): Table of the objects, see ``OBJECT_TYPES``
+
+        Returns:
+            Iterator[dict]: the objects, one at a time
+
+        Examples:
+            >>> for host in snapshot.objects("hosts"):
+            ...     print(host["name"])
+        """
+        for row in self._connection.execute(
+            "SELECT data FROM " + self._check_table(table) + " ORDER BY name"
+        ):
+            yield json.loads(row["data"])
+
+    def layers(self, kind: str = None) -> List[dict]:
+        """Returns the layers (and the packages of the NAT rulebases)
+
+        Args:
+            kind (str, optional): Kind of the rulebases, "access" or "nat". Defaults to None (both)
+
+        Returns:
+            List[dict]: the layers
+
+        Examples:
+            >>> [layer["name"] for layer in snapshot.layers("access")]
+            ["Network"]
+        """
+        if kind is None:
+            cursor = self._connection.execute("SELECT data FROM layers ORDER BY name")
+        else:
+            cursor = self._connection.execute(
+                "SELECT data FROM layers WHERE kind = ? ORDER BY name", (kind,)
+            )
+        return [json.loads(row["data"]) for row in cursor]
+
+    def rules(self, layer: str) -> List[dict]:
+        """Returns the rules of a layer, in order
+
+        Args:
+            layer (str): Uid or name of the layer (or of the package for a NAT rulebase)
+
+        Returns:
+            List[dict]: the rules
+
+        Examples:
+            >>> snapshot.rules("Network")[0]["rule-number"]
+            1
+        """
+        cursor = self._connection.execute(
+            "SELECT rules.data FROM rules JOIN layers ON layers.uid = rules.layer"
+            " WHERE layers.uid = ? OR layers.name = ? ORDER BY rules.position",
+            (layer, layer),
+        )
+        return [json.loads(row["data"]) for row in cursor]
+
+    def query(self, sql: str, parameters: Iterable = ()) -> List[sqlite3.Row]:
+        """Runs a query on the database
+
+        Args:
+            sql (str): The SQL query
+            parameters (Iterable, optional): The parameters of the query. Defaults to ()
+
+        Returns:
+            List[sqlite3.Row]: the rows
+
+        Examples:
+            >>> snapshot.query("SELECT name FROM hosts WHERE last_modify_time > ?", (1655210413215,))
+
+        """
+        return self._connection.execute(sql, tuple(parameters)).fetchall()
+
+    def get_meta(self, key: str) -> Optional[str]:
+        """Returns a value stored with the snapshot
+
+        Args:
+            key (str): Key of the value
+
+        Returns:
+            Optional[str]: the value, or None if it isn't set
+
+        Examples:
+            >>> snapshot.get_meta("exported-at")
+            "1655210413"
+        """
+        row = self._connection.execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)
+        ).fetchone()
+        return row["value"] if row is not None else None
+
+    def set_meta(self, key: str, value: str):
+        """Stores a value with the snapshot
+
+        Args:
+            key (str): Key of the value
+            value (str): The value
+
+        Examples:
+            >>> snapshot.set_meta("hostname", "127.0.0.1")
+
+        """
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, value)
+            )
+
+    def _check_table(self, table: str) -> str:
+        """Checks that a table holds objects: table names are put in the queries"""
+        if table not in OBJECT_TYPES:
+            raise ValueError(
+                "Unknown object type: " + str(table) + " (see OBJECT_TYPES)"
+            )
+        return table
+
+    def _write_objects(self, table: str, batch: List[dict]) -> int:
+        """Writes a batch of objects, with their tags and their addresses, in a single transaction"""
+        if len(batch) == 0:
+            return 0
+        uids = [(o["uid"],) for o in batch]
+        rows, tags, addresses = [], [], []
+        for obj in batch:
+            rows.append(
+                (
+                    obj["uid"],
+                    obj.get("name"),
+                    obj.get("type"),
+                    _modify_time(obj) or None,
+                    json.dumps(obj),
+                )
+            )
+            tags.extend((obj["uid"], table, _name(t)) for t in obj.get("tags", []))
+            addresses.extend(
+                (obj["uid"], table, address_key(first), address_key(last))
+                for first, last in object_ranges(obj)
+            )
+
+        with self._connection:
+            self._connection.executemany("DELETE FROM object_tags WHERE uid = ?", uids)
+            self._connection.executemany(
+                "DELETE FROM object_addresses WHERE uid = ?", uids
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO " + table + " VALUES (?, ?, ?, ?, ?)", rows
+            )
+            self._connection.executemany(
+                "INSERT INTO object_tags VALUES (?, ?, ?)", tags
+            )
+            self._connection.executemany(
+                "INSERT INTO object_addresses VALUES (?, ?, ?, ?)", addresses
+            )
+        return len(batch)
+
+    def _load(self, cursor: sqlite3.Cursor) -> List[dict]:
+        """Loads the objects of (uid, kind) rows"""
+        result = []
+        for row in cursor.fetchall():
+            data = self._connection.execute(
+                "SELECT data FROM " + self._check_table(row["kind"]) + " WHERE uid = ?",
+                (row["uid"],),
+            ).fetchone()
+            if data is not None:
+                result.append(json.loads(data["data"]))
+        return result
+
+    @staticmethod
+    def _flatten(
+        rulebase: List[dict], section: str = None
+    ) -> Iterator[Tuple[str, dict]]:
+        """Returns the rules of a rulebase with the name of their section"""
+        for item in rulebase:
+            if "rulebase" in item:
+                yield from Snapshot._flatten(item["rulebase"], item.get("name"))
+            else:
+                yield section, item
@@ -1,10 +1,14 @@
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Add support for Python 3.7
 if sys.version_info > (3, 8):
-    from typing import Any, Dict, List, Union, get_origin
+    from typing import Any, Callable, Dict, Iterable, Iterator, List, Union, get_origin
 else:
-    from typing import Union, List, Dict, Any
+    from typing import Union, List, Dict, Any, Callable, Iterable, Iterator
+
+from restfly.endpoint import APIEndpoint
+from restfly.session import APISession
 
 from pycheckpoint_api.management.exception import MandatoryFieldMissing, WrongType
 
@@ -95,3 +99,73 @@ def sanitize_secondary_parameters(d: dict, **kw) -> dict:
         if value is not None:
             payload[field.replace("_", "-")] = value
     return payload
+
+
+def map_pages(
+    func: Callable[[int], Any], offsets: Iterable[int], max_workers: int = 1
+) -> Iterator[Any]:
+    """This function is used to fetch several pages, sequentially or concurrently, while keeping their order
+
+    Args:
+        func (Callable[[int], Any]): Function fetching one page from its offset
+        offsets (Iterable[int]): Offsets of the pages to fetch
+        max_workers (int, optional): Maximum number of pages fetched at the same time. Defaults to 1 (sequential)
+
+    Returns:
+        Iterator[Any]: the pages, in the same order as ``offsets``
+
+    Examples:
+        >>> list(map_pages(lambda offset: offset * 2, [1, 2, 3], max_workers=2))
+        [2, 4, 6]
+    """
+    offsets = list(offsets)
+    if max_workers is None or max_workers <= 1 or len(offsets) <= 1:
+        yield from map(func, offsets)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(offsets))) as executor:
+        yield from executor.map(func, offsets)
+
+
+def root_api(endpoint: APIEndpoint) -> APISession:
+    """This function is used to get the API session from any endpoint, whatever its depth in the endpoint tree
+
+    Args:
+        endpoint (APIEndpoint): An endpoint such as ``firewall.network_objects.host``
+
+    Returns:
+        APISession: the session the endpoint belongs to
+
+    Examples:
+        >>> root_api(firewall.network_objects.host) is firewall
+        True
+    """
+    api = endpoint
+    while isinstance(api, APIEndpoint):
+        api = api._api
+    return api
+
+
+def response_options(raw: bool = None, lazy: bool = None, **kw) -> dict:
+    """This function is used to get the request options choosing the type of the response: Box objects,\
+    plain dictionaries and lists (``raw``) or lazy views (``lazy``)
+
+    Args:
+        raw (bool, optional): Indicates if the response must be returned as plain dictionaries and lists (True) or\
+        as Box objects (False). Defaults to None (the setting of the client is used)
+        lazy (bool, optional): Indicates if the response must be returned as lazy views, converted on access.\
+        Defaults to None (the setting of the client is used)
+        **kw (dict, optional): Any other keyword argument, ignored
+
+    Returns:
+        dict: the keyword arguments to add to the request
+
+    Examples:
+        >>> self._post("show-hosts", json=payload, **response_options(raw=True))
+        >>> self._post("show-hosts", json=payload, **response_options(**kw))
+    """
+    if lazy:
+        return {"lazy": True}
+    if raw is None:
+        return {} if lazy is None else {"lazy": False}
+    return {"box": not raw, "conv_json": True, "lazy": False}
@@ -0,0 +1,122 @@
+import ipaddress
+import random
+
+import pytest
+from box import Box
+
+from pycheckpoint_api.analysis import AddressIndex
+from pycheckpoint_api.analysis.address_index import (
+    Interval,
+    address_intervals,
+    parse_interval,
+)
+from pycheckpoint_api.records import HostRecord
+
+OBJECTS = [
+    {"uid": "h1", "name": "host1", "ipv4-address": "10.1.2.3"},
+    {"uid": "h2", "name": "host2", "ipv6-address": "2001:db8::1"},
+    {"uid": "n1", "name": "net1", "subnet4": "10.1.2.0", "mask-length4": 24},
+    {"uid": "n2", "name": "net2", "subnet4": "10.0.0.0", "mask-length4": 8},
+    {"uid": "n3", "name": "net3", "subnet6": "2001:db8::", "mask-length6": 64},
+    {
+        "uid": "r1",
+        "name": "range1",
+        "ipv4-address-first": "10.1.2.200",
+        "ipv4-address-last": "10.1.3.10",
+    },
+    {
+        "uid": "m1",
+        "name": "multicast1",
+        "ipv4-address-first": "224.0.0.1",
+        "ipv4-address-last": "224.0.0.20",
+    },
+    {
+        "uid": "w1",
+        "name": "wildcard1",
+        "ipv4-address": "192.168.0.1",
+        "ipv4-mask-wildcard": "0.0.255.0",
+    },
+    {"uid": "g1", "name": "group1", "members": []},
+]
+
+
+def uids(objects: list) -> list:
+    return [o["uid"] if isinstance(o, dict) else o.uid for o in objects]
+
+
+def test_address_intervals():
+    assert address_intervals(OBJECTS[0]) == [Interval(4, 0x0A010203, 0x0A010203)]
+    assert address_intervals(OBJECTS[7]) == [
+        Interval(4, 0xC0A80001, 0xC0A8FF01, 0x0000FF00)
+    ]
+    assert address_intervals(OBJECTS[8]) == []
+    assert address_intervals(HostRecord(uid="h", ipv4_address="10.1.2.3")) == [
+        Interval(4, 0x0A010203, 0x0A010203)
+    ]
+    assert parse_interval("10.0.0.1 - 10.0.0.9") == Interval(4, 0x0A000001, 0x0A000009)
+    with pytest.raises(ValueError):
+        parse_interval("10.0.0.1-2001:db8::1")
+
+
+def test_address_index():
+    index = AddressIndex(OBJECTS)
+
+    assert len(index) == 8
+    assert uids(index.contains("10.1.2.3")) == ["h1", "n1", "n2"]
+    assert uids(index.contains("10.1.3.1")) == ["n2", "r1"]
+    assert uids(index.contains("2001:db8::1")) == ["h2", "n3"]
+    assert index.contains("172.16.0.1") == []
+
+    # Wildcards only hold the addresses matching their fixed bits
+    assert uids(index.contains("192.168.42.1")) == ["w1"]
+    assert index.contains("192.168.42.2") == []
+
+    assert index.lookup(["10.1.3.1", "2001:db8::1", "1.1.1.1", "192.168.7.1"]) == {
+        "10.1.3.1": [OBJECTS[3], OBJECTS[5]],
+        "2001:db8::1": [OBJECTS[1], OBJECTS[4]],
+        "1.1.1.1": [],
+        "192.168.7.1": [OBJECTS[7]],
+    }
+
+    assert uids(index.overlapping("10.1.3.0/24")) == ["n2", "r1"]
+    assert uids(index.overlapping("192.168.0.2-192.168.0.255")) == []
+    assert uids(index.overlapping("192.168.0.2-192.168.1.1")) == ["w1"]
+    assert uids(index.within("10.1.0.0/16")) == ["h1", "n1", "r1"]
+    assert uids(index.exact("10.1.2.0/24")) == ["n1"]
+    assert uids(index.exact("10.1.2.3")) == ["h1"]
+
+    # The index is built again after an addition
+    index.add(Box({"uid": "h3", "ipv4-address": "172.16.0.1"}))
+    assert uids(index.contains("172.16.0.1")) == ["h3"]
+
+
+def test_address_index_matches_brute_force():
+    generator = random.Random(42)
+    objects = []
+    for i in range(300):
+        first = generator.randrange(0, 1 << 16)
+        last = first + generator.choice([0, 1, 15, 255, 4095])
+        objects.append(
+            {
+                "uid": str(i),
+                "ipv4-address-first": str(ipaddress.IPv4Address(first)),
+                "ipv4-address-last": str(ipaddress.IPv4Address(last)),
+            }
+        )
+    index = AddressIndex(objects)
+    addresses = [
+        str(ipaddress.IPv4Address(generator.randrange(0, 1 << 17))) for _ in range(500)
+    ]
+
+    lookup = index.lookup(addresses)
+    for address in addresses:
+        value = int(ipaddress.IPv4Address(address))
+        expected = [
+            o
+            for o in objects
+            if int(ipaddress.IPv4Address(o["ipv4-address-first"]))
+            <= value
+            <= int(ipaddress.IPv4Address(o["ipv4-address-last"]))
+        ]
+        assert index.contains(address) == expected
+        assert lookup[address] == expected
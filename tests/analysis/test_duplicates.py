@@ -0,0 +1,196 @@
+import ipaddress
+import random
+
+from box import Box
+
+from pycheckpoint_api.analysis import DuplicateDetector
+from pycheckpoint_api.records import HostRecord
+
+OBJECTS = [
+    {"uid": "h1", "name": "host1", "type": "host", "ipv4-address": "10.0.0.1"},
+    {"uid": "h2", "name": "server1", "type": "host", "ipv4-address": "10.0.0.1"},
+    {"uid": "h3", "name": "host3", "type": "host", "ipv4-address": "10.0.1.1"},
+    {
+        "uid": "h4",
+        "name": "dual",
+        "type": "host",
+        "ipv4-address": "10.0.0.4",
+        "ipv6-address": "2001:db8::4",
+    },
+    {
+        "uid": "n1",
+        "name": "lan",
+        "type": "network",
+        "subnet4": "10.0.0.0",
+        "mask-length4": 24,
+    },
+    {
+        "uid": "n2",
+        "name": "net_10",
+        "type": "network",
+        "subnet4": "10.0.0.0",
+        "mask-length4": 24,
+    },
+    {
+        "uid": "n3",
+        "name": "site",
+        "type": "network",
+        "subnet4": "10.0.0.0",
+        "mask-length4": 16,
+    },
+    {
+        "uid": "n4",
+        "name": "lan6",
+        "type": "network",
+        "subnet6": "2001:db8::",
+        "mask-length6": 64,
+    },
+    {
+        "uid": "r1",
+        "name": "single",
+        "type": "address-range",
+        "ipv4-address-first": "10.0.1.1",
+        "ipv4-address-last": "10.0.1.1",
+    },
+    {
+        "uid": "r2",
+        "name": "across",
+        "type": "address-range",
+        "ipv4-address-first": "10.0.0.200",
+        "ipv4-address-last": "10.0.1.50",
+    },
+    {"uid": "s1", "name": "https", "type": "service-tcp", "port": "443"},
+    {"uid": "s2", "name": "tcp-443", "type": "service-tcp", "port": "443"},
+    {"uid": "s3", "name": "high", "type": "service-tcp", "port": ">1023"},
+    {"uid": "s4", "name": "alt", "type": "service-tcp", "port": "8080"},
+    {"uid": "s5", "name": "dns", "type": "service-udp", "port": "53"},
+    {"uid": "g1", "name": "group1", "type": "group", "members": ["h1"]},
+]
+
+
+def names(objects):
+    return [o["name"] for o in objects]
+
+
+def test_duplicates():
+    detector = DuplicateDetector(Box(o) for o in OBJECTS)
+    assert len(detector) == len(OBJECTS) - 1
+    assert [names(group) for group in detector.duplicates()] == [
+        ["host1", "server1"],
+        ["host3", "single"],
+        ["lan", "net_10"],
+        ["https", "tcp-443"],
+    ]
+    by_type = DuplicateDetector(OBJECTS, by_type=True)
+    assert [names(group) for group in by_type.duplicates()] == [
+        ["host1", "server1"],
+        ["lan", "net_10"],
+        ["https", "tcp-443"],
+    ]
+
+
+def test_contained():
+    detector = DuplicateDetector(OBJECTS)
+    contained = {
+        (c.object["name"], c.container["name"], c.interval[0])
+        for c in detector.contained()
+    }
+    assert contained == {
+        ("host1", "lan", 4),
+        ("server1", "lan", 4),
+        ("dual", "lan", 4),
+        ("dual", "lan6", 6),
+        ("lan", "site", 4),
+        ("net_10", "site", 4),
+        ("host3", "across", 4),
+        ("single", "across", 4),
+        ("across", "site", 4),
+        ("alt", "high", "tcp"),
+    }
+
+
+def test_records():
+    detector = DuplicateDetector(
+        [
+            HostRecord(uid="h1", name="host1", ipv4_address="192.0.2.1"),
+            HostRecord(uid="h2", name="host2", ipv4_address="192.0.2.1"),
+        ]
+    )
+    assert [[o.name for o in group] for group in detector.duplicates()] == [
+        ["host1", "host2"]
+    ]
+
+
+def test_contained_brute_force():
+    random.seed(11)
+    networks = []
+    for i in range(300):
+        prefix = random.randint(20, 32)
+        address = ipaddress.ip_address("10.0.0.0") + random.randint(0, 2**14)
+        network = ipaddress.ip_network(str(address) + "/" + str(prefix), strict=False)
+        networks.append(
+            {
+                "uid": str(i),
+                "name": str(i),
+                "subnet4": str(network.network_address),
+                "mask-length4": prefix,
+            }
+        )
+    detector = DuplicateDetector(networks)
+    parsed = {
+        n["name"]: ipaddress.ip_network(n["subnet4"] + "/" + str(n["mask-length4"]))
+        for n in networks
+    }
+    for containment in detector.contained():
+        inner = parsed[containment.object["name"]]
+        outer = parsed[containment.container["name"]]
+        assert inner != outer and inner.subnet_of(outer)
+        # The innermost container: no other network in between
+        assert not any(
+            inner != other
+            and other != outer
+            and inner.subnet_of(other)
+            and other.subnet_of(outer)
+            for other in parsed.values()
+        )
+    reported = {c.object["name"] for c in detector.contained()}
+    for name, inner in parsed.items():
+        expected = any(
+            inner != other and inner.subnet_of(other) for other in parsed.values()
+        )
+        assert (name in reported) == expected
+
+
+def test_contained_overlapping_ranges():
+    random.seed(5)
+    ranges = {}
+    for i in range(300):
+        first = random.randint(0, 2000)
+        ranges[str(i)] = (first, first + random.randint(0, 300))
+    base = int(ipaddress.ip_address("10.0.0.0"))
+    detector = DuplicateDetector(
+        {
+            "uid": name,
+            "name": name,
+            "ipv4-address-first": str(ipaddress.ip_address(base + first)),
+            "ipv4-address-last": str(ipaddress.ip_address(base + last)),
+        }
+        for name, (first, last) in ranges.items()
+    )
+
+    def inside(inner, outer):
+        return inner != outer and outer[0] <= inner[0] and inner[1] <= outer[1]
+
+    reported = set()
+    for containment in detector.contained():
+        inner = ranges[containment.object["name"]]
+        outer = ranges[containment.container["name"]]
+        assert inside(inner, outer)
+        # The innermost container: no other range in between
+        assert not any(
+            inside(inner, other) and inside(other, outer) for other in ranges.values()
+        )
+        reported.add(containment.object["name"])
+    for name, inner in ranges.items():
+        expected = any(inside(inner, other) for other in ranges.values())
+        assert (name in reported) == expected
@@ -0,0 +1,183 @@
+import ipaddress
+
+import pytest
+from box import Box
+
+from pycheckpoint_api.analysis import GroupResolver
+from pycheckpoint_api.analysis.intervals import (
+    merge_intervals,
+    parse_ports,
+    service_ports,
+    subtract_intervals,
+)
+from pycheckpoint_api.records import GroupRecord, ServiceTcpRecord
+
+
+def ip(value):
+    return int(ipaddress.ip_address(value))
+
+
+OBJECTS = [
+    {"uid": "h1", "name": "host1", "type": "host", "ipv4-address": "10.0.0.1"},
+    {"uid": "h2", "name": "host2", "type": "host", "ipv4-address": "10.0.0.2"},
+    {"uid": "h3", "name": "host3", "type": "host", "ipv4-address": "10.0.0.3"},
+    {
+        "uid": "n1",
+        "name": "net1",
+        "type": "network",
+        "subnet4": "10.0.0.0",
+        "mask-length4": 24,
+    },
+    {"uid": "g1", "name": "group1", "type": "group", "members": ["h1", "g2"]},
+    {
+        "uid": "g2",
+        "name": "group2",
+        "type": "group",
+        "members": [{"uid": "h2", "name": "host2"}, "g3"],
+    },
+    {"uid": "g3", "name": "group3", "type": "group", "members": ["h3", "g2"]},
+    {"uid": "g4", "name": "group4", "type": "group", "members": ["n1"]},
+    {"uid": "g5", "name": "group5", "type": "group", "members": ["h1", "h2"]},
+    {
+        "uid": "x1",
+        "name": "exclusion1",
+        "type": "group-with-exclusion",
+        "include": {"uid": "g4", "name": "group4"},
+        "except": {"uid": "g5", "name": "group5"},
+    },
+    {"uid": "g6", "name": "group6", "type": "group", "members": ["x1", "unknown"]},
+    {"uid": "s1", "name": "http", "type": "service-tcp", "port": "80"},
+    {"uid": "s2", "name": "high", "type": "service-tcp", "port": ">1023"},
+    {"uid": "s3", "name": "dns", "type": "service-udp", "port": "53"},
+    {"uid": "s4", "name": "alt", "type": "service-tcp", "port": "81-90"},
+    {"uid": "sg1", "name": "web", "type": "service-group", "members": ["s1", "s4"]},
+    {
+        "uid": "sg2",
+        "name": "all",
+        "type": "service-group",
+        "members": ["sg1", "s2", "s3"],
+    },
+]
+
+
+@pytest.fixture
+def resolver():
+    return GroupResolver(Box(o) for o in OBJECTS)
+
+
+def test_members(resolver):
+    assert len(resolver) == len(OBJECTS)
+    assert resolver.members("group5") == frozenset({"h1", "h2"})
+    assert resolver.members("g1") == frozenset({"h1", "h2", "h3"})
+    assert [o["name"] for o in resolver.member_objects("group1")] == [
+        "host1",
+        "host2",
+        "host3",
+    ]
+    assert resolver.contains("group1", "host3")
+    assert not resolver.contains("group5", "host3")
+    assert resolver.is_group("exclusion1")
+    assert not resolver.is_group("host1")
+    assert "net1" in resolver
+    with pytest.raises(KeyError):
+        resolver.members("missing")
+
+
+def test_members_cycle(resolver):
+    # group2 and group3 are members of each other
+    assert resolver.members("group2") == frozenset({"h2", "h3"})
+    assert resolver.members("group3") == frozenset({"h2", "h3"})
+    assert resolver.members("group1") == frozenset({"h1", "h2", "h3"})
+
+
+def test_nested_groups(resolver):
+    assert resolver.contains("group1", "group2")
+    assert resolver.contains("group1", "g3")
+    assert resolver.contains("group2", "group2")
+    assert not resolver.contains("group4", "group4")
+    assert not resolver.contains("group5", "group1")
+    assert resolver.nested_groups("group1") == frozenset({"g2", "g3"})
+    assert resolver.nested_groups("group6") == frozenset({"x1", "g4"})
+    assert resolver.nested_groups("exclusion1") == frozenset({"g4"})
+    assert resolver.nested_groups("all") == frozenset({"sg1"})
+    assert resolver.nested_groups("group5") == frozenset()
+
+
+def test_members_exclusion(resolver):
+    # Only objects are removed: net1 isn't a member of group5
+    assert resolver.members("exclusion1") == frozenset({"n1"})
+    assert resolver.members("group6") == frozenset({"n1", "unknown"})
+
+
+def test_addresses(resolver):
+    assert resolver.addresses("group1") == ((4, ip("10.0.0.1"), ip("10.0.0.3")),)
+    assert resolver.addresses("exclusion1") == (
+        (4, ip("10.0.0.0"), ip("10.0.0.0")),
+        (4, ip("10.0.0.3"), ip("10.0.0.255")),
+    )
+    assert resolver.addresses("group6") == resolver.addresses("exclusion1")
+
+
+def test_ports(resolver):
+    assert resolver.ports("web") == (("tcp", 80, 90),)
+    assert resolver.ports("all") == (
+        ("tcp", 80, 90),
+        ("tcp", 1024, 65535),
+        ("udp", 53, 53),
+    )
+    assert resolver.ports("group1") == ()
+
+
+def test_records():
+    resolver = GroupResolver(
+        [
+            ServiceTcpRecord.from_dict(
+                {"uid": "s1", "name": "ssh", "type": "service-tcp", "port": "22"}
+            ),
+            GroupRecord.from_dict(
+                {"uid": "sg1", "name": "admin", "members": [{"uid": "s1"}]}
+            ),
+        ]
+    )
+    assert resolver.members("admin") == frozenset({"s1"})
+    assert resolver.ports("admin") == (("tcp", 22, 22),)
+
+
+def test_add_clears_memo(resolver):
+    assert resolver.members("group5") == frozenset({"h1", "h2"})
+    resolver.add({"uid": "g5", "name": "group5", "members": ["h3"]})
+    assert resolver.members("group5") == frozenset({"h3"})
+
+
+def test_deep_nesting():
+    objects = [{"uid": "h", "name": "host", "ipv4-address": "10.0.0.1"}]
+    objects += [
+        {"uid": "g" + str(i), "members": ["g" + str(i + 1) if i < 4999 else "h"]}
+        for i in range(5000)
+    ]
+    resolver = GroupResolver(objects)
+    assert resolver.members("g0") == frozenset({"h"})
+    assert resolver.members("g2500") == frozenset({"h"})
+
+
+def test_intervals():
+    assert merge_intervals([(4, 5, 9), (4, 0, 4), (6, 1, 1), (4, 20, 30)]) == (
+        (4, 0, 9),
+        (4, 20, 30),
+        (6, 1, 1),
+    )
+    assert subtract_intervals(
+        ((4, 0, 100),), [(4, 0, 9), (4, 50, 60), (6, 0, 100)]
+    ) == (
+        (4, 10, 49),
+        (4, 61, 100),
+    )
+    assert subtract_intervals(((4, 0, 10),), [(4, 0, 20)]) == ()
+    assert parse_ports("80") == (80, 80)
+    assert parse_ports("1000-2000") == (1000, 2000)
+    assert parse_ports("<1024") == (0, 1023)
+    assert parse_ports(">1023") == (1024, 65535)
+    assert parse_ports("") is None
+    assert service_ports({"type": "service-udp", "port": "53"}) == [("udp", 53, 53)]
+    assert service_ports({"type": "service-icmp", "icmp-type": 8}) == [("icmp", 8, 8)]
+    assert service_ports({"type": "service-other"}) == []
@@ -0,0 +1,234 @@
+import pytest
+from box import Box
+
+from pycheckpoint_api.analysis import NatSimulator
+from pycheckpoint_api.analysis.nat_simulator import ANY_OBJECT, ORIGINAL_OBJECT
+
+ANY = ANY_OBJECT["uid"]
+ORIGINAL = ORIGINAL_OBJECT["uid"]
+
+DICTIONARY = [
+    ANY_OBJECT,
+    ORIGINAL_OBJECT,
+    {"uid": "pt", "name": "Policy Targets", "type": "Global"},
+    {
+        "uid": "gw1",
+        "name": "gw1",
+        "type": "simple-gateway",
+        "ipv4-address": "198.51.100.1",
+    },
+    {
+        "uid": "gw2",
+        "name": "gw2",
+        "type": "simple-gateway",
+        "ipv4-address": "198.51.100.2",
+    },
+    {"uid": "web", "name": "web", "type": "host", "ipv4-address": "10.1.0.80"},
+    {
+        "uid": "web-pub",
+        "name": "web-pub",
+        "type": "host",
+        "ipv4-address": "192.0.2.80",
+    },
+    {"uid": "s8080", "name": "tcp-8080", "type": "service-tcp", "port": "8080"},
+    {"uid": "s80", "name": "http", "type": "service-tcp", "port": "80"},
+]
+
+OBJECTS = [
+    {
+        "uid": "h1",
+        "name": "server",
+        "type": "host",
+        "ipv4-address": "10.0.0.5",
+        "nat-settings": {
+            "auto-rule": True,
+            "method": "static",
+            "ipv4-address": "198.51.100.5",
+            "install-on": "All",
+        },
+    },
+    {
+        "uid": "n1",
+        "name": "lan",
+        "type": "network",
+        "subnet4": "10.0.0.0",
+        "mask-length4": 24,
+        "nat-settings": {
+            "auto-rule": True,
+            "method": "hide",
+            "hide-behind": "gateway",
+            "install-on": "All",
+        },
+    },
+    {
+        "uid": "n2",
+        "name": "dmz",
+        "type": "network",
+        "subnet4": "10.2.0.0",
+        "mask-length4": 24,
+        "nat-settings": {
+            "auto-rule": True,
+            "method": "static",
+            "ipv4-address": "203.0.113.0",
+            "install-on": "All",
+        },
+    },
+    {"uid": "h2", "name": "printer", "type": "host", "ipv4-address": "10.0.0.9"},
+]
+
+RULEBASE = {
+    "rulebase": [
+        {
+            "type": "nat-section",
+            "name": "Manual",
+            "rulebase": [
+                {
+                    "uid": "m1",
+                    "type": "nat-rule",
+                    "method": "static",
+                    "original-source": ANY,
+                    "original-destination": "web-pub",
+                    "original-service": "s80",
+                    "translated-source": ORIGINAL,
+                    "translated-destination": "web",
+                    "translated-service": "s8080",
+                    "install-on": ["pt"],
+                },
+                {
+                    "uid": "m2",
+                    "type": "nat-rule",
+                    "method": "hide",
+                    "enabled": False,
+                    "original-source": ANY,
+                    "original-destination": ANY,
+                    "original-service": ANY,
+                    "translated-source": "gw1",
+                    "translated-destination": ORIGINAL,
+                    "translated-service": ORIGINAL,
+                },
+            ],
+        },
+        {
+            "type": "nat-section",
+            "name": "Automatic Generated Rules",
+            "rulebase": [
+                {
+                    "uid": "auto1",
+                    "type": "nat-rule",
+                    "auto-generated": True,
+                    "original-source": ANY,
+                    "original-destination": ANY,
+                    "original-service": ANY,
+                },
+            ],
+        },
+        {
+            "type": "nat-section",
+            "name": "Bottom",
+            "rulebase": [
+                {
+                    "uid": "m3",
+                    "type": "nat-rule",
+                    "method": "hide",
+                    "original-source": ANY,
+                    "original-destination": ANY,
+                    "original-service": ANY,
+                    "translated-source": "gw2",
+                    "translated-destination": ORIGINAL,
+                    "translated-service": ORIGINAL,
+                    "install-on": ["gw2"],
+                },
+            ],
+        },
+    ],
+    "objects-dictionary": DICTIONARY,
+}
+
+
+@pytest.fixture
+def simulator():
+    return NatSimulator(Box(RULEBASE), OBJECTS, gateway="gw1")
+
+
+def test_rules(simulator):
+    # m2 is disabled, auto1 is replaced by the automatic rules, m3 isn't installed on gw1
+    uids = [r["uid"] for r in simulator.rules]
+    assert uids == [
+        "m1",
+        "h1#static-source",
+        "h1#static-destination",
+        "n2#static-source",
+        "n2#static-destination",
+        "n1#internal",
+        "n1#hide",
+    ]
+    assert len(NatSimulator(RULEBASE, OBJECTS)) == 8
+
+
+def test_translate_manual(simulator):
+    translation = simulator.translate("192.0.2.1", "192.0.2.80", 80)
+    assert [r["uid"] for r in translation.rules] == ["m1"]
+    assert translation.source == "192.0.2.1"
+    assert translation.destination == "10.1.0.80"
+    assert translation.port == 8080
+    assert simulator.translate("192.0.2.1", "192.0.2.80", 443).rules == ()
+
+
+def test_translate_static(simulator):
+    translation = simulator.translate("10.0.0.5", "192.0.2.1", 443)
+    assert [r["uid"] for r in translation.rules] == ["h1#static-source"]
+    assert translation.source == "198.51.100.5"
+    assert translation.destination == "192.0.2.1"
+
+    translation = simulator.translate("192.0.2.1", "203.0.113.17", 22)
+    assert [r["uid"] for r in translation.rules] == ["n2#static-destination"]
+    assert translation.destination == "10.2.0.17"
+    assert translation.port == 22
+
+
+def test_translate_hide(simulator):
+    translation = simulator.translate("10.0.0.9", "192.0.2.1", 443)
+    assert [r["uid"] for r in translation.rules] == ["n1#hide"]
+    assert translation.source == "198.51.100.1"
+    assert simulator.translate("10.0.0.9", "10.0.0.10", 443).source == "10.0.0.9"
+    assert (
+        NatSimulator(RULEBASE, OBJECTS).translate("10.0.0.9", "192.0.2.1").source
+        is None
+    )
+
+
+def test_translate_bidirectional(simulator):
+    translation = simulator.translate("10.0.0.9", "203.0.113.17", 443)
+    assert [r["uid"] for r in translation.rules] == [
+        "n2#static-destination",
+        "n1#hide",
+    ]
+    assert translation.source == "198.51.100.1"
+    assert translation.destination == "10.2.0.17"
+
+    translation = NatSimulator(
+        RULEBASE, OBJECTS, gateway="gw1", bidirectional=False
+    ).translate("10.0.0.9", "203.0.113.17", 443)
+    assert translation.source == "10.0.0.9"
+    assert translation.destination == "10.2.0.17"
+
+
+def test_translate_all(simulator):
+    flows = [
+        ("10.0.0.5", "192.0.2.1", 443, "tcp"),
+        ("192.0.2.1", "192.0.2.80", 80, "tcp"),
+        ("192.0.2.1", "192.0.2.2", 53, "udp"),
+    ] * 1000
+    translations = simulator.translate_all(flows)
+    assert len(translations) == 3000
+    assert [t.destination for t in translations[:3]] == [
+        "192.0.2.1",
+        "10.1.0.80",
+        "192.0.2.2",
+    ]
+    assert translations[2].rules == ()
+
+
+def test_unknown_gateway():
+    with pytest.raises(KeyError):
+        NatSimulator(RULEBASE, OBJECTS, gateway="gw3")
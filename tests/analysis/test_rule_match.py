@@ -0,0 +1,220 @@
+import ipaddress
+import random
+
+from box import Box
+
+from pycheckpoint_api.analysis import Flow, RuleMatcher
+from pycheckpoint_api.analysis.rule_match import flatten_rulebase
+
+ANY = "97aeb369-9aea-11d5-bd16-0090272ccb30"
+
+DICTIONARY = [
+    {"uid": ANY, "name": "Any", "type": "CpmiAnyObject"},
+    {"uid": "h1", "name": "admin", "type": "host", "ipv4-address": "10.0.0.5"},
+    {
+        "uid": "n1",
+        "name": "lan",
+        "type": "network",
+        "subnet4": "10.0.0.0",
+        "mask-length4": 24,
+    },
+    {
+        "uid": "n2",
+        "name": "dmz",
+        "type": "network",
+        "subnet4": "192.0.2.0",
+        "mask-length4": 24,
+    },
+    {
+        "uid": "n3",
+        "name": "lan6",
+        "type": "network",
+        "subnet6": "2001:db8::",
+        "mask-length6": 64,
+    },
+    {"uid": "g1", "name": "servers", "type": "group", "members": ["n2", "n3"]},
+    {"uid": "s1", "name": "ssh", "type": "service-tcp", "port": "22"},
+    {"uid": "s2", "name": "https", "type": "service-tcp", "port": "443"},
+    {"uid": "s3", "name": "dns", "type": "service-udp", "port": "53"},
+    {"uid": "s4", "name": "echo-request", "type": "service-icmp", "icmp-type": 8},
+    {"uid": "sg1", "name": "web", "type": "service-group", "members": ["s2"]},
+]
+
+
+def rule(uid, source, destination, service, **kw):
+    return {
+        "uid": uid,
+        "name": uid,
+        "type": "access-rule",
+        "source": source,
+        "destination": destination,
+        "service": service,
+        "action": "Accept",
+        **kw,
+    }
+
+
+RULEBASE = {
+    "rulebase": [
+        {
+            "type": "access-section",
+            "name": "Admin",
+            "rulebase": [
+                rule("r1", ["h1"], [ANY], ["s1"]),
+                rule("r2", ["n1"], ["g1"], ["s1"], enabled=False),
+            ],
+        },
+        {
+            "type": "access-section",
+            "name": "Servers",
+            "rulebase": [
+                rule("r3", ["n1"], ["g1"], ["sg1", "s4"]),
+                rule("r4", ["n1"], ["n1"], ["s3"], **{"source-negate": True}),
+                rule("r5", ["n1"], ["n2"], ["s2"], **{"service-negate": True}),
+            ],
+        },
+        rule("cleanup", [ANY], [ANY], [ANY], action="Drop"),
+    ],
+    "objects-dictionary": DICTIONARY,
+}
+
+
+def test_match():
+    matcher = RuleMatcher(Box(RULEBASE))
+    assert len(matcher) == 5
+    assert matcher.match("10.0.0.5", "8.8.8.8", 22)["uid"] == "r1"
+    assert matcher.match("10.0.0.6", "192.0.2.1", 22)["uid"] == "r5"
+    assert matcher.match("10.0.0.6", "192.0.2.1", 443)["uid"] == "r3"
+    assert matcher.match("10.0.0.6", "2001:db8::1", 443)["uid"] == "r3"
+    assert matcher.match("10.0.0.6", "192.0.2.1", 8, "icmp")["uid"] == "r3"
+    assert matcher.match("10.0.0.6", "192.0.2.1", 0, "icmp")["uid"] == "r5"
+    assert matcher.match("10.0.0.6", "192.0.2.1", 5000, "gre")["uid"] == "r5"
+    assert matcher.match("10.0.0.6", "192.0.2.1")["uid"] == "r3"
+    assert [r["uid"] for r in matcher.matches("10.0.0.5", "192.0.2.1", 22)] == [
+        "r1",
+        "r5",
+        "cleanup",
+    ]
+
+
+def test_match_negate():
+    matcher = RuleMatcher(RULEBASE)
+    assert matcher.match("172.16.0.1", "10.0.0.1", 53, "udp")["uid"] == "r4"
+    assert matcher.match("10.0.0.7", "10.0.0.1", 53, "udp")["uid"] == "cleanup"
+
+
+def test_match_no_cleanup():
+    matcher = RuleMatcher(list(flatten_rulebase(RULEBASE["rulebase"]))[:-1], DICTIONARY)
+    assert len(matcher) == 4
+    assert matcher.match("172.16.0.1", "172.16.0.2", 22) is None
+
+
+def test_match_ranges():
+    rules = [
+        {
+            "uid": "r1",
+            "source-ranges": {
+                "ipv4": [{"start": "10.0.0.0", "end": "10.0.0.255"}],
+                "ipv6": [],
+                "others": [],
+            },
+            "destination-ranges": {
+                "ipv4": [{"start": "0.0.0.0", "end": "255.255.255.255"}],
+                "ipv6": [],
+            },
+            "service-ranges": {"tcp": [{"start": 80, "end": 90}], "others": []},
+        }
+    ]
+    matcher = RuleMatcher(rules)
+    assert matcher.match("10.0.0.1", "1.1.1.1", 85)["uid"] == "r1"
+    assert matcher.match("10.0.0.1", "1.1.1.1", 85, "udp") is None
+    assert matcher.match("10.0.1.1", "1.1.1.1", 85) is None
+
+
+def test_match_any_without_dictionary():
+    # Rules stored without their objects dictionary, "Any" given by uid, name or as an object
+    rules = [
+        rule("r1", ["h1"], [ANY], ["s1"]),
+        rule("r2", ["Any"], [{"uid": ANY, "name": "Any"}], ["s3"]),
+        rule("r3", [{"name": "Any", "type": "CpmiAnyObject"}], ["Any"], [ANY]),
+    ]
+    matcher = RuleMatcher(rules, DICTIONARY[1:])
+    assert matcher.match("10.0.0.5", "8.8.8.8", 22)["uid"] == "r1"
+    assert matcher.match("172.16.0.1", "8.8.8.8", 53, "udp")["uid"] == "r2"
+    assert matcher.match("172.16.0.1", "2001:db8::1", 8, "icmp")["uid"] == "r3"
+
+
+def test_match_ranges_others():
+    addresses = {"ipv4": [{"start": "0.0.0.0", "end": "255.255.255.255"}]}
+    rules = [
+        {
+            "uid": "r1",
+            "source-ranges": addresses,
+            "destination-ranges": addresses,
+            "service-ranges": {"tcp": [{"start": 80, "end": 80}], "others": []},
+        },
+        {
+            "uid": "r2",
+            "source-ranges": addresses,
+            "destination-ranges": addresses,
+            "service-ranges": {
+                "tcp": [{"start": 443, "end": 443}],
+                "others": [{"uid": "o1", "name": "gre"}],
+            },
+        },
+    ]
+    matcher = RuleMatcher(rules)
+    assert matcher.match("10.0.0.1", "1.1.1.1", 0, "gre")["uid"] == "r2"
+    assert matcher.match("10.0.0.1", "1.1.1.1", 443)["uid"] == "r2"
+    assert matcher.match("10.0.0.1", "1.1.1.1", 80, "udp") is None
+
+
+def test_match_all():
+    matcher = RuleMatcher(RULEBASE)
+    flows = [
+        ("10.0.0.5", "8.8.8.8", 22, "tcp"),
+        Flow("172.16.0.1", "10.0.0.1", 53, "udp"),
+        Flow("10.0.0.9", "192.0.2.9", 443),
+    ]
+    assert [r["uid"] for r in matcher.match_all(flows)] == ["r1", "r4", "r3"]
+
+
+def test_match_all_brute_force():
+    matcher = RuleMatcher(RULEBASE)
+    lan = ipaddress.ip_network("10.0.0.0/24")
+    dmz = ipaddress.ip_network("192.0.2.0/24")
+
+    def expected(source, destination, port, protocol):
+        source, destination = ipaddress.ip_address(source), ipaddress.ip_address(
+            destination
+        )
+        if str(source) == "10.0.0.5" and port == 22 and protocol == "tcp":
+            return "r1"
+        if source in lan and destination in dmz and port == 443 and protocol == "tcp":
+            return "r3"
+        if (
+            source not in lan
+            and destination in lan
+            and port == 53
+            and protocol == "udp"
+        ):
+            return "r4"
+        if (
+            source in lan
+            and destination in dmz
+            and not (port == 443 and protocol == "tcp")
+        ):
+            return "r5"
+        return "cleanup"
+
+    random.seed(7)
+    flows = [
+        (
+            random.choice(["10.0.0.5", "10.0.0.77", "172.16.0.1"]),
+            random.choice(["192.0.2.10", "10.0.0.1", "8.8.8.8"]),
+            random.choice([22, 53, 443, 8080]),
+            random.choice(["tcp", "udp"]),
+        )
+        for _ in range(2000)
+    ]
+    assert [r["uid"] for r in matcher.match_all(flows)] == [expected(*f) for f in flows]
@@ -0,0 +1,116 @@
+import random
+
+from box import Box
+
+from pycheckpoint_api.analysis import ServicePortIndex
+from pycheckpoint_api.records import ServiceUdpRecord
+
+SERVICES = [
+    {"uid": "s1", "name": "https", "type": "service-tcp", "port": "443"},
+    {"uid": "s2", "name": "http", "type": "service-tcp", "port": "80"},
+    {"uid": "s3", "name": "alt", "type": "service-tcp", "port": "8000-8080"},
+    {"uid": "s4", "name": "high", "type": "service-tcp", "port": ">1023"},
+    {"uid": "s5", "name": "sctp", "type": "service-sctp", "port": "<1024"},
+    {"uid": "s6", "name": "echo", "type": "service-icmp", "icmp-type": 8},
+    {"uid": "s7", "name": "gre", "type": "service-other", "ip-protocol": 47},
+    {"uid": "s8", "name": "tcp-all", "type": "service-other", "ip-protocol": "6"},
+    {
+        "uid": "g1",
+        "name": "web",
+        "type": "service-group",
+        "members": ["s1", "s2", "g2"],
+    },
+    {"uid": "g2", "name": "alt-group", "type": "service-group", "members": ["s3"]},
+    {"uid": "h1", "name": "host1", "type": "host", "ipv4-address": "10.0.0.1"},
+]
+
+
+def names(services):
+    return [s["name"] for s in services]
+
+
+def test_covering():
+    index = ServicePortIndex(Box(s) for s in SERVICES)
+    assert len(index) == len(SERVICES)
+    assert names(index.covering("tcp", 443)) == ["https", "tcp-all", "web"]
+    assert names(index.covering("tcp", 8080)) == [
+        "alt",
+        "high",
+        "tcp-all",
+        "web",
+        "alt-group",
+    ]
+    assert names(index.covering(6, 80)) == ["http", "tcp-all", "web"]
+    assert names(index.covering("sctp", 0)) == ["sctp"]
+    assert names(index.covering("icmp", 8)) == ["echo"]
+    assert names(index.covering(47, 0)) == ["gre"]
+    assert names(index.covering("udp", 53)) == []
+
+
+def test_ports():
+    index = ServicePortIndex(SERVICES)
+    assert index.ports("web") == (
+        ("tcp", 80, 80),
+        ("tcp", 443, 443),
+        ("tcp", 8000, 8080),
+    )
+    assert index.ports("s4") == (("tcp", 1024, 65535),)
+
+
+def test_ranges():
+    index = ServicePortIndex(SERVICES)
+    assert names(index.overlapping("tcp", "8050-9000")) == [
+        "alt",
+        "high",
+        "tcp-all",
+        "web",
+        "alt-group",
+    ]
+    assert names(index.within("tcp", "<1024")) == ["https", "http"]
+    assert names(index.within("tcp", "1-9000")) == [
+        "https",
+        "http",
+        "alt",
+        "web",
+        "alt-group",
+    ]
+    assert names(index.exact("tcp", 443)) == ["https"]
+    assert names(index.exact("tcp", "8000-8080")) == ["alt", "alt-group"]
+
+
+def test_add_records():
+    index = ServicePortIndex(SERVICES)
+    assert names(index.covering("udp", 53)) == []
+    index.add(
+        ServiceUdpRecord.from_dict(
+            {"uid": "u1", "name": "dns", "type": "service-udp", "port": "53"}
+        )
+    )
+    assert [s.name for s in index.covering("udp", 53)] == ["dns"]
+
+
+def test_lookup_brute_force():
+    random.seed(3)
+    services = [
+        {
+            "uid": str(i),
+            "name": str(i),
+            "type": random.choice(["service-tcp", "service-udp"]),
+            "port": "{}-{}".format(*sorted(random.sample(range(0, 2000), 2))),
+        }
+        for i in range(200)
+    ]
+    index = ServicePortIndex(services)
+    queries = [
+        (random.choice(["tcp", "udp", "sctp"]), random.randint(0, 2100))
+        for _ in range(500)
+    ]
+    result = index.lookup(queries)
+    for protocol, port in queries:
+        expected = [
+            s["name"]
+            for s in services
+            if s["type"] == "service-" + protocol
+            and int(s["port"].split("-")[0]) <= port <= int(s["port"].split("-")[1])
+        ]
+        assert names(result[(protocol, port)]) == expected
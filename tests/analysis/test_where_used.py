@@ -0,0 +1,173 @@
+import pytest
+from box import Box
+
+from pycheckpoint_api import Snapshot
+from pycheckpoint_api.analysis import WhereUsedIndex
+from pycheckpoint_api.records import GroupRecord
+
+OBJECTS = [
+    {"uid": "h1", "name": "host1", "type": "host", "ipv4-address": "10.0.0.1"},
+    {"uid": "h2", "name": "host2", "type": "host", "ipv4-address": "10.0.0.2"},
+    {"uid": "h3", "name": "unused", "type": "host", "ipv4-address": "10.0.0.3"},
+    {
+        "uid": "n1",
+        "name": "lan",
+        "type": "network",
+        "subnet4": "10.0.0.0",
+        "mask-length4": 24,
+    },
+    {
+        "uid": "g1",
+        "name": "inner",
+        "type": "group",
+        "members": [{"uid": "h1", "name": "host1"}],
+    },
+    {"uid": "g2", "name": "outer", "type": "group", "members": ["g1", "h2"]},
+    {
+        "uid": "x1",
+        "name": "lan-but",
+        "type": "group-with-exclusion",
+        "include": "n1",
+        "except": "g1",
+    },
+    {"uid": "s1", "name": "https", "type": "service-tcp", "port": "443"},
+    {"uid": "t1", "name": "office-hours", "type": "time"},
+]
+
+ACCESS = {
+    "rulebase": [
+        {
+            "type": "access-section",
+            "name": "Section",
+            "rulebase": [
+                {
+                    "uid": "r1",
+                    "name": "web",
+                    "type": "access-rule",
+                    "layer": "l1",
+                    "source": ["g2"],
+                    "destination": ["x1"],
+                    "service": ["s1"],
+                    "install-on": ["gw"],
+                    "time": ["t1"],
+                }
+            ],
+        },
+    ],
+    "objects-dictionary": [{"uid": "gw", "name": "gw1", "type": "simple-gateway"}],
+}
+
+NAT = [
+    {
+        "uid": "m1",
+        "type": "nat-rule",
+        "original-source": "n1",
+        "original-destination": "h2",
+        "translated-source": "gw",
+    }
+]
+
+
+@pytest.fixture
+def index():
+    index = WhereUsedIndex(Box(o) for o in OBJECTS)
+    assert index.add_rulebase(Box(ACCESS)) == 1
+    assert index.add_rulebase(NAT, layer="standard", kind="nat") == 1
+    return index
+
+
+def usages(index, value, indirect=False):
+    return [
+        (u.referrer["uid"], u.field, u.layer)
+        for u in index.where_used(value, indirect=indirect)
+    ]
+
+
+def test_where_used(index):
+    assert len(index) == len(OBJECTS) + 1
+    assert usages(index, "host1") == [("g1", "members", None)]
+    assert usages(index, "g1") == [("g2", "members", None), ("x1", "except", None)]
+    assert usages(index, "h2") == [
+        ("g2", "members", None),
+        ("m1", "original-destination", "standard"),
+    ]
+    assert usages(index, "lan") == [
+        ("x1", "include", None),
+        ("m1", "original-source", "standard"),
+    ]
+    assert usages(index, "gw1") == [
+        ("r1", "install-on", "l1"),
+        ("m1", "translated-source", "standard"),
+    ]
+    assert usages(index, "t1") == [("r1", "time", "l1")]
+    assert usages(index, "missing") == []
+
+
+def test_where_used_indirect(index):
+    assert usages(index, "host1", indirect=True) == [
+        ("g1", "members", None),
+        ("g2", "members", None),
+        ("x1", "except", None),
+        ("r1", "source", "l1"),
+        ("r1", "destination", "l1"),
+    ]
+
+
+def test_unused(index):
+    assert [o["name"] for o in index.unused()] == ["unused"]
+    assert index.unused(["network"]) == []
+    assert index.is_used("host1")
+    assert not index.is_used("unused")
+    counts = index.counts()
+    assert counts["h3"] == 0
+    assert counts["h2"] == 2
+
+
+def test_add_again(index):
+    # A group added again replaces its members, without duplicating the usages
+    index.add_objects(
+        [{"uid": "g2", "name": "outer", "type": "group", "members": ["h1"]}]
+    )
+    index.add_objects(
+        [{"uid": "g2", "name": "outer", "type": "group", "members": ["h1"]}]
+    )
+    assert usages(index, "host1") == [("g1", "members", None), ("g2", "members", None)]
+    assert usages(index, "h2") == [("m1", "original-destination", "standard")]
+    assert index.counts()["g1"] == 1
+
+    # A rule added again as well
+    index.add_rulebase(NAT, layer="standard", kind="nat")
+    assert usages(index, "lan") == [
+        ("x1", "include", None),
+        ("m1", "original-source", "standard"),
+    ]
+    index.add_rulebase([dict(NAT[0], **{"original-destination": "h1"})], kind="nat")
+    assert usages(index, "h2") == []
+    assert not index.is_used("h2")
+
+
+def test_records():
+    index = WhereUsedIndex(
+        [GroupRecord.from_dict({"uid": "g1", "name": "g", "members": ["h1"]})]
+    )
+    assert [u.referrer.name for u in index.where_used("h1")] == ["g"]
+    with pytest.raises(ValueError):
+        index.add_rulebase([], kind="https")
+
+
+def test_snapshot():
+    with Snapshot() as snapshot:
+        snapshot.store_objects("hosts", OBJECTS[:3])
+        snapshot.store_objects("groups", OBJECTS[4:6])
+        snapshot.store_rulebase({"uid": "l1", "name": "Network"}, ACCESS)
+        snapshot.store_rulebase(
+            {"uid": "p1", "name": "standard"}, {"rulebase": NAT}, kind="nat"
+        )
+        index = WhereUsedIndex()
+        assert index.add_snapshot(snapshot) == 2
+    assert usages(index, "host2") == [
+        ("g2", "members", None),
+        ("m1", "original-destination", "standard"),
+    ]
+    assert usages(index, "g2") == [("r1", "source", "Network")]
+    assert [o["name"] for o in index.unused()] == ["unused"]
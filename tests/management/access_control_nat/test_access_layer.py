@@ -140,3 +140,27 @@ def test_show_access_layers(management, resp_from_to_objects):
     )
 
     assert isinstance(resp.total, int)
+
+
+@responses.activate
+def test_show_all_access_layers(management, paged_response):
+    responses.add_callback(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/show-access-layers",
+        callback=paged_response("access-layers", total=7),
+        content_type="application/json",
+    )
+
+    resp = management.access_control_nat.access_layer.show_access_layers(
+        show_all=True, limit=3, max_workers=2
+    )
+
+    assert resp.to == 7
+    assert [o.uid for o in resp["access-layers"]] == [str(i) for i in range(7)]
+    assert len(responses.calls) == 3
+
+    assert [
+        o.uid
+        for o in management.access_control_nat.access_layer.iter_access_layers(limit=5)
+    ] == [str(i) for i in range(7)]
+    assert len(responses.calls) == 5
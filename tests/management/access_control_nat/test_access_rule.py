@@ -1,3 +1,5 @@
+import json
+
 import pytest
 import responses
 
@@ -230,3 +232,156 @@ def test_show_access_rulebase(management, resp_access_rulebase):
     # Missing mandatory parameter
     with pytest.raises(MandatoryFieldMissing):
         management.access_control_nat.access_rule.show_access_rulebase()
+
+
+def paged_access_rulebase(request):
+    # 5 rules spread over 2 sections: "s1" (rules 1 to 3) and "s2" (rules 4 and 5)
+    payload = json.loads(request.body)
+    offset, limit = payload["offset"], payload["limit"]
+    rulebase = []
+    for number in range(offset + 1, min(offset + limit, 5) + 1):
+        section = "s1" if number <= 3 else "s2"
+        if len(rulebase) == 0 or rulebase[-1]["uid"] != section:
+            rulebase.append(
+                {
+                    "uid": section,
+                    "type": "access-section",
+                    "from": number,
+                    "rulebase": [],
+                }
+            )
+        rulebase[-1]["to"] = number
+        rulebase[-1]["rulebase"].append(
+            {"uid": "r" + str(number), "type": "access-rule", "source": ["any"]}
+        )
+    objects_dictionary = [{"uid": "any", "name": "Any"}] + [
+        {"uid": rule["uid"] + "-object"} for s in rulebase for rule in s["rulebase"]
+    ]
+    return (
+        200,
+        {},
+        json.dumps(
+            {
+                "from": offset + 1,
+                "to": min(offset + limit, 5),
+                "total": 5,
+                "rulebase": rulebase,
+                "objects-dictionary": objects_dictionary,
+            }
+        ),
+    )
+
+
+@responses.activate
+def test_show_access_rulebase_concurrently(management):
+    responses.add_callback(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/show-access-rulebase",
+        callback=paged_access_rulebase,
+        content_type="application/json",
+    )
+
+    for max_workers in [1, 3]:
+        resp = management.access_control_nat.access_rule.show_access_rulebase(
+            name="Network",
+            show_all=True,
+            limit=2,
+            use_object_dictionnary=True,
+            max_workers=max_workers,
+        )
+
+        assert resp.total == 5
+        assert [section.uid for section in resp.rulebase] == ["s1", "s2"]
+        assert [rule.uid for rule in resp.rulebase[0].rulebase] == ["r1", "r2", "r3"]
+        assert [rule.uid for rule in resp.rulebase[1].rulebase] == ["r4", "r5"]
+        assert resp.rulebase[0]["from"] == 1
+        assert resp.rulebase[0].to == 3
+        assert resp.rulebase[1]["from"] == 4
+        assert resp.rulebase[1].to == 5
+        assert [obj.uid for obj in resp.objects_dictionary] == [
+            "any",
+            "r1-object",
+            "r2-object",
+            "r3-object",
+            "r4-object",
+            "r5-object",
+        ]
+
+    resp = management.access_control_nat.access_rule.show_access_rulebase(
+        name="Network",
+        show_all=True,
+        limit=2,
+        use_object_dictionnary=True,
+        resolve_objects=True,
+    )
+
+    rules = resp.rulebase[0].rulebase + resp.rulebase[1].rulebase
+    assert all(rule.source[0] is resp.objects_dictionary[0] for rule in rules)
+    assert rules[0].source[0].name == "Any"
+
+    # Plain dictionaries are merged the same way
+    resp = management.access_control_nat.access_rule.show_access_rulebase(
+        name="Network",
+        show_all=True,
+        limit=2,
+        use_object_dictionnary=True,
+        max_workers=3,
+        resolve_objects=True,
+        raw=True,
+    )
+
+    assert type(resp) is dict
+    assert [rule["uid"] for rule in resp["rulebase"][0]["rulebase"]] == [
+        "r1",
+        "r2",
+        "r3",
+    ]
+    assert len(resp["objects-dictionary"]) == 6
+    assert resp["rulebase"][1]["rulebase"][0]["source"][0]["name"] == "Any"
+
+    # Lazy views are merged the same way
+    resp = management.access_control_nat.access_rule.show_access_rulebase(
+        name="Network",
+        show_all=True,
+        limit=2,
+        use_object_dictionnary=True,
+        max_workers=3,
+        resolve_objects=True,
+        lazy=True,
+    )
+
+    assert [rule.uid for rule in resp.rulebase[0].rulebase] == ["r1", "r2", "r3"]
+    assert len(resp.objects_dictionary) == 6
+    assert resp.rulebase[1].rulebase[1].source[0].name == "Any"
+
+
+@responses.activate
+def test_iter_access_rulebase(management):
+    responses.add_callback(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/show-access-rulebase",
+        callback=paged_access_rulebase,
+        content_type="application/json",
+    )
+
+    sections = list(
+        management.access_control_nat.access_rule.iter_access_rulebase(
+            name="Network",
+            limit=2,
+            use_object_dictionnary=True,
+            resolve_objects=True,
+        )
+    )
+
+    # Pages start after the last rule of the previous one, not after its sections
+    offsets = [json.loads(c.request.body)["offset"] for c in responses.calls]
+    assert offsets == [0, 2, 4]
+    assert [section.uid for section in sections] == ["s1", "s2"]
+    assert [rule.uid for rule in sections[0].rulebase] == ["r1", "r2", "r3"]
+    assert [rule.uid for rule in sections[1].rulebase] == ["r4", "r5"]
+    assert sections[0].to == 3
+    assert sections[1].rulebase[1].source[0].name == "Any"
+
+    # Missing mandatory parameter
+    with pytest.raises(MandatoryFieldMissing):
+        next(management.access_control_nat.access_rule.iter_access_rulebase())
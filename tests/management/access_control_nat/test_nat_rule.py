@@ -1,3 +1,5 @@
+import json
+
 import pytest
 import responses
 
@@ -201,3 +203,72 @@ def test_show_nat_rulebase(management, resp_nat_rulebase):
     assert resp.total == 4
 
     assert isinstance(resp.total, int)
+
+
+@responses.activate
+def test_show_nat_rulebase_objects_dictionary(management, resp_nat_rulebase):
+    responses.add(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/show-nat-rulebase",
+        json=resp_nat_rulebase,
+        status=200,
+    )
+
+    # Each of the 2 pages comes with the same objects dictionary
+    resp = management.access_control_nat.nat_rule.show_nat_rulebase(
+        package="standard",
+        show_all=True,
+        limit=2,
+        use_object_dictionnary=True,
+        max_workers=2,
+        resolve_objects=True,
+    )
+
+    assert len(responses.calls) == 2
+    assert len(resp.objects_dictionary) == 9
+
+    first_rule, second_rule = resp.rulebase[0], resp.rulebase[1]
+    assert first_rule.original_source.name == "Any"
+    assert first_rule.original_source is second_rule.original_source
+    assert first_rule.install_on[0].name == "Policy Targets"
+    assert first_rule.uid == "5b149268-1396-4d16-93c9-79d69a49de18"
+
+
+def paged_nat_rulebase(request):
+    # 5 rules spread over 2 sections: "auto" (rules 1 and 2) and "manual" (rules 3 to 5)
+    payload = json.loads(request.body)
+    offset, limit = payload["offset"], payload["limit"]
+    rulebase = []
+    for number in range(offset + 1, min(offset + limit, 5) + 1):
+        section = "auto" if number <= 2 else "manual"
+        if len(rulebase) == 0 or rulebase[-1]["uid"] != section:
+            rulebase.append({"uid": section, "type": "nat-section", "rulebase": []})
+        rulebase[-1]["rulebase"].append({"uid": "r" + str(number), "type": "nat-rule"})
+    body = {
+        "from": offset + 1,
+        "to": min(offset + limit, 5),
+        "total": 5,
+        "rulebase": rulebase,
+    }
+    return (200, {}, json.dumps(body))
+
+
+@responses.activate
+def test_iter_nat_rulebase(management):
+    responses.add_callback(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/show-nat-rulebase",
+        callback=paged_nat_rulebase,
+        content_type="application/json",
+    )
+
+    sections = list(
+        management.access_control_nat.nat_rule.iter_nat_rulebase(
+            package="standard", limit=2
+        )
+    )
+
+    offsets = [json.loads(c.request.body)["offset"] for c in responses.calls]
+    assert offsets == [0, 2, 4]
+    assert [section.uid for section in sections] == ["auto", "manual"]
+    assert [rule.uid for rule in sections[1].rulebase] == ["r3", "r4", "r5"]
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 import responses
 
@@ -90,6 +92,29 @@ def fixture_resp_login_message():
     }
 
 
+@pytest.fixture(name="paged_response")
+def fixture_paged_response():
+    def build(key: str, total: int):
+        """Builds a callback answering a list command with the page matching its offset and limit"""
+
+        def callback(request):
+            payload = json.loads(request.body)
+            offset, limit = payload.get("offset", 0), payload.get("limit", 50)
+            items = [
+                {"uid": str(i), "name": "object_" + str(i)}
+                for i in range(offset, min(offset + limit, total))
+            ]
+            return (
+                200,
+                {},
+                json.dumps({"from": offset + 1, "total": total, key: items}),
+            )
+
+        return callback
+
+    return build
+
+
 @pytest.fixture(name="management")
 @responses.activate
 def management(session):
@@ -0,0 +1,114 @@
+import json
+
+import pytest
+import responses
+
+
+def add_tasks(statuses: list, changes: list):
+    statuses = iter(statuses)
+
+    def show_task(request):
+        task = {"task-id": "task", "status": next(statuses)}
+        if task["status"] == "succeeded":
+            task["task-details"] = [{"changes": changes}]
+        return (200, {}, json.dumps({"tasks": [task]}))
+
+    responses.add(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/show-changes",
+        json={"task-id": "task"},
+        status=200,
+    )
+    responses.add_callback(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/show-task",
+        callback=show_task,
+        content_type="application/json",
+    )
+
+
+@responses.activate
+def test_show_changes(management):
+    add_tasks(["succeeded"], [])
+
+    resp = management.misc.changes.show_changes(
+        from_date="2017-02-01T08:20:50", to_session="session-uid", limit=10
+    )
+
+    assert resp["task-id"] == "task"
+    assert json.loads(responses.calls[0].request.body) == {
+        "from-date": "2017-02-01T08:20:50",
+        "to-session": "session-uid",
+        "limit": 10,
+    }
+
+
+@responses.activate
+def test_get_changes(management):
+    operations = {"added-objects": [{"uid": "h1", "type": "host"}]}
+    add_tasks(["in progress", "in progress", "succeeded"], [{"operations": operations}])
+
+    changes = management.misc.changes.get_changes(from_session="s1", interval=0)
+
+    assert [c.operations["added-objects"][0].uid for c in changes] == ["h1"]
+    requests = [json.loads(c.request.body) for c in responses.calls]
+    assert requests[1:] == [{"task-id": "task", "details-level": "full"}] * 3
+
+
+@responses.activate
+def test_get_changes_pages(management):
+    changes = [{"operations": {"added-objects": [{"uid": str(i)}]}} for i in range(5)]
+    offsets = []
+
+    def show_changes(request):
+        payload = json.loads(request.body)
+        offsets.append(payload["offset"])
+        offset, limit = payload["offset"], payload["limit"]
+        details.update(
+            {
+                "to": min(offset + limit, len(changes)),
+                "total": len(changes),
+                "changes": changes[offset : offset + limit],
+            }
+        )
+        return (200, {}, json.dumps({"task-id": "task"}))
+
+    def show_task(request):
+        task = {"task-id": "task", "status": "succeeded", "task-details": [details]}
+        return (200, {}, json.dumps({"tasks": [task]}))
+
+    details = {}
+    for command, callback in [("show-changes", show_changes), ("show-task", show_task)]:
+        responses.add_callback(
+            responses.POST,
+            url="https://127.0.0.1:443/web_api/v1.5/" + command,
+            callback=callback,
+            content_type="application/json",
+        )
+
+    result = management.misc.changes.get_changes(from_session="s1", limit=2)
+
+    assert [c.operations["added-objects"][0].uid for c in result] == [
+        "0",
+        "1",
+        "2",
+        "3",
+        "4",
+    ]
+    assert offsets == [0, 2, 4]
+
+
+@responses.activate
+def test_get_changes_failed(management):
+    add_tasks(["failed"], [])
+
+    with pytest.raises(RuntimeError):
+        management.misc.changes.get_changes(from_session="s1")
+
+
+@responses.activate
+def test_wait_timeout(management):
+    add_tasks(["in progress"] * 3, [])
+
+    with pytest.raises(TimeoutError):
+        management.misc.task.wait("task", timeout=0)
@@ -13,3 +13,26 @@ def test_get_rulebaseactions(management, resp_from_to_objects):
     resp = management.misc.generic_objects.get_rulebaseactions()
 
     assert isinstance(resp.total, int)
+
+
+@responses.activate
+def test_show_all_rulebaseactions(management, paged_response):
+    responses.add_callback(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/show-generic-objects",
+        callback=paged_response("objects", total=7),
+        content_type="application/json",
+    )
+
+    resp = management.misc.generic_objects.get_rulebaseactions(
+        show_all=True, limit=3, max_workers=2
+    )
+
+    assert resp.to == 7
+    assert [o.uid for o in resp["objects"]] == [str(i) for i in range(7)]
+    assert len(responses.calls) == 3
+
+    assert [
+        o.uid for o in management.misc.generic_objects.iter_rulebaseactions(limit=5)
+    ] == [str(i) for i in range(7)]
+    assert len(responses.calls) == 5
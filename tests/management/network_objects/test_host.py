@@ -1,7 +1,11 @@
+import json
+
 import pytest
 import responses
 
+from pycheckpoint_api.lazy_view import LazyView
 from pycheckpoint_api.management.exception import MandatoryFieldMissing
+from pycheckpoint_api.records import HostRecord
 
 
 @responses.activate
@@ -203,3 +207,277 @@ def test_show_hosts(management, resp_from_to_objects):
     )
 
     assert isinstance(resp.total, int)
+
+
+def paged_hosts(request):
+    payload = json.loads(request.body)
+    offset, limit = payload["offset"], payload["limit"]
+    objects = [
+        {"uid": str(i), "name": "host_" + str(i)}
+        for i in range(offset, min(offset + limit, 7))
+    ]
+    return (200, {}, json.dumps({"from": offset + 1, "total": 7, "objects": objects}))
+
+
+@responses.activate
+def test_show_hosts_concurrently(management):
+    responses.add_callback(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/show-hosts",
+        callback=paged_hosts,
+        content_type="application/json",
+    )
+
+    resp = management.network_objects.host.show_hosts(
+        show_all=True, limit=2, max_workers=4
+    )
+
+    assert resp.total == 7
+    assert resp.to == 7
+    assert [o.uid for o in resp.objects] == [str(i) for i in range(7)]
+    assert len(responses.calls) == 4
+
+
+@responses.activate
+def test_iter_hosts(management):
+    responses.add_callback(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/show-hosts",
+        callback=paged_hosts,
+        content_type="application/json",
+    )
+
+    hosts = management.network_objects.host.iter_hosts(limit=3)
+
+    # Nothing is requested until the first object is consumed
+    assert len(responses.calls) == 0
+    assert next(hosts).uid == "0"
+    assert len(responses.calls) == 1
+
+    assert [o.uid for o in hosts] == [str(i) for i in range(1, 7)]
+    assert len(responses.calls) == 3
+
+
+def add_host_or_fail(request):
+    payload = json.loads(request.body)
+    if payload["name"] == "duplicate":
+        return (
+            400,
+            {},
+            json.dumps({"code": "err_validation_failed", "message": "Duplicate"}),
+        )
+    return (200, {}, json.dumps({"uid": "uid-" + payload["name"], **payload}))
+
+
+@responses.activate
+def test_bulk_add_hosts(management, resp_message_ok):
+    responses.add_callback(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/add-host",
+        callback=add_host_or_fail,
+        content_type="application/json",
+    )
+    responses.add(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/publish",
+        json=resp_message_ok,
+        status=200,
+    )
+
+    payloads = [{"name": f"host{i}", "ip_address": f"10.0.0.{i}"} for i in range(1, 6)]
+    payloads.insert(2, {"name": "duplicate", "ip_address": "10.0.0.1"})
+
+    resp = management.network_objects.host.bulk_add(
+        payloads, max_workers=3, publish_every=2
+    )
+
+    assert resp.succeeded == 5
+    assert resp.failed == 1
+    assert [r.index for r in resp.results] == list(range(0, 6))
+    assert resp.results[0].response.uid == "uid-host1"
+    assert resp.results[2].response is None
+    assert resp.results[2].error is not None
+
+    # 5 changes published every 2 changes, then the remaining one
+    publish_calls = [c for c in responses.calls if c.request.url.endswith("publish")]
+    assert len(publish_calls) == 3
+
+
+@responses.activate
+def test_bulk_add_hosts_publish_failure(management, resp_message_ok):
+    responses.add_callback(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/add-host",
+        callback=add_host_or_fail,
+        content_type="application/json",
+    )
+    publishes = []
+
+    def publish(request):
+        publishes.append(len(responses.calls))
+        if len(publishes) == 1:
+            return (500, {}, json.dumps({"code": "generic_error"}))
+        return (200, {}, json.dumps(resp_message_ok))
+
+    responses.add_callback(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/publish",
+        callback=publish,
+        content_type="application/json",
+    )
+
+    payloads = [{"name": f"host{i}", "ip_address": f"10.0.0.{i}"} for i in range(1, 6)]
+    resp = management.network_objects.host.bulk_add(
+        payloads, max_workers=2, publish_every=2
+    )
+
+    # Every result is kept, the failed publish is reported
+    assert resp.succeeded == 5
+    assert [r.index for r in resp.results] == list(range(0, 5))
+    assert [e.index for e in resp.publish_errors] == [1]
+    assert resp.publish_errors[0].error is not None
+    assert len(publishes) == 3
+
+    # Each publish is sent once the requests of its group are done
+    urls = [c.request.url.rsplit("/", 1)[1] for c in responses.calls]
+    assert urls == ["add-host", "add-host", "publish"] * 2 + ["add-host", "publish"]
+
+
+@responses.activate
+def test_bulk_set_and_delete_hosts(management, resp_host_ipv4, resp_message_ok):
+    responses.add(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/set-host",
+        json=resp_host_ipv4,
+        status=200,
+    )
+    responses.add(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/delete-host",
+        json=resp_message_ok,
+        status=200,
+    )
+
+    resp = management.network_objects.host.bulk_set(
+        [{"name": "host1", "comments": "a"}, {"uid": "uid2", "comments": "b"}]
+    )
+
+    assert resp.succeeded == 2
+    assert resp.results[1].response.name == "New Host 4"
+
+    resp = management.network_objects.host.bulk_delete(
+        [{"name": "host1"}, {}], max_workers=2
+    )
+
+    assert resp.succeeded == 1
+    assert isinstance(resp.results[1].error, MandatoryFieldMissing)
+    assert not any(c.request.url.endswith("publish") for c in responses.calls)
+
+
+@responses.activate
+def test_show_hosts_adaptive(management):
+    responses.add_callback(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/show-hosts",
+        callback=paged_hosts,
+        content_type="application/json",
+    )
+
+    resp = management.network_objects.host.show_hosts(
+        show_all=True, limit=2, adaptive=True
+    )
+
+    assert resp.to == 7
+    assert [o.uid for o in resp.objects] == [str(i) for i in range(7)]
+    assert [json.loads(c.request.body)["limit"] for c in responses.calls] == [2, 4, 8]
+
+
+@responses.activate
+def test_show_hosts_raw(management, resp_host_ipv4):
+    responses.add_callback(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/show-hosts",
+        callback=paged_hosts,
+        content_type="application/json",
+    )
+    responses.add(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/show-host",
+        json=resp_host_ipv4,
+        status=200,
+    )
+
+    resp = management.network_objects.host.show(name="New Host 4", raw=True)
+
+    assert type(resp) is dict
+    assert resp["ipv4-address"] == "192.0.2.1"
+
+    resp = management.network_objects.host.show_hosts(
+        show_all=True, limit=2, max_workers=2, raw=True
+    )
+
+    assert type(resp) is dict
+    assert resp["to"] == 7
+    assert [type(o) for o in resp["objects"]] == [dict] * 7
+
+    hosts = list(management.network_objects.host.iter_hosts(limit=3, raw=True))
+
+    assert [o["uid"] for o in hosts] == [str(i) for i in range(7)]
+    assert type(hosts[0]) is dict
+
+
+@responses.activate
+def test_show_hosts_lazy(management):
+    responses.add_callback(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/show-hosts",
+        callback=paged_hosts,
+        content_type="application/json",
+    )
+
+    resp = management.network_objects.host.show_hosts(
+        show_all=True, limit=2, max_workers=2, lazy=True
+    )
+
+    assert isinstance(resp, LazyView)
+    assert resp.to == 7
+    assert [o.name for o in resp.objects] == ["host_" + str(i) for i in range(7)]
+
+    hosts = list(management.network_objects.host.iter_hosts(limit=3, lazy=True))
+
+    assert isinstance(hosts[0], LazyView)
+    assert hosts[6].uid == "6"
+
+
+@responses.activate
+def test_show_hosts_record(management, resp_host_ipv4):
+    responses.add_callback(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/show-hosts",
+        callback=paged_hosts,
+        content_type="application/json",
+    )
+    responses.add(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/show-host",
+        json=resp_host_ipv4,
+        status=200,
+    )
+
+    resp = management.network_objects.host.show(name="New Host 4", record=True)
+
+    assert isinstance(resp, HostRecord)
+    assert resp.ipv4_address == "192.0.2.1"
+    assert resp.tags == ("t1", "t2", "t3")
+    assert resp.meta_info.last_modify_time == 1429440561055
+
+    resp = management.network_objects.host.show_hosts(
+        show_all=True, limit=2, max_workers=2, record=True
+    )
+
+    assert resp["to"] == 7
+    assert [type(o) for o in resp["objects"]] == [HostRecord] * 7
+
+    hosts = list(management.network_objects.host.iter_hosts(limit=3, record=True))
+
+    assert [o.name for o in hosts] == ["host_" + str(i) for i in range(7)]
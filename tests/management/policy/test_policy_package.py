@@ -134,3 +134,26 @@ def test_show_packages(management, resp_from_to_objects):
     )
 
     assert isinstance(resp.total, int)
+
+
+@responses.activate
+def test_show_all_packages(management, paged_response):
+    responses.add_callback(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/show-packages",
+        callback=paged_response("packages", total=7),
+        content_type="application/json",
+    )
+
+    resp = management.policy.package.show_packages(
+        show_all=True, limit=3, max_workers=2
+    )
+
+    assert resp.to == 7
+    assert [o.uid for o in resp["packages"]] == [str(i) for i in range(7)]
+    assert len(responses.calls) == 3
+
+    assert [o.uid for o in management.policy.package.iter_packages(limit=5)] == [
+        str(i) for i in range(7)
+    ]
+    assert len(responses.calls) == 5
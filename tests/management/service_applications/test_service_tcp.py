@@ -127,3 +127,17 @@ def test_show_services_tcp(management, resp_from_to_objects):
     resp = management.service_applications.service_tcp.show_services_tcp()
 
     assert isinstance(resp.total, int)
+
+
+@responses.activate
+def test_iter_services_tcp(management, resp_from_to_objects):
+    responses.add(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/show-services-tcp",
+        json=resp_from_to_objects,
+        status=200,
+    )
+
+    services = list(management.service_applications.service_tcp.iter_services_tcp())
+
+    assert services == resp_from_to_objects["objects"]
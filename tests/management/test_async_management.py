@@ -0,0 +1,105 @@
+import asyncio
+import threading
+
+import pytest
+import requests
+import responses
+
+from pycheckpoint_api.management.async_management import (
+    ThreadPoolManagement,
+    _WorkerSessions,
+)
+
+
+@responses.activate
+def test_async_management(session, resp_message_ok, resp_from_to_objects, resp_session):
+    responses.add(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/login",
+        json=session,
+        status=200,
+    )
+    responses.add(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/show-hosts",
+        json=resp_from_to_objects,
+        status=200,
+    )
+    responses.add(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/show-session",
+        json=resp_session,
+        status=200,
+    )
+    responses.add(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/logout",
+        json=resp_message_ok,
+        status=200,
+    )
+
+    async def run():
+        async with ThreadPoolManagement(
+            user="test@example.com",
+            password="false_strong_password",
+            hostname="127.0.0.1",
+            port=443,
+            version="1.5",
+            max_workers=4,
+        ) as firewall:
+            pages = await asyncio.gather(
+                *[
+                    firewall.network_objects.host.show_hosts(offset=offset)
+                    for offset in range(0, 10)
+                ]
+            )
+            current = await firewall.session.show_session()
+            hosts = [h async for h in firewall.network_objects.host.iter_hosts()]
+        return pages, current, hosts
+
+    pages, current, hosts = asyncio.run(run())
+
+    assert len(pages) == 10
+    assert all(page.total == 7 for page in pages)
+    assert current.uid == "7a13a360-9b24-40d7-acd3-5b50247be33e"
+    assert hosts == resp_from_to_objects["objects"]
+    assert responses.calls[-1].request.url.endswith("/logout")
+
+
+def test_async_management_not_logged_in():
+    firewall = ThreadPoolManagement(hostname="127.0.0.1", port=443, version="1.5")
+
+    with pytest.raises(RuntimeError):
+        firewall.network_objects
+
+
+def test_worker_sessions():
+    template = requests.Session()
+    template.headers.update({"X-chkp-sid": "sid"})
+    template.verify = False
+    sessions = _WorkerSessions(template)
+
+    current = sessions.current()
+    assert sessions.current() is current
+    assert current is not template
+    assert current.headers["X-chkp-sid"] == "sid"
+    assert sessions.verify is False
+
+    # Each thread has its own session
+    other = []
+    thread = threading.Thread(target=lambda: other.append(sessions.current()))
+    thread.start()
+    thread.join()
+    assert other[0] is not current
+    assert other[0].headers["X-chkp-sid"] == "sid"
+
+    # Header and setting changes reach every worker
+    del current.headers["X-chkp-sid"]
+    assert "X-chkp-sid" not in other[0].headers
+    sessions.headers.update({"X-chkp-sid": "new-sid"})
+    assert other[0].headers["X-chkp-sid"] == "new-sid"
+    sessions.verify = True
+    assert other[0].verify is True and current.verify is True
+
+    sessions.close()
+    assert sessions._sessions == []
@@ -0,0 +1,254 @@
+import json
+import time
+
+import responses
+
+from pycheckpoint_api.management import Management
+from pycheckpoint_api.management.cache import ObjectCache, PublishValidator
+
+
+def cached_management(session, **kw):
+    responses.add(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/login",
+        json=session,
+        status=200,
+    )
+    return Management(
+        user="test@example.com",
+        password="false_strong_password",
+        hostname="127.0.0.1",
+        port=443,
+        version="1.5",
+        **kw,
+    )
+
+
+def calls_to(command: str) -> int:
+    return len([c for c in responses.calls if c.request.url.endswith("/" + command)])
+
+
+@responses.activate
+def test_cache_disabled(management):
+    assert management.cache is None
+
+
+@responses.activate
+def test_cache_show(session, resp_message_ok):
+    host = {"uid": "host-uid", "name": "host1", "ipv4-address": "10.0.0.1"}
+    responses.add(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/show-host",
+        json=host,
+        status=200,
+    )
+    responses.add(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/set-host",
+        json=host,
+        status=200,
+    )
+    responses.add(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/publish",
+        json=resp_message_ok,
+        status=200,
+    )
+    firewall = cached_management(session, cache_ttl=60)
+
+    # Served by name and by uid from the first lookup
+    resp = firewall.network_objects.host.show(name="host1")
+    assert resp.ipv4_address == "10.0.0.1"
+    resp.ipv4_address = "10.0.0.2"
+    assert firewall.network_objects.host.show(name="host1").ipv4_address == "10.0.0.1"
+    firewall.network_objects.host.show(uid="host-uid")
+    assert calls_to("show-host") == 1
+    assert firewall.cache.hits == 2
+
+    # Another details level is another entry
+    firewall.network_objects.host.show(name="host1", details_level="full")
+    assert calls_to("show-host") == 2
+
+    # A change on the object invalidates it
+    firewall.network_objects.host.set(name="host1", comments="updated")
+    firewall.network_objects.host.show(name="host1")
+    assert calls_to("show-host") == 3
+
+    # Publishing clears the cache
+    firewall.session.publish()
+    assert len(firewall.cache) == 0
+    firewall.network_objects.host.show(uid="host-uid")
+    assert calls_to("show-host") == 4
+
+
+@responses.activate
+def test_cache_invalidate_groups(session):
+    group = {"uid": "group-uid", "name": "group1", "members": []}
+    responses.add(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/show-group",
+        json=group,
+        status=200,
+    )
+    responses.add(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/add-host",
+        json={"uid": "host-uid", "name": "host1"},
+        status=200,
+    )
+    firewall = cached_management(session, cache_ttl=60)
+
+    firewall.network_objects.group.show(name="group1")
+    firewall.network_objects.group.show(name="group1")
+    assert calls_to("show-group") == 1
+
+    # The new host is a member of the group: the cached group is outdated
+    firewall.network_objects.host.add(
+        name="host1", ip_address="10.0.0.1", groups="group1"
+    )
+    firewall.network_objects.group.show(name="group1")
+    assert calls_to("show-group") == 2
+
+
+def test_object_cache_invalidate_generic_object():
+    cache = ObjectCache(ttl=60)
+    cache.store("show-generic-object", {"uid": "host-uid"}, {"uid": "host-uid"})
+    cache.store("show-host", {"uid": "host-uid"}, {"uid": "host-uid", "name": "host1"})
+
+    # Changed by name: the uid is known from the cached host
+    cache.invalidate("set-host", {"name": "host1", "color": "red"})
+    assert len(cache) == 0
+
+    cache.store("show-generic-object", {"uid": "host-uid"}, {"uid": "host-uid"})
+    assert cache.lookup("show-generic-object", {"uid": "host-uid"}) is not None
+    cache.invalidate("delete-host", {"uid": "host-uid"})
+    assert cache.lookup("show-generic-object", {"uid": "host-uid"}) is None
+
+    # Only the targeted object is invalidated
+    cache.store("show-generic-object", {"uid": "other"}, {"uid": "other"})
+    cache.invalidate("set-host", {"uid": "host-uid", "color": "red"})
+    assert len(cache) == 1
+
+
+def test_object_cache_invalidate_references():
+    cache = ObjectCache(ttl=60)
+    host = {"uid": "host-uid", "name": "host1"}
+    cache.store("show-host", {"uid": "host-uid"}, host)
+    cache.store(
+        "show-group",
+        {"name": "group1"},
+        {"uid": "g1", "name": "group1", "members": [host]},
+    )
+    cache.store(
+        "show-group", {"name": "group2"}, {"uid": "g2", "members": ["host-uid"]}
+    )
+    cache.store("show-group", {"name": "group3"}, {"uid": "g3", "members": []})
+
+    # The groups of a deleted host are outdated, whatever their details level
+    cache.invalidate("delete-host", {"name": "host1"})
+    assert len(cache) == 1
+    assert cache.lookup("show-group", {"uid": "g3"}) is not None
+
+    # A change only invalidates the object
+    cache.store(
+        "show-group",
+        {"name": "group1"},
+        {"uid": "g1", "name": "group1", "members": [host]},
+    )
+    cache.invalidate("set-host", {"uid": "host-uid", "color": "red"})
+    assert len(cache) == 2
+
+
+def test_object_cache_expiration_and_eviction():
+    cache = ObjectCache(ttl=60, max_size=2)
+    for i in range(3):
+        cache.store(
+            "show-host", {"name": f"host{i}"}, {"uid": f"uid{i}", "name": f"host{i}"}
+        )
+
+    assert len(cache) == 2
+    assert cache.lookup("show-host", {"name": "host0"}) is None
+    assert cache.lookup("show-host", {"uid": "uid2"})["name"] == "host2"
+
+    # Requests with other parameters are not cacheable
+    assert cache.lookup("show-host", {"name": "host2", "show-as-ranges": True}) is None
+    assert cache.lookup("show-session", {"uid": "uid2"}) is None
+
+    cache.ttl = 0
+    cache.store("show-host", {"name": "host3"}, {"uid": "uid3", "name": "host3"})
+    time.sleep(0.01)
+    assert cache.lookup("show-host", {"name": "host3"}) is None
+
+
+@responses.activate
+def test_cache_raw(session):
+    responses.add(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/show-host",
+        json={"uid": "host-uid", "name": "host1", "ipv4-address": "10.0.0.1"},
+        status=200,
+    )
+    firewall = cached_management(session, cache_ttl=60, raw=True)
+
+    resp = firewall.network_objects.host.show(name="host1")
+    assert type(resp) is dict
+
+    # The cached entry is returned in the format asked by each call
+    resp = firewall.network_objects.host.show(name="host1", raw=False)
+    assert resp.ipv4_address == "10.0.0.1"
+    assert type(firewall.network_objects.host.show(uid="host-uid")) is dict
+    assert calls_to("show-host") == 1
+
+
+@responses.activate
+def test_cache_validation(session):
+    published = {"uid": "session1", "publish-time": {"posix": 1}}
+    responses.add(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/show-host",
+        json={"uid": "host-uid", "name": "host1"},
+        status=200,
+    )
+    responses.add_callback(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/show-last-published-session",
+        callback=lambda request: (200, {}, json.dumps(published)),
+        content_type="application/json",
+    )
+    firewall = cached_management(session, cache_validation=0)
+    assert firewall.cache.ttl == float("inf")
+
+    # Each lookup is validated with a single request
+    for _ in range(3):
+        firewall.network_objects.host.show(name="host1")
+    assert calls_to("show-host") == 1
+    assert calls_to("show-last-published-session") == 3
+
+    # Another client published a session: the cache is dropped
+    published = {"uid": "session2", "publish-time": {"posix": 2}}
+    firewall.network_objects.host.show(name="host1")
+    assert calls_to("show-host") == 2
+    firewall.network_objects.host.show(name="host1")
+    assert calls_to("show-host") == 2
+
+
+def test_publish_validator():
+    sessions = [{"uid": "session1", "publish-time": {"posix": 1}}]
+    validator = PublishValidator(lambda: sessions[-1], interval=60)
+
+    assert validator.validate() is True
+    sessions.append({"uid": "session2", "publish-time": {"posix": 2}})
+
+    # Not checked again before the interval
+    assert validator.validate() is True
+    assert validator.checks == 1
+
+    validator.interval = 0
+    assert validator.validate() is False
+    assert validator.validate() is True
+
+    # After a publish from this client, the current session is only recorded
+    validator.reset()
+    sessions.append({"uid": "session3", "publish-time": {"posix": 3}})
+    assert validator.validate() is True
+    assert validator.marker == ("session3", 3)
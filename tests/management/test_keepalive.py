@@ -0,0 +1,79 @@
+import time
+
+import responses
+
+from pycheckpoint_api.management import Management
+from pycheckpoint_api.management.keepalive import KeepaliveScheduler
+
+
+def test_keepalive_scheduler():
+    calls = []
+    scheduler = KeepaliveScheduler(lambda: calls.append(time.monotonic()), timeout=0.2)
+
+    assert scheduler.margin == 0.1
+
+    # An active session is not disturbed
+    scheduler.start()
+    for _ in range(5):
+        time.sleep(0.04)
+        scheduler.touch()
+    assert len(calls) == 0
+
+    # An idle session is refreshed
+    time.sleep(0.25)
+    scheduler.stop()
+    assert len(calls) >= 1
+    assert not scheduler.running
+
+
+def test_keepalive_scheduler_retry():
+    calls = []
+
+    def keepalive():
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            raise ConnectionError("unreachable")
+
+    scheduler = KeepaliveScheduler(keepalive, timeout=0.4, margin=0.2, retry=1)
+    assert scheduler.retry == 0.1
+
+    # A failed keepalive is sent again after the retry delay, not after the margin
+    scheduler.start()
+    time.sleep(0.35)
+    scheduler.stop()
+    assert len(calls) == 2
+    assert calls[1] - calls[0] < 0.2
+
+
+@responses.activate
+def test_management_keepalive(session, resp_message_ok):
+    responses.add(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/login",
+        json={**session, "session-timeout": 1},
+        status=200,
+    )
+    for command in ["keepalive", "logout"]:
+        responses.add(
+            responses.POST,
+            url=f"https://127.0.0.1:443/web_api/v1.5/{command}",
+            json=resp_message_ok,
+            status=200,
+        )
+
+    with Management(
+        user="test@example.com",
+        password="false_strong_password",
+        hostname="127.0.0.1",
+        port=443,
+        version="1.5",
+        keepalive=True,
+    ) as firewall:
+        scheduler = firewall._keepalive_scheduler
+        assert scheduler.running
+        time.sleep(0.7)
+
+    assert not scheduler.running
+    assert firewall._keepalive_scheduler is None
+    keepalives = [c for c in responses.calls if c.request.url.endswith("keepalive")]
+    assert len(keepalives) == 1
@@ -0,0 +1,86 @@
+import pytest
+from requests.exceptions import ReadTimeout
+
+from pycheckpoint_api.management.abstract.paginator import Paginator
+
+
+def build_fetch(total: int, calls: list, timeout_above: int = None):
+    def fetch(offset: int, limit: int) -> dict:
+        calls.append((offset, limit))
+        if timeout_above is not None and limit > timeout_above:
+            raise ReadTimeout()
+        objects = [{"uid": str(i)} for i in range(offset, min(offset + limit, total))]
+        return {"from": offset + 1, "total": total, "objects": objects}
+
+    return fetch
+
+
+def test_paginator_limit():
+    assert Paginator(build_fetch(10, []), limit=1000).limit == 500
+    assert Paginator(build_fetch(10, []), limit=50, max_limit=20).limit == 20
+
+
+def test_paginator_adaptive():
+    calls = []
+    paginator = Paginator(build_fetch(100, calls), limit=5, adaptive=True)
+
+    resp = paginator.all(max_workers=4)
+
+    assert [o["uid"] for o in resp["objects"]] == [str(i) for i in range(100)]
+    assert resp["to"] == 100
+    # Quick pages: the page size is doubled each time
+    assert calls == [(0, 5), (5, 10), (15, 20), (35, 40), (75, 80)]
+
+    calls.clear()
+    paginator = Paginator(build_fetch(100, calls), limit=5, adaptive=True)
+    assert [o["uid"] for o in paginator.items()] == [str(i) for i in range(100)]
+
+
+def test_paginator_adaptive_backoff():
+    calls = []
+    paginator = Paginator(
+        build_fetch(30, calls, timeout_above=8), limit=20, adaptive=True
+    )
+
+    resp = paginator.all()
+
+    assert len(resp["objects"]) == 30
+    assert calls[:3] == [(0, 20), (0, 10), (0, 5)]
+    assert max(limit for _, limit in calls[3:]) <= 16
+
+    # A single result per page still times out
+    paginator = Paginator(build_fetch(30, [], timeout_above=0), limit=4, adaptive=True)
+    with pytest.raises(ReadTimeout):
+        paginator.all()
+
+
+def test_paginator_adapt():
+    paginator = Paginator(build_fetch(0, []), limit=100, adaptive=True, max_limit=20)
+    assert paginator.limit == 20
+
+    paginator = Paginator(build_fetch(0, []), limit=100, adaptive=True, target_time=2)
+
+    # Heavy objects: 100 results in 8s, 25 results should take 2s
+    paginator._adapt(8.0, 100)
+    assert paginator.limit == 25
+
+    # Light objects: at most doubled, up to the server limit
+    for _ in range(10):
+        paginator._adapt(0.01, paginator.limit)
+    assert paginator.limit == 500
+
+    # Large objects quickly returned: 500 results of 40 KiB, 100 results fit in 4 MiB
+    paginator._adapt(0.01, 500, 500 * 40 * 1024)
+    assert paginator.limit == 102
+
+
+def test_paginator_adaptive_size():
+    calls = []
+    paginator = Paginator(
+        build_fetch(100, calls), limit=5, adaptive=True, target_size=200
+    )
+
+    assert len(paginator.all()["objects"]) == 100
+    # 5 results of {"uid":"n"} take about 60 bytes: the pages stay below 200 bytes
+    assert max(limit for _, limit in calls) <= 20
+    assert paginator._size({"objects": [{"uid": "1"}]}) == len('[{"uid":"1"}]')
@@ -364,6 +364,11 @@ def test_show_last_published_session(management, resp_session):
 
     assert resp.uid == "7a13a360-9b24-40d7-acd3-5b50247be33e"
 
+    resp = management.session.show_last_published_session(raw=True)
+
+    assert type(resp) is dict
+    assert resp["uid"] == "7a13a360-9b24-40d7-acd3-5b50247be33e"
+
 
 @responses.activate
 def test_show_login_message(management, resp_login_message):
@@ -435,3 +440,24 @@ def test_show_automatic_purge(management, resp_automatic_purge):
 
     assert resp.enabled is True
     assert resp.number_of_sessions_to_keep == "10"
+
+
+@responses.activate
+def test_show_all_sessions(management, paged_response):
+    responses.add_callback(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/show-sessions",
+        callback=paged_response("objects", total=7),
+        content_type="application/json",
+    )
+
+    resp = management.session.show_sessions(show_all=True, limit=3, max_workers=2)
+
+    assert resp.to == 7
+    assert [o.uid for o in resp["objects"]] == [str(i) for i in range(7)]
+    assert len(responses.calls) == 3
+
+    assert [o.uid for o in management.session.iter_sessions(limit=5)] == [
+        str(i) for i in range(7)
+    ]
+    assert len(responses.calls) == 5
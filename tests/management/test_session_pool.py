@@ -0,0 +1,116 @@
+import itertools
+import json
+
+import pytest
+import responses
+
+from pycheckpoint_api.management.session_pool import SessionPool
+from pycheckpoint_api.management.session_store import SessionStore
+
+
+@pytest.fixture(name="pool")
+def fixture_pool(session, resp_message_ok):
+    sids = itertools.count()
+
+    def login(request):
+        return (200, {}, json.dumps({**session, "sid": f"sid{next(sids)}"}))
+
+    def add_host(request):
+        payload = json.loads(request.body)
+        if payload["name"] == "duplicate":
+            return (400, {}, json.dumps({"code": "err_validation_failed"}))
+        return (200, {}, json.dumps({"uid": "uid-" + payload["name"], **payload}))
+
+    responses.add_callback(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/login",
+        callback=login,
+        content_type="application/json",
+    )
+    responses.add_callback(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/add-host",
+        callback=add_host,
+        content_type="application/json",
+    )
+    for command in ["publish", "logout"]:
+        responses.add(
+            responses.POST,
+            url=f"https://127.0.0.1:443/web_api/v1.5/{command}",
+            json=resp_message_ok,
+            status=200,
+        )
+
+    return SessionPool(
+        size=3,
+        user="test@example.com",
+        password="false_strong_password",
+        hostname="127.0.0.1",
+        port=443,
+        version="1.5",
+    )
+
+
+@responses.activate
+def test_session_pool(pool):
+    hosts = [{"name": f"host{i}", "ip_address": f"10.0.0.{i}"} for i in range(1, 11)]
+    hosts.insert(4, {"name": "duplicate", "ip_address": "10.0.0.1"})
+
+    with pool:
+        assert len(pool) == 3
+        sids = [m._session.headers["X-chkp-sid"] for m in pool.sessions]
+        assert sorted(sids) == ["sid0", "sid1", "sid2"]
+
+        resp = pool.run(
+            lambda firewall, host: firewall.network_objects.host.add(**host), hosts
+        )
+        pool.publish()
+
+    assert len(pool) == 0
+    assert resp.succeeded == 10
+    assert resp.failed == 1
+    assert [r.index for r in resp.results] == list(range(0, 11))
+    assert resp.results[0].response.uid == "uid-host1"
+    assert resp.results[4].error is not None
+
+    # The changes were made with the sessions of the pool, then published in order
+    calls = [c.request for c in responses.calls]
+    add_sids = {r.headers["X-chkp-sid"] for r in calls if r.url.endswith("add-host")}
+    assert add_sids <= set(sids)
+    publish_sids = [r.headers["X-chkp-sid"] for r in calls if r.url.endswith("publish")]
+    assert publish_sids == sids
+    assert len([r for r in calls if r.url.endswith("logout")]) == 3
+
+
+@responses.activate
+def test_session_pool_store(tmp_path, pool, resp_session):
+    responses.add(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/show-session",
+        json=resp_session,
+        status=200,
+    )
+    path = str(tmp_path / "sessions.json")
+    pool = SessionPool(size=3, session_store=path, **pool._kw)
+
+    with pool:
+        sids = [m._session.headers["X-chkp-sid"] for m in pool.sessions]
+
+    # Each session of the pool is stored in its own slot
+    store = SessionStore(path)
+    key = SessionStore.key("127.0.0.1", 443, user="test@example.com")
+    assert [store.get(f"{key}#{slot}").sid for slot in range(3)] == sids
+    assert len(store._read()) == 3
+
+    # The next pool resumes one distinct session per client
+    with pool:
+        assert [m._session.headers["X-chkp-sid"] for m in pool.sessions] == sids
+
+    calls = [c.request.url for c in responses.calls]
+    assert len([u for u in calls if u.endswith("/login")]) == 3
+    assert len([u for u in calls if u.endswith("/logout")]) == 0
+
+
+def test_session_pool_not_opened():
+    with pytest.raises(RuntimeError):
+        SessionPool(size=2).run(lambda firewall, item: item, [1, 2])
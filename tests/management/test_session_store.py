@@ -0,0 +1,97 @@
+import os
+import stat
+import time
+
+import responses
+
+from pycheckpoint_api.management import Management
+from pycheckpoint_api.management.session_store import SessionStore
+
+
+def open_management(path: str) -> Management:
+    return Management(
+        user="test@example.com",
+        password="false_strong_password",
+        hostname="127.0.0.1",
+        port=443,
+        version="1.5",
+        domain="MyDomain",
+        session_store=path,
+    )
+
+
+def calls_to(command: str) -> int:
+    return len([c for c in responses.calls if c.request.url.endswith("/" + command)])
+
+
+@responses.activate
+def test_session_store_reuse(tmp_path, session, resp_session):
+    path = str(tmp_path / "store" / "sessions.json")
+    responses.add(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/login",
+        json=session,
+        status=200,
+    )
+    show_session = responses.add(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/show-session",
+        json=resp_session,
+        status=200,
+    )
+
+    # First run: login, and the session is kept on exit
+    with open_management(path):
+        pass
+
+    assert calls_to("login") == 1
+    assert calls_to("logout") == 0
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    assert "false_strong_password" not in open(path).read()
+
+    # Second run: the stored session is still valid
+    with open_management(path) as firewall:
+        assert (
+            firewall._session.headers["X-chkp-sid"]
+            == "97BVpRfN4j81ogN-V2XqGYmw3DDwIhoSn0og8PiKDiM"
+        )
+
+    assert calls_to("login") == 1
+    assert calls_to("show-session") == 1
+
+    # Third run: the session has expired on the server
+    responses.remove(show_session)
+    responses.add(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/show-session",
+        json={"code": "generic_err_wrong_session_id"},
+        status=403,
+    )
+    with open_management(path):
+        pass
+
+    assert calls_to("login") == 2
+
+
+def test_session_store(tmp_path):
+    store = SessionStore(str(tmp_path / "sessions.json"))
+    key = SessionStore.key("127.0.0.1", 443, "MyDomain", "admin")
+
+    assert key == "admin@127.0.0.1:443/MyDomain"
+    assert SessionStore.key("127.0.0.1", 443, api_key="secret") != key
+    assert "secret" not in SessionStore.key("127.0.0.1", 443, api_key="secret")
+    assert SessionStore.key("127.0.0.1", 443, "MyDomain", "admin", slot=1) == (
+        key + "#1"
+    )
+    assert store.get(key) is None
+
+    store.save(key, {"sid": "sid1", "uid": "uid1", "session-timeout": 600})
+    assert store.get(key).sid == "sid1"
+
+    # An entry idle for longer than its timeout is ignored
+    store.save(key, {"sid": "sid1", "uid": "uid1", "session-timeout": 0})
+    time.sleep(0.01)
+    assert store.get(key) is None
+
+    store.remove(key)
+    assert store._read() == {}
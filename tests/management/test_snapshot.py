@@ -0,0 +1,386 @@
+import json
+
+import pytest
+import responses
+
+from pycheckpoint_api.snapshot import (
+    LAST_PUBLISHED_SESSION,
+    Snapshot,
+    address_key,
+    object_ranges,
+)
+
+HOSTS = [
+    {
+        "uid": "h1",
+        "name": "host1",
+        "type": "host",
+        "ipv4-address": "192.0.2.1",
+        "tags": [{"uid": "t1", "name": "production"}],
+        "meta-info": {"last-modify-time": {"posix": 1655210413215}},
+    },
+    {"uid": "h2", "name": "host2", "type": "host", "ipv6-address": "2001:db8::1"},
+]
+
+NETWORKS = [
+    {
+        "uid": "n1",
+        "name": "net1",
+        "type": "network",
+        "subnet4": "192.0.2.0",
+        "mask-length4": 24,
+        "tags": ["production"],
+    }
+]
+
+
+def test_address_key():
+    assert address_key("192.0.2.1") == "00000000000000000000ffffc0000201"
+    assert address_key("192.0.2.1") < address_key("192.0.2.10")
+    assert address_key("255.255.255.255") < address_key("2001:db8::1")
+    assert object_ranges(NETWORKS[0]) == [("192.0.2.0", "192.0.2.255")]
+    assert object_ranges(
+        {"ipv4-address-first": "192.0.2.1", "ipv4-address-last": "192.0.2.9"}
+    ) == [("192.0.2.1", "192.0.2.9")]
+    assert object_ranges({"uid": "g1", "members": []}) == []
+
+
+def test_snapshot_objects(tmp_path):
+    path = str(tmp_path / "snapshot.db")
+    with Snapshot(path) as snapshot:
+        assert snapshot.store_objects("hosts", iter(HOSTS)) == 2
+        assert snapshot.store_objects("networks", NETWORKS) == 1
+
+    # The database is kept on disk
+    with Snapshot(path) as snapshot:
+        assert snapshot.get("h1")["ipv4-address"] == "192.0.2.1"
+        assert snapshot.get("unknown") is None
+        assert [o["uid"] for o in snapshot.find("host2")] == ["h2"]
+        assert snapshot.find("host2", table="networks") == []
+        assert sorted(o["uid"] for o in snapshot.find_by_address("192.0.2.1")) == [
+            "h1",
+            "n1",
+        ]
+        assert [o["uid"] for o in snapshot.find_by_address("2001:db8::1")] == ["h2"]
+        assert sorted(o["uid"] for o in snapshot.find_by_tag("production")) == [
+            "h1",
+            "n1",
+        ]
+        assert [o["name"] for o in snapshot.objects("hosts")] == ["host1", "host2"]
+        assert (
+            snapshot.query("SELECT name FROM hosts WHERE last_modify_time > ?", [0])[0][
+                "name"
+            ]
+            == "host1"
+        )
+
+        # An object stored again replaces the previous one, with its tags and addresses
+        snapshot.store_objects(
+            "hosts", [{"uid": "h1", "name": "host1", "ipv4-address": "192.0.2.2"}]
+        )
+        assert [o["uid"] for o in snapshot.find_by_tag("production")] == ["n1"]
+        assert [o["uid"] for o in snapshot.find_by_address("192.0.2.1")] == ["n1"]
+
+        assert snapshot.delete_objects(["n1", "unknown"]) == 1
+        assert snapshot.find_by_address("192.0.2.1") == []
+
+        with pytest.raises(ValueError):
+            snapshot.store_objects("hosts; DROP TABLE hosts", HOSTS)
+
+
+def test_snapshot_rulebase():
+    rulebase = {
+        "rulebase": [
+            {"uid": "r1", "type": "access-rule", "rule-number": 1},
+            {
+                "uid": "s1",
+                "name": "Section",
+                "type": "access-section",
+                "rulebase": [
+                    {"uid": "r2", "type": "access-rule", "rule-number": 2},
+                    {"uid": "r3", "type": "access-rule", "rule-number": 3},
+                ],
+            },
+        ],
+        "objects-dictionary": [
+            {"uid": "a1", "name": "Accept", "type": "RulebaseAction"}
+        ],
+    }
+    with Snapshot() as snapshot:
+        assert snapshot.store_rulebase({"uid": "l1", "name": "Network"}, rulebase) == 3
+        assert [r["uid"] for r in snapshot.rules("Network")] == ["r1", "r2", "r3"]
+        assert snapshot.query("SELECT section FROM rules WHERE uid = 'r3'")[0][0] == (
+            "Section"
+        )
+        assert snapshot.get("a1")["name"] == "Accept"
+
+        # The rules of a layer stored again are replaced
+        assert snapshot.store_rulebase({"uid": "l1", "name": "Network"}, {}) == 0
+        assert snapshot.rules("l1") == []
+        assert [layer["name"] for layer in snapshot.layers("access")] == ["Network"]
+        assert snapshot.layers("nat") == []
+
+
+def rulebase_callback(request):
+    payload = json.loads(request.body)
+    return (
+        200,
+        {},
+        json.dumps(
+            {
+                "uid": payload.get("uid", payload.get("package")),
+                "from": 1,
+                "to": 1,
+                "total": 1,
+                "rulebase": [{"uid": "rule_" + str(payload), "rule-number": 1}],
+            }
+        ),
+    )
+
+
+@responses.activate
+def test_snapshot_export(management, paged_response, resp_session):
+    responses.add(
+        responses.POST,
+        url="https://127.0.0.1:443/web_api/v1.5/show-last-published-session",
+        json=resp_session,
+        status=200,
+    )
+    for command, key, total in [
+        ("show-hosts", "objects", 7),
+        ("show-networks", "objects", 3),
+        ("show-access-layers", "access-layers", 2),
+        ("show-packages", "packages", 1),
+    ]:
+        responses.add_callback(
+            responses.POST,
+            url="https://127.0.0.1:443/web_api/v1.5/" + command,
+            callback=paged_response(key, total),
+            content_type="application/json",
+        )
+    for command in ["show-access-rulebase", "show-nat-rulebase"]:
+        responses.add_callback(
+            responses.POST,
+            url="https://127.0.0.1:443/web_api/v1.5/" + command,
+            callback=rulebase_callback,
+            content_type="application/json",
+        )
+
+    with Snapshot() as snapshot:
+        counts = snapshot.export(
+            management, object_types=["hosts", "networks"], limit=3
+        )
+
+        assert counts == {"hosts": 7, "networks": 3, "rules": 2}
+        assert len(list(snapshot.objects("hosts"))) == 7
+        assert [layer["uid"] for layer in snapshot.layers()] == ["0", "1"]
+        assert len(snapshot.rules("object_1")) == 1
+        assert snapshot.get_meta("exported-at") is not None
+        assert (
+            snapshot.get_meta("last-published-session") == resp_session["uid"] + "@None"
+        )
+
+    requests = [json.loads(c.request.body) for c in responses.calls]
+    assert {"offset": 6, "limit": 3, "details-level": "full"} in requests
+
+
+class Server:
+    """Hosts of a management server, changed by published sessions like show-changes reports them"""
+
+    def __init__(self):
+        self.hosts = {}
+        self.sessions = []
+        self.pending = {}
+
+    def host(self, uid: str, modified: int) -> dict:
+        return {
+            "uid": uid,
+            "name": "host_" + uid,
+            "type": "host",
+            "ipv4-address": "192.0.2." + uid,
+            "meta-info": {"last-modify-time": {"posix": modified}},
+        }
+
+    def edit(self, session: str, uid: str, modified: int):
+        """Changes a host in a session which is not published yet"""
+        self.pending.setdefault(session, []).append(self.host(uid, modified))
+
+    def publish(self, session: str, deleted=()):
+        operations = {
+            "added-objects": [],
+            "modified-objects": [],
+            "deleted-objects": [],
+        }
+        for host in self.pending.pop(session, []):
+            if host["uid"] in self.hosts:
+                operations["modified-objects"].append(
+                    {"old-object": self.hosts[host["uid"]], "new-object": host}
+                )
+            else:
+                operations["added-objects"].append(host)
+            self.hosts[host["uid"]] = host
+        for uid in deleted:
+            operations["deleted-objects"].append(self.hosts.pop(uid))
+        self.sessions.append((session, operations))
+
+    def show_hosts(self, request):
+        payload = json.loads(request.body)
+        hosts = sorted(self.hosts.values(), key=lambda h: h["name"])
+        page = hosts[payload["offset"] : payload["offset"] + payload["limit"]]
+        body = {"from": payload["offset"] + 1, "total": len(hosts), "objects": page}
+        return (200, {}, json.dumps(body))
+
+    def show_host(self, request):
+        uid = json.loads(request.body)["uid"]
+        if uid not in self.hosts:
+            return (404, {}, json.dumps({"code": "generic_err_object_not_found"}))
+        return (200, {}, json.dumps(self.hosts[uid]))
+
+    def show_last_published_session(self, request):
+        body = {
+            "uid": self.sessions[-1][0],
+            "publish-time": {"posix": len(self.sessions)},
+        }
+        return (200, {}, json.dumps(body))
+
+    def show_changes(self, request):
+        payload = json.loads(request.body)
+        uids = [uid for uid, _ in self.sessions]
+        first = uids.index(payload["from-session"]) + 1
+        last = uids.index(payload["to-session"]) + 1
+        changes = [{"operations": o} for _, o in self.sessions[first:last]]
+        offset, limit = payload["offset"], payload["limit"]
+        self.details = {
+            "from": offset + 1,
+            "to": min(offset + limit, len(changes)),
+            "total": len(changes),
+            "changes": changes[offset : offset + limit],
+        }
+        return (200, {}, json.dumps({"task-id": "task"}))
+
+    def show_task(self, request):
+        task = {
+            "task-id": "task",
+            "status": "succeeded",
+            "task-details": [self.details],
+        }
+        return (200, {}, json.dumps({"tasks": [task]}))
+
+
+@responses.activate
+def test_snapshot_sync(management):
+    server = Server()
+    for command, callback in [
+        ("show-hosts", server.show_hosts),
+        ("show-host", server.show_host),
+        ("show-last-published-session", server.show_last_published_session),
+        ("show-changes", server.show_changes),
+        ("show-task", server.show_task),
+    ]:
+        responses.add_callback(
+            responses.POST,
+            url="https://127.0.0.1:443/web_api/v1.5/" + command,
+            callback=callback,
+            content_type="application/json",
+        )
+    for uid in range(1, 11):
+        server.edit("s0", str(uid), modified=uid)
+    server.publish("s0")
+
+    def calls(command: str) -> list:
+        return [
+            json.loads(c.request.body)
+            for c in responses.calls
+            if c.request.url.endswith("/" + command)
+        ]
+
+    with Snapshot() as snapshot:
+        # First sync: everything is exported
+        result = snapshot.sync(
+            management, object_types=["hosts"], rulebases=False, limit=4
+        )
+        assert result == {
+            "changed": True,
+            "updated": {"hosts": 10},
+            "deleted": {},
+            "rules": 0,
+        }
+
+        # Nothing published: a single request
+        responses.calls.reset()
+        result = snapshot.sync(
+            management, object_types=["hosts"], rulebases=False, limit=4
+        )
+        assert result.changed is False
+        assert len(responses.calls) == 1
+
+        # A host modified, a host deleted: only the modified host is requested
+        server.edit("s1", "3", modified=11)
+        server.publish("s1", deleted=["5"])
+        responses.calls.reset()
+        result = snapshot.sync(
+            management, object_types=["hosts"], rulebases=False, limit=4
+        )
+
+        assert result == {
+            "changed": True,
+            "updated": {"hosts": 1},
+            "deleted": {"hosts": 1},
+            "rules": 0,
+        }
+        assert snapshot.get("5") is None
+        assert (
+            snapshot.query("SELECT last_modify_time FROM hosts WHERE uid = '3'")[0][0]
+            == 11
+        )
+        assert calls("show-hosts") == []
+        assert calls("show-changes") == [
+            {"from-session": "s0", "to-session": "s1", "offset": 0, "limit": 4}
+        ]
+        assert calls("show-host") == [{"uid": "3", "details-level": "full"}]
+
+        # Modified early in a session published late: older than the hosts already synced
+        server.edit("s2", "4", modified=12)
+        server.edit("s3", "6", modified=20)
+        server.publish("s3")
+        snapshot.sync(management, object_types=["hosts"], rulebases=False)
+        server.publish("s2")
+        result = snapshot.sync(management, object_types=["hosts"], rulebases=False)
+
+        assert result.updated == {"hosts": 1}
+        assert snapshot.get("4")["meta-info"]["last-modify-time"]["posix"] == 12
+
+        # More sessions published than a page of changes: every page is requested
+        for session, uid in [("s6", "7"), ("s7", "8"), ("s8", "9")]:
+            server.edit(session, uid, modified=30)
+            server.publish(session)
+        responses.calls.reset()
+        result = snapshot.sync(
+            management, object_types=["hosts"], rulebases=False, limit=2
+        )
+        assert result.updated == {"hosts": 3}
+        assert [c["offset"] for c in calls("show-changes")] == [0, 2]
+
+        # Added then deleted before the sync: nothing to store
+        server.edit("s4", "11", modified=21)
+        server.publish("s4")
+        server.publish("s5", deleted=["11"])
+        result = snapshot.sync(management, object_types=["hosts"], rulebases=False)
+        assert result.updated == {} and result.deleted == {}
+        assert snapshot.get("11") is None
+
+        # Forced: every host is requested again
+        responses.calls.reset()
+        result = snapshot.sync(
+            management, object_types=["hosts"], rulebases=False, force=True
+        )
+        assert result.updated == {"hosts": 9}
+        assert calls("show-changes") == []
+
+        # No session recorded: every host is requested again instead of the changes
+        snapshot.set_meta(LAST_PUBLISHED_SESSION, "None@None")
+        server.publish("s9")
+        responses.calls.reset()
+        result = snapshot.sync(management, object_types=["hosts"], rulebases=False)
+        assert result.updated == {"hosts": 9}
+        assert calls("show-changes") == []
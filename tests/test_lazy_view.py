@@ -0,0 +1,50 @@
+import copy
+import json
+
+import pytest
+
+from pycheckpoint_api.lazy_view import LazyList, LazyView, attribute_name, wrap
+
+
+def test_attribute_name():
+
+    assert attribute_name("ipv4-address") == "ipv4_address"
+    assert attribute_name("objectsDictionary") == "objects_dictionary"
+    assert attribute_name("meta-info") == "meta_info"
+    assert attribute_name("uid") == "uid"
+
+
+def test_lazy_view():
+    data = {
+        "uid": "196e93a9-b90b-4ab1-baa6-124e7289aa20",
+        "ipv4-address": "192.0.2.1",
+        "metaInfo": {"lock": "unlocked"},
+        "groups": [{"name": "group1"}, "uid-only"],
+    }
+    view = wrap(data)
+
+    assert isinstance(view, LazyView)
+    assert view == data
+    assert view.uid == data["uid"]
+    assert view.ipv4_address == "192.0.2.1"
+
+    # Nested objects are only wrapped when accessed, then kept
+    assert type(dict.__getitem__(view, "metaInfo")) is dict
+    assert view.meta_info.lock == "unlocked"
+    assert view.meta_info is view["metaInfo"]
+    assert isinstance(view.groups, LazyList)
+    assert view.groups[0].name == "group1"
+    assert [g for g in view.groups][1] == "uid-only"
+    assert view.get("missing") is None
+
+    with pytest.raises(AttributeError):
+        view.missing
+
+    view.comments = "new"
+    view.ipv4_address = "192.0.2.2"
+    assert view["comments"] == "new"
+    assert view["ipv4-address"] == "192.0.2.2"
+
+    # It's still a dictionary
+    assert json.loads(json.dumps(view))["metaInfo"] == {"lock": "unlocked"}
+    assert copy.deepcopy(view) == view
@@ -0,0 +1,84 @@
+import pickle
+import sys
+
+import pytest
+
+from pycheckpoint_api.records import (
+    AddressRangeRecord,
+    GroupRecord,
+    HostRecord,
+    MetaInfo,
+    NetworkRecord,
+    ServiceTcpRecord,
+    ServiceUdpRecord,
+)
+
+
+def test_host_record():
+    data = {
+        "uid": "9423d36f-2d66-4754-b9e2-e7f4493756d4",
+        "name": "host1",
+        "type": "host",
+        "ipv4-address": "192.0.2.1",
+        "tags": [{"uid": "1", "name": "t1"}, "t2"],
+        "meta-info": {
+            "creator": "aa",
+            "last-modifier": "bb",
+            "creation-time": {"posix": 1},
+            "last-modify-time": {"posix": 2},
+        },
+        "comments": "not kept",
+    }
+    record = HostRecord.from_dict(data)
+
+    assert record.uid == data["uid"]
+    assert record.ipv4_address == "192.0.2.1"
+    assert record.ipv6_address is None
+    assert record.tags == ("t1", "t2")
+    assert record.meta_info == MetaInfo(
+        creator="aa", creation_time=1, last_modifier="bb", last_modify_time=2
+    )
+    assert record.to_dict()["meta_info"]["last_modify_time"] == 2
+    assert repr(record) == "HostRecord(uid='" + data["uid"] + "', name='host1')"
+
+    # Uids are interned
+    assert record.uid is sys.intern("9423d36f-2d66-4754-b9e2-e7f4493756d4")
+
+    # Records don't have a __dict__: no other attribute can be added
+    assert not hasattr(record, "__dict__")
+    with pytest.raises(AttributeError):
+        record.comments = "test"
+
+    assert record == HostRecord.from_dict(data)
+    assert record != NetworkRecord.from_dict(data)
+    assert len({record, HostRecord.from_dict(data)}) == 1
+    assert pickle.loads(pickle.dumps(record)) == record
+
+
+def test_records():
+    assert HostRecord.from_dict("196e93a9").uid == "196e93a9"
+    assert HostRecord.from_dict("196e93a9").tags == ()
+
+    network = NetworkRecord.from_dict(
+        {"uid": "1", "subnet4": "192.0.2.0", "mask-length4": 24}
+    )
+    assert (network.subnet4, network.mask_length4) == ("192.0.2.0", 24)
+
+    address_range = AddressRangeRecord.from_dict(
+        {
+            "uid": "2",
+            "ipv4-address-first": "192.0.2.1",
+            "ipv4-address-last": "192.0.2.9",
+        }
+    )
+    assert address_range.ipv4_address_last == "192.0.2.9"
+
+    group = GroupRecord.from_dict(
+        {"uid": "3", "members": [{"uid": "1", "name": "net"}, "2"]}
+    )
+    assert group.members == ("1", "2")
+
+    tcp = ServiceTcpRecord.from_dict({"uid": "4", "port": "443"})
+    udp = ServiceUdpRecord.from_dict({"uid": "4", "port": "443"})
+    assert tcp.port == udp.port == "443"
+    assert tcp != udp
@@ -1,9 +1,18 @@
+import logging
+from types import SimpleNamespace
 from typing import List, Union
 
 import pytest
 
 from pycheckpoint_api.management.exception import MandatoryFieldMissing, WrongType
-from pycheckpoint_api.utils import sanitize_secondary_parameters, sanitize_value
+from pycheckpoint_api.management.network_objects import NetworkObjects
+from pycheckpoint_api.management.network_objects.host import Host
+from pycheckpoint_api.utils import (
+    map_pages,
+    root_api,
+    sanitize_secondary_parameters,
+    sanitize_value,
+)
 
 
 def test_sanitize_value():
@@ -82,3 +91,26 @@ def test_sanitize_secondary_parameters():
     result = sanitize_secondary_parameters(d=d, **kw)
 
     assert result == {"field1-subname": "value1"}
+
+
+def test_map_pages():
+
+    # Sequential use case
+    result = list(map_pages(lambda offset: offset * 2, [1, 2, 3]))
+
+    assert result == [2, 4, 6]
+
+    # Concurrent use case, order must be kept
+    result = list(
+        map_pages(lambda offset: offset * 2, range(0, 100, 10), max_workers=4)
+    )
+
+    assert result == list(range(0, 200, 20))
+
+
+def test_root_api():
+
+    api = SimpleNamespace(_log=logging.getLogger(__name__))
+
+    assert root_api(Host(NetworkObjects(api))) is api
+    assert root_api(api) is api